@@ -33,6 +33,9 @@ from autoastro.galaxy.galaxy_model import GalaxyModel
 from autoastro.hyper import hyper_data
 
 from autolens import simulator
+from autolens.dataset.interferometer import (
+    MemoryMappedInterferometer as memory_mapped_interferometer,
+)
 from autolens import masked
 from autolens.lens.plane import Plane
 from autolens.lens.ray_tracing import Tracer
@@ -0,0 +1,134 @@
+import os
+
+import numpy as np
+
+from autoarray.dataset import interferometer
+from autoarray.structures import visibilities as vis
+
+chunk_size = 1048576
+
+
+class MemoryMappedInterferometer(interferometer.Interferometer):
+    def __init__(
+        self,
+        visibilities_path,
+        noise_map_path,
+        uv_wavelengths_path,
+        primary_beam=None,
+        mmap_mode="r",
+    ):
+        """An interferometer dataset whose visibilities, noise-map and uv wavelengths are memory-mapped from .npy \
+        files, as opposed to being loaded into memory.
+
+        Only the parts of the arrays which are used are read from disk (and can be released by the operating system \
+        when memory is needed), so datasets with many millions of visibilities can be fitted on machines with less \
+        memory than the dataset.
+
+        The dataset pickles as a reference to its files, so saving it to the output path of every phase (see \
+        *AbstractDataset.save*) or sending it to another process does not copy its visibilities.
+
+        Parameters
+        ----------
+        visibilities_path : str
+            The path of the .npy file of the (total_visibilities, 2) visibilities.
+        noise_map_path : str
+            The path of the .npy file of the (total_visibilities, 2) noise-map.
+        uv_wavelengths_path : str
+            The path of the .npy file of the (total_visibilities, 2) uv wavelengths.
+        primary_beam : aa.Kernel or None
+            The primary beam of the dataset, which is small and kept in memory.
+        mmap_mode : str
+            The mode the files are memory-mapped with (see *numpy.load*), which is read-only by default.
+        """
+
+        self.visibilities_path = os.path.abspath(visibilities_path)
+        self.noise_map_path = os.path.abspath(noise_map_path)
+        self.uv_wavelengths_path = os.path.abspath(uv_wavelengths_path)
+        self.mmap_mode = mmap_mode
+
+        super(MemoryMappedInterferometer, self).__init__(
+            visibilities=vis.Visibilities(
+                visibilities_1d=np.load(self.visibilities_path, mmap_mode=mmap_mode)
+            ),
+            noise_map=vis.Visibilities(
+                visibilities_1d=np.load(self.noise_map_path, mmap_mode=mmap_mode)
+            ),
+            uv_wavelengths=np.load(self.uv_wavelengths_path, mmap_mode=mmap_mode),
+            primary_beam=primary_beam,
+        )
+
+    @classmethod
+    def from_npy(cls, directory, primary_beam=None, mmap_mode="r"):
+        """Memory-map the visibilities.npy, noise_map.npy and uv_wavelengths.npy files of a directory (e.g. those \
+        output by *output_interferometer_to_npy*)."""
+        return cls(
+            visibilities_path=os.path.join(directory, "visibilities.npy"),
+            noise_map_path=os.path.join(directory, "noise_map.npy"),
+            uv_wavelengths_path=os.path.join(directory, "uv_wavelengths.npy"),
+            primary_beam=primary_beam,
+            mmap_mode=mmap_mode,
+        )
+
+    @classmethod
+    def from_interferometer_and_directory(cls, interferometer, directory):
+        """Output the visibilities, noise-map and uv wavelengths of an interferometer dataset (e.g. loaded from .fits \
+        files) to .npy files in a directory and return the dataset memory-mapped from them."""
+
+        output_interferometer_to_npy(interferometer=interferometer, directory=directory)
+
+        return cls.from_npy(
+            directory=directory, primary_beam=interferometer.primary_beam
+        )
+
+    def __getstate__(self):
+        return {
+            "visibilities_path": self.visibilities_path,
+            "noise_map_path": self.noise_map_path,
+            "uv_wavelengths_path": self.uv_wavelengths_path,
+            "primary_beam": self.primary_beam,
+            "mmap_mode": self.mmap_mode,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+def output_interferometer_to_npy(interferometer, directory):
+    """Output the visibilities, noise-map and uv wavelengths of an interferometer dataset to the files \
+    visibilities.npy, noise_map.npy and uv_wavelengths.npy of a directory.
+
+    The arrays are written in chunks of *chunk_size* visibilities, so a dataset which is itself memory-mapped is \
+    streamed to disk instead of being read into memory.
+
+    Parameters
+    ----------
+    interferometer : aa.Interferometer
+        The interferometer dataset which is output.
+    directory : str
+        The directory the .npy files are output to, which is created if it does not exist.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+
+    for name, array in [
+        ("visibilities", interferometer.visibilities),
+        ("noise_map", interferometer.noise_map),
+        ("uv_wavelengths", interferometer.uv_wavelengths),
+    ]:
+
+        array = np.asarray(array)
+
+        output_array = np.lib.format.open_memmap(
+            os.path.join(directory, "{}.npy".format(name)),
+            mode="w+",
+            dtype="float",
+            shape=array.shape,
+        )
+
+        for chunk_start in range(0, array.shape[0], chunk_size):
+            chunk = slice(chunk_start, chunk_start + chunk_size)
+            output_array[chunk] = array[chunk]
+
+        output_array.flush()
+
+        del output_array
@@ -3,6 +3,9 @@ import numpy as np
 from autoarray.fit import fit as aa_fit
 from autoastro.galaxy import galaxy as g
 from autolens.masked import masked_dataset as md
+from autolens.util import lens_util
+
+fit_chunk_size = 1048576
 
 
 def fit(masked_dataset, tracer, hyper_image_sky=None, hyper_background_noise=None):
@@ -40,6 +43,8 @@ class ImagingFit(aa_fit.ImagingFit):
         self.masked_dataset = masked_imaging
         self.tracer = tracer
 
+        self._model_images_of_planes = None
+
         image = hyper_image_from_image_and_hyper_image_sky(
             image=masked_imaging.image, hyper_image_sky=hyper_image_sky
         )
@@ -56,8 +61,6 @@ class ImagingFit(aa_fit.ImagingFit):
             blurring_grid=masked_imaging.blurring_grid,
         )
 
-        self.profile_subtracted_image = image - self.blurred_profile_image
-
         if not tracer.has_pixelization:
 
             inversion = None
@@ -67,11 +70,12 @@ class ImagingFit(aa_fit.ImagingFit):
 
             inversion = tracer.inversion_imaging_from_grid_and_data(
                 grid=masked_imaging.grid,
-                image=self.profile_subtracted_image,
+                image=image - self.blurred_profile_image,
                 noise_map=noise_map,
                 convolver=masked_imaging.convolver,
                 inversion_uses_border=masked_imaging.inversion_uses_border,
                 preload_sparse_grids_of_planes=masked_imaging.preload_sparse_grids_of_planes,
+                inversion_uses_sparse_matrices=masked_imaging.inversion_uses_sparse_matrices,
             )
 
             model_image = (
@@ -90,6 +94,28 @@ class ImagingFit(aa_fit.ImagingFit):
     def grid(self):
         return self.masked_imaging.grid
 
+    @property
+    def profile_subtracted_image(self):
+        """The image minus the blurred profile image, which is the image the inversion reconstructs.
+
+        This is only required by the likelihood if the tracer has a pixelization, in which case it is computed when \
+        the inversion is performed. Otherwise it is only used for visualization, so it is computed on request."""
+        return self.image - self.blurred_profile_image
+
+    @property
+    def chi_squared(self):
+        """The chi-squared of the fit, computed directly from the 1D image, model image and noise-map.
+
+        The residual, normalized residual and chi-squared maps are not created, as they are only required for \
+        visualization and are computed from their properties on request."""
+        return chi_squared_from_data_model_data_and_noise_map(
+            data=self.image, model_data=self.model_image, noise_map=self.noise_map
+        )
+
+    @property
+    def noise_normalization(self):
+        return noise_normalization_from_noise_map(noise_map=self.noise_map)
+
     @property
     def galaxy_model_image_dict(self) -> {g.Galaxy: np.ndarray}:
         """
@@ -117,6 +143,14 @@ class ImagingFit(aa_fit.ImagingFit):
 
     @property
     def model_images_of_planes(self):
+        """The model image of every plane, which are only used for visualization and results.
+
+        The likelihood only requires the model image of all planes summed, which is blurred in a single convolution \
+        when the fit is created. The model images of the individual planes are therefore only computed the first \
+        time they are requested, and stored for every subsequent request."""
+
+        if self._model_images_of_planes is not None:
+            return self._model_images_of_planes
 
         model_images_of_planes = self.tracer.blurred_profile_images_of_planes_from_grid_and_psf(
             grid=self.grid,
@@ -130,6 +164,8 @@ class ImagingFit(aa_fit.ImagingFit):
                 plane_index
             ] += self.inversion.mapped_reconstructed_image
 
+        self._model_images_of_planes = model_images_of_planes
+
         return model_images_of_planes
 
     @property
@@ -201,6 +237,7 @@ class InterferometerFit(aa_fit.InterferometerFit):
                 transformer=masked_interferometer.transformer,
                 inversion_uses_border=masked_interferometer.inversion_uses_border,
                 preload_sparse_grids_of_planes=masked_interferometer.preload_sparse_grids_of_planes,
+                curvature_kernel=masked_interferometer.curvature_kernel,
             )
 
             model_visibilities = (
@@ -219,6 +256,18 @@ class InterferometerFit(aa_fit.InterferometerFit):
     def grid(self):
         return self.masked_interferometer.grid
 
+    @property
+    def chi_squared(self):
+        return chi_squared_from_data_model_data_and_noise_map(
+            data=self.visibilities,
+            model_data=self.model_visibilities,
+            noise_map=self.noise_map,
+        )
+
+    @property
+    def noise_normalization(self):
+        return noise_normalization_from_noise_map(noise_map=self.noise_map)
+
     @property
     def galaxy_model_image_dict(self) -> {g.Galaxy: np.ndarray}:
         """
@@ -303,29 +352,32 @@ class PositionsFit:
             The noise-value assumed when computing the likelihood.
         """
         self.positions = positions
-        self.source_plane_positions = tracer.traced_grids_of_planes_from_grid(
-            grid=positions
-        )[-1]
         self.noise_map = noise_map
 
-    def maximum_separation_within_threshold(self, threshold):
-        return max(self.maximum_separations) <= threshold
+        self.source_plane_positions_1d = tracer.traced_grids_of_planes_from_grid(
+            grid=positions.in_1d
+        )[-1]
+
+        self.maximum_separations = lens_util.maximum_separations_from_grid_1d_and_group_sizes(
+            grid_1d=np.asarray(self.source_plane_positions_1d),
+            group_sizes=np.array([len(position_list) for position_list in positions]),
+        )
 
     @property
-    def maximum_separations(self):
-        return [
-            self.max_separation_of_grid(grid=position_list)
-            for position_list in self.source_plane_positions.list_in_1d
-        ]
+    def source_plane_positions(self):
+        return self.positions.from_1d_coordinates(
+            coordinates_1d=np.asarray(self.source_plane_positions_1d)
+        )
+
+    def maximum_separation_within_threshold(self, threshold):
+        return np.max(self.maximum_separations) <= threshold
 
     @staticmethod
     def max_separation_of_grid(grid):
-        rdist_max = np.zeros((grid.sub_shape_1d))
-        for i in range(grid.sub_shape_1d):
-            xdists = np.square(np.subtract(grid[i, 0], grid[:, 0]))
-            ydists = np.square(np.subtract(grid[i, 1], grid[:, 1]))
-            rdist_max[i] = np.max(np.add(xdists, ydists))
-        return np.max(np.sqrt(rdist_max))
+        grid = np.asarray(grid)
+        return np.sqrt(
+            np.max(np.sum(np.square(grid[:, None, :] - grid[None, :, :]), axis=2))
+        )
 
     @property
     def chi_squared_map(self):
@@ -359,3 +411,114 @@ def hyper_noise_map_from_noise_map_tracer_and_hyper_backkground_noise(
         noise_map = noise_map + hyper_noise_map
 
     return noise_map
+
+
+def chi_squared_from_data_model_data_and_noise_map(data, model_data, noise_map):
+    """Compute the chi-squared of a fit from its 1D data, model data and noise-map in a single fused reduction.
+
+    This performs the same operations as computing the residual map, chi-squared map and their sum (see \
+    *fit_util*), but on one temporary array which every operation is performed on in place, instead of creating a \
+    residual map and chi-squared map.
+
+    Data with more than *fit_chunk_size* entries (e.g. memory-mapped visibilities) are reduced in chunks, so the \
+    temporary array never exceeds the chunk size and the data is streamed from disk.
+
+    Parameters
+    -----------
+    data : ndarray
+        The 1D data that is fitted.
+    model_data : ndarray
+        The 1D model data the data is fitted with.
+    noise_map : ndarray
+        The 1D noise-map of the data.
+    """
+    data = np.asarray(data)
+    model_data = np.asarray(model_data)
+    noise_map = np.asarray(noise_map)
+
+    if data.shape[0] > fit_chunk_size:
+        return sum(
+            chi_squared_from_data_model_data_and_noise_map(
+                data=data[chunk_start : chunk_start + fit_chunk_size],
+                model_data=model_data[chunk_start : chunk_start + fit_chunk_size],
+                noise_map=noise_map[chunk_start : chunk_start + fit_chunk_size],
+            )
+            for chunk_start in range(0, data.shape[0], fit_chunk_size)
+        )
+
+    chi_squared_map = np.subtract(data, model_data)
+    np.divide(chi_squared_map, noise_map, out=chi_squared_map)
+    np.square(chi_squared_map, out=chi_squared_map)
+    return np.sum(chi_squared_map)
+
+
+def noise_normalization_from_noise_map(noise_map):
+    """Compute the noise normalization of a fit, sum(ln(2 pi noise^2)), from its 1D noise-map using one temporary \
+    array which every operation is performed on in place, in chunks of at most *fit_chunk_size* entries.
+
+    Parameters
+    -----------
+    noise_map : ndarray
+        The 1D noise-map of the data.
+    """
+    noise_map = np.asarray(noise_map)
+
+    if noise_map.shape[0] > fit_chunk_size:
+        return sum(
+            noise_normalization_from_noise_map(
+                noise_map=noise_map[chunk_start : chunk_start + fit_chunk_size]
+            )
+            for chunk_start in range(0, noise_map.shape[0], fit_chunk_size)
+        )
+
+    noise_normalization_map = np.square(noise_map)
+    np.multiply(noise_normalization_map, 2 * np.pi, out=noise_normalization_map)
+    np.log(noise_normalization_map, out=noise_normalization_map)
+    return np.sum(noise_normalization_map)
+
+
+def array_stack_from_arrays(arrays):
+    """Stack the 1D arrays of a batch of fits into a 2D array of shape (total_fits, pixels).
+
+    If every fit uses the same array (e.g. the noise-map of a masked imaging without hyper noise) that array is \
+    returned in 1D, which numpy broadcasts over the batch without copying it once per fit.
+
+    Parameters
+    -----------
+    arrays : [ndarray]
+        The 1D array of every fit.
+    """
+    if all(array is arrays[0] for array in arrays):
+        return np.asarray(arrays[0])
+
+    return np.stack([np.asarray(array) for array in arrays])
+
+
+def likelihoods_from_data_model_data_and_noise_map_stacks(data, model_data, noise_map):
+    """Compute the likelihoods, -0.5 * (chi_squared + noise_normalization), of a batch of fits without an inversion \
+    in one reduction over the batch.
+
+    Every input is either a 2D stack of shape (total_fits, pixels) or a 1D array shared by every fit (see \
+    *array_stack_from_arrays*). The chi-squared maps of the batch are computed in one temporary array which every \
+    operation is performed on in place, and the noise normalization of a shared noise-map is computed once.
+
+    Parameters
+    -----------
+    data : ndarray
+        The data that is fitted.
+    model_data : ndarray
+        The model data of every fit.
+    noise_map : ndarray
+        The noise-map of the data.
+    """
+    chi_squared_map = np.subtract(data, model_data)
+    np.divide(chi_squared_map, noise_map, out=chi_squared_map)
+    np.square(chi_squared_map, out=chi_squared_map)
+
+    noise_normalization_map = np.square(noise_map)
+    np.multiply(noise_normalization_map, 2 * np.pi, out=noise_normalization_map)
+    np.log(noise_normalization_map, out=noise_normalization_map)
+
+    return -0.5 * (
+        np.sum(chi_squared_map, axis=-1) + np.sum(noise_normalization_map, axis=-1)
+    )
@@ -0,0 +1,254 @@
+import numpy as np
+import scipy.linalg
+
+from autoarray import exc as aa_exc
+from autoarray.operators.inversion import inversions as inv
+from autoarray.operators.inversion import mappers
+from autoarray.operators.inversion import regularization as reg
+from autoarray.util import inversion_util
+
+regularization_diagonal_term = 1.0e-8
+
+
+class CholeskyInversionImaging(inv.InversionImaging):
+    def __init__(
+        self,
+        image,
+        noise_map,
+        mapper,
+        regularization,
+        blurred_mapping_matrix,
+        regularization_matrix,
+        curvature_reg_matrix,
+        reconstruction,
+        log_det_curvature_reg_matrix_term,
+        log_det_regularization_matrix_term,
+    ):
+        """An inversion of imaging data whose reconstruction and log determinants are computed from one Cholesky \
+        factorization of the curvature_reg_matrix, instead of an LU solve followed by a second (Cholesky) \
+        factorization for the log determinant (see *inv.InversionImaging*).
+
+        The log determinants are computed when the inversion is performed and stored, so they are not recomputed \
+        every time the evidence is evaluated.
+
+        Parameters
+        -----------
+        log_det_curvature_reg_matrix_term : float
+            The log determinant of the curvature_reg_matrix, ln[det(F + H)].
+        log_det_regularization_matrix_term : float
+            The log determinant of the regularization matrix, ln[det(H)].
+        """
+
+        super(CholeskyInversionImaging, self).__init__(
+            image=image,
+            noise_map=noise_map,
+            mapper=mapper,
+            regularization=regularization,
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=reconstruction,
+        )
+
+        self._log_det_curvature_reg_matrix_term = log_det_curvature_reg_matrix_term
+        self._log_det_regularization_matrix_term = log_det_regularization_matrix_term
+
+    @classmethod
+    def from_blurred_mapping_matrix_and_data(
+        cls, image, noise_map, mapper, regularization, blurred_mapping_matrix
+    ):
+        """Perform an inversion of imaging data for a mapper whose blurred mapping matrix is already computed, \
+        following *inv.InversionImaging.from_data_mapper_and_regularization*.
+
+        Parameters
+        ----------
+        image : aa.Array
+            The image which is reconstructed.
+        noise_map : aa.Array
+            The noise-map of the image.
+        mapper : aa.Mapper
+            The mapper of the pixelization the image is reconstructed on.
+        regularization : aa.Regularization
+            The regularization of the reconstruction.
+        blurred_mapping_matrix : ndarray
+            The mapper's mapping matrix blurred with the PSF.
+        """
+
+        data_vector = inversion_util.data_vector_from_blurred_mapping_matrix_and_data(
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            image=image,
+            noise_map=noise_map,
+        )
+
+        curvature_matrix = inversion_util.curvature_matrix_from_blurred_mapping_matrix(
+            blurred_mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+        )
+
+        return cls.from_data_vector_and_curvature_matrix(
+            image=image,
+            noise_map=noise_map,
+            mapper=mapper,
+            regularization=regularization,
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            data_vector=data_vector,
+            curvature_matrix=curvature_matrix,
+        )
+
+    @classmethod
+    def from_data_vector_and_curvature_matrix(
+        cls,
+        image,
+        noise_map,
+        mapper,
+        regularization,
+        blurred_mapping_matrix,
+        data_vector,
+        curvature_matrix,
+    ):
+        """Perform an inversion given its data vector D and curvature matrix F, by Cholesky factorizing the \
+        curvature_reg_matrix F + H once and using the factor both to solve for the reconstruction and to compute \
+        ln[det(F + H)].
+
+        The regularization matrix H and ln[det(H)] are computed using \
+        *regularization_matrix_and_log_det_from_mapper_and_regularization*, which for constant regularization of a \
+        rectangular pixelization does not factorize H at all.
+
+        Parameters
+        ----------
+        data_vector : ndarray
+            The data vector D of the inversion.
+        curvature_matrix : ndarray
+            The curvature matrix F of the inversion.
+        """
+
+        regularization_matrix, log_det_regularization_matrix_term = regularization_matrix_and_log_det_from_mapper_and_regularization(
+            mapper=mapper, regularization=regularization
+        )
+
+        curvature_reg_matrix = np.add(curvature_matrix, regularization_matrix)
+
+        reconstruction, log_det_curvature_reg_matrix_term = reconstruction_and_log_det_from_curvature_reg_matrix_and_data_vector(
+            curvature_reg_matrix=curvature_reg_matrix, data_vector=data_vector
+        )
+
+        return cls(
+            image=image,
+            noise_map=noise_map,
+            mapper=mapper,
+            regularization=regularization,
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=reconstruction,
+            log_det_curvature_reg_matrix_term=log_det_curvature_reg_matrix_term,
+            log_det_regularization_matrix_term=log_det_regularization_matrix_term,
+        )
+
+    @property
+    def log_det_curvature_reg_matrix_term(self):
+        return self._log_det_curvature_reg_matrix_term
+
+    @property
+    def log_det_regularization_matrix_term(self):
+        return self._log_det_regularization_matrix_term
+
+
+def reconstruction_and_log_det_from_curvature_reg_matrix_and_data_vector(
+    curvature_reg_matrix, data_vector
+):
+    """Solve for the reconstruction of an inversion and compute ln[det(F + H)] using one Cholesky factorization of \
+    its curvature_reg_matrix F + H.
+
+    Parameters
+    ----------
+    curvature_reg_matrix : ndarray
+        The curvature_reg_matrix F + H of the inversion.
+    data_vector : ndarray
+        The data vector D of the inversion.
+    """
+
+    try:
+        cholesky_factor = scipy.linalg.cho_factor(
+            curvature_reg_matrix, lower=True, check_finite=False
+        )
+    except np.linalg.LinAlgError:
+        raise aa_exc.InversionException()
+
+    return (
+        scipy.linalg.cho_solve(cholesky_factor, data_vector, check_finite=False),
+        2.0 * np.sum(np.log(np.diag(cholesky_factor[0]))),
+    )
+
+
+def regularization_matrix_and_log_det_from_mapper_and_regularization(
+    mapper, regularization
+):
+    """Compute the regularization matrix H of a mapper and its log determinant ln[det(H)].
+
+    For constant regularization of a rectangular pixelization H = lambda^2 L + 1e-8 I, where L is the graph \
+    Laplacian of the rectangular grid's pixel neighbors. Its neighbor structure only depends on the grid's shape, \
+    so the eigenvalues l_i of L are known analytically (see *laplacian_eigenvalues_from_rectangular_shape*) and \
+    ln[det(H)] = sum_i ln(lambda^2 l_i + 1e-8) is an O(pixels) sum instead of an O(pixels^3) factorization.
+
+    For every other pixelization (e.g. a Voronoi pixelization, whose pixel neighbors change with the mass model and \
+    pixelization of every fit) and regularization scheme the log determinant is computed via a Cholesky \
+    factorization of H.
+
+    Parameters
+    ----------
+    mapper : aa.Mapper
+        The mapper of the pixelization the image is reconstructed on.
+    regularization : aa.Regularization
+        The regularization of the reconstruction.
+    """
+
+    regularization_matrix = regularization.regularization_matrix_from_mapper(
+        mapper=mapper
+    )
+
+    if isinstance(regularization, reg.Constant) and isinstance(
+        mapper, mappers.MapperRectangular
+    ):
+
+        laplacian_eigenvalues = laplacian_eigenvalues_from_rectangular_shape(
+            shape_2d=mapper.shape_2d
+        )
+
+        return (
+            regularization_matrix,
+            np.sum(
+                np.log(
+                    regularization.coefficient ** 2.0 * laplacian_eigenvalues
+                    + regularization_diagonal_term
+                )
+            ),
+        )
+
+    return (
+        regularization_matrix,
+        inv.Inversion.log_determinant_of_matrix_cholesky(regularization_matrix),
+    )
+
+
+def laplacian_eigenvalues_from_rectangular_shape(shape_2d):
+    """Compute the eigenvalues of the graph Laplacian of a rectangular pixelization's pixel neighbors, which is the \
+    constant regularization matrix with a coefficient of 1 and without its 1e-8 diagonal term.
+
+    Every pixel of a rectangular grid neighbors the pixels above, below, left and right of it, so its Laplacian is \
+    the Cartesian product of the Laplacians of a path of shape_2d[0] and of shape_2d[1] pixels. Its eigenvalues are \
+    therefore 4 sin^2(pi j / 2 shape_2d[0]) + 4 sin^2(pi k / 2 shape_2d[1]) for every pair (j, k).
+
+    Parameters
+    ----------
+    shape_2d : (int, int)
+        The dimensions of the rectangular grid of pixels (y_pixels, x_pixels).
+    """
+
+    y_eigenvalues = 4.0 * np.square(
+        np.sin(np.pi * np.arange(shape_2d[0]) / (2.0 * shape_2d[0]))
+    )
+    x_eigenvalues = 4.0 * np.square(
+        np.sin(np.pi * np.arange(shape_2d[1]) / (2.0 * shape_2d[1]))
+    )
+
+    return np.add.outer(y_eigenvalues, x_eigenvalues).ravel()
@@ -0,0 +1,347 @@
+import numpy as np
+import scipy.fft
+
+from autoarray.operators.inversion import inversions as inv
+from autolens import exc
+from autolens.lens import cholesky_inversion
+from autolens.masked import nufft_transformer
+
+curvature_matrix_chunk_size = 64
+
+
+class LinearOperatorInversionInterferometer(inv.InversionInterferometer):
+    def __init__(
+        self,
+        visibilities,
+        noise_map,
+        transformer,
+        mapper,
+        regularization,
+        regularization_matrix,
+        curvature_reg_matrix,
+        reconstruction,
+        log_det_curvature_reg_matrix_term,
+        log_det_regularization_matrix_term,
+    ):
+        """An inversion of interferometer data which never forms the transformed mapping matrices (of dimensions \
+        visibilities x pixelization pixels) of an *InversionInterferometer*.
+
+        The curvature matrix is computed in image space from the mapping matrix and the *CurvatureKernel* of the \
+        uv coverage, and the data vector from the dirty image of the visibilities. The model visibilities of the \
+        reconstruction are computed by transforming the mapped reconstructed image.
+
+        Parameters
+        -----------
+        transformer : aa.Transformer
+            The transformer which computes the visibilities of the mapped reconstructed image.
+        log_det_curvature_reg_matrix_term : float
+            The log determinant of the curvature_reg_matrix.
+        log_det_regularization_matrix_term : float
+            The log determinant of the regularization matrix.
+        """
+
+        super(LinearOperatorInversionInterferometer, self).__init__(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            mapper=mapper,
+            regularization=regularization,
+            transformed_mapping_matrices=None,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=reconstruction,
+        )
+
+        self.transformer = transformer
+
+        self._log_det_curvature_reg_matrix_term = log_det_curvature_reg_matrix_term
+        self._log_det_regularization_matrix_term = log_det_regularization_matrix_term
+
+    @classmethod
+    def from_data_mapper_and_regularization(
+        cls,
+        visibilities,
+        noise_map,
+        transformer,
+        mapper,
+        regularization,
+        curvature_kernel,
+    ):
+        """Perform an inversion of interferometer data using the curvature kernel of its uv coverage.
+
+        The curvature matrix F = M^T K M is computed by convolving every column of the mapping matrix M with the \
+        curvature kernel K, whose cost depends on the number of image and pixelization pixels but not on the number \
+        of visibilities. As in *InversionInterferometer*, the real and imaginary visibilities are each regularized, \
+        such that the curvature_reg_matrix is F + 2H.
+
+        Parameters
+        ----------
+        visibilities : aa.Visibilities
+            The visibilities which are reconstructed.
+        noise_map : aa.Visibilities
+            The noise-map of the visibilities.
+        transformer : aa.Transformer
+            The transformer which computes the visibilities of the mapped reconstructed image.
+        mapper : aa.Mapper
+            The mapper of the pixelization the image is reconstructed on.
+        regularization : aa.Regularization
+            The regularization of the reconstruction.
+        curvature_kernel : CurvatureKernel
+            The curvature kernel of the uv coverage of the visibilities.
+        """
+
+        curvature_kernel = curvature_kernel.curvature_kernel_from_noise_map(
+            noise_map=noise_map
+        )
+
+        mapping_matrix = np.asarray(mapper.mapping_matrix)
+
+        data_vector = np.matmul(
+            mapping_matrix.T,
+            curvature_kernel.dirty_image_from_visibilities(visibilities=visibilities),
+        )
+
+        curvature_matrix = curvature_kernel.curvature_matrix_from_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )
+
+        regularization_matrix, log_det_regularization_matrix_term = cholesky_inversion.regularization_matrix_and_log_det_from_mapper_and_regularization(
+            mapper=mapper, regularization=regularization
+        )
+
+        curvature_reg_matrix = curvature_matrix + 2.0 * regularization_matrix
+
+        reconstruction, log_det_curvature_reg_matrix_term = cholesky_inversion.reconstruction_and_log_det_from_curvature_reg_matrix_and_data_vector(
+            curvature_reg_matrix=curvature_reg_matrix, data_vector=data_vector
+        )
+
+        return cls(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            transformer=transformer,
+            mapper=mapper,
+            regularization=regularization,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=reconstruction,
+            log_det_curvature_reg_matrix_term=log_det_curvature_reg_matrix_term,
+            log_det_regularization_matrix_term=log_det_regularization_matrix_term,
+        )
+
+    @property
+    def log_det_curvature_reg_matrix_term(self):
+        return self._log_det_curvature_reg_matrix_term
+
+    @property
+    def log_det_regularization_matrix_term(self):
+        return self._log_det_regularization_matrix_term
+
+    @property
+    def mapped_reconstructed_visibilities(self):
+        return self.transformer.visibilities_from_image(
+            image=self.mapped_reconstructed_image
+        )
+
+
+class CurvatureKernel:
+    def __init__(self, kernel, noise_map, transformer):
+        """The curvature kernel of the uv coverage of an interferometer dataset, which is the real-space point \
+        spread function of its noise-weighted uv coverage:
+
+        K(dy, dx) = sum_v cos(2 pi (dx u_v + dy v_v)) / noise_v^2
+
+        for every separation (dy, dx) between two pixels of the real-space mask. The curvature matrix of the \
+        transform of an image is translation invariant, such that the curvature matrix of an inversion is \
+        F = M^T K M, where K convolves an image with the kernel. Computing K once per dataset therefore removes the \
+        number of visibilities from the cost of computing the curvature matrix.
+
+        This requires the real and imaginary parts of every visibility to have the same noise.
+
+        Parameters
+        ----------
+        kernel : ndarray
+            The kernel of shape (2 * shape_y - 1, 2 * shape_x - 1), for the shape of the uniform grid of image \
+            pixels, whose central entry is the zero separation.
+        noise_map : aa.Visibilities
+            The noise-map the kernel is computed for.
+        transformer : NUFFTTransformer
+            The NUFFT transformer of the image pixels, which computes the dirty image of visibilities.
+        """
+
+        self.kernel = kernel
+        self.noise_map = noise_map
+        self.transformer = transformer
+
+        self.fft_shape_2d = tuple(
+            scipy.fft.next_fast_len(size, real=True) for size in kernel.shape
+        )
+        self.kernel_fft = scipy.fft.rfft2(kernel, s=self.fft_shape_2d)
+
+    @classmethod
+    def from_transformer_and_noise_map(cls, transformer, noise_map):
+        """Compute the curvature kernel of the uv coverage of a transformer's visibilities, which are weighted by \
+        the inverse square of a noise-map.
+
+        The kernel is computed using the adjoint of a NUFFT of the pixel separations, which grids the weights of \
+        the visibilities onto an oversampled FFT grid and inverse FFT's it once, such that its cost scales with the \
+        sum (not the product) of the number of visibilities and pixels.
+
+        Parameters
+        ----------
+        transformer : aa.Transformer
+            The transformer of the masked interferometer.
+        noise_map : aa.Visibilities
+            The noise-map of the visibilities.
+        """
+
+        if not isinstance(transformer, nufft_transformer.NUFFTTransformer):
+            transformer = nufft_transformer.NUFFTTransformer(
+                uv_wavelengths=transformer.uv_wavelengths,
+                grid_radians=transformer.grid_radians,
+            )
+
+        return cls(
+            kernel=kernel_from_transformer_and_noise_map(
+                transformer=transformer, noise_map=noise_map
+            ),
+            noise_map=noise_map,
+            transformer=transformer,
+        )
+
+    def curvature_kernel_from_noise_map(self, noise_map):
+        """Return the curvature kernel for a noise-map, which is this kernel if it is the noise-map the kernel was \
+        computed for and is otherwise recomputed (e.g. for a noise-map scaled by a hyper background noise)."""
+
+        if noise_map is self.noise_map or np.array_equal(
+            np.asarray(noise_map), np.asarray(self.noise_map)
+        ):
+            return self
+
+        return self.__class__(
+            kernel=kernel_from_transformer_and_noise_map(
+                transformer=self.transformer, noise_map=noise_map
+            ),
+            noise_map=noise_map,
+            transformer=self.transformer,
+        )
+
+    def dirty_image_from_visibilities(self, visibilities):
+        """Compute the dirty image of visibilities weighted by the inverse square of the noise-map, which the \
+        mapping matrix transposed maps to the data vector of an inversion."""
+
+        inverse_noise_map_squared = 1.0 / np.square(np.asarray(self.noise_map))
+
+        weighted_visibilities = np.asarray(visibilities) * inverse_noise_map_squared
+
+        return self.transformer.complex_image_from_complex_visibilities(
+            complex_visibilities=weighted_visibilities[:, 0]
+            + 1.0j * weighted_visibilities[:, 1]
+        ).real
+
+    def curvature_matrix_from_mapping_matrix(self, mapping_matrix):
+        """Compute the curvature matrix F = M^T K M of a mapping matrix, by convolving its columns with the kernel \
+        using FFTs.
+
+        The FFTs are at least as large as the kernel, so a convolution only wraps around outside the image pixels \
+        and the convolved columns are exact. Columns are convolved in chunks to limit the memory of the FFTs.
+
+        Parameters
+        ----------
+        mapping_matrix : ndarray
+            The mapping matrix of shape (image pixels, pixelization pixels).
+        """
+
+        image_2d_indexes = self.transformer.image_2d_indexes
+        kernel_centre_2d_indexes = np.array(self.kernel.shape) // 2
+
+        convolved_mapping_matrix = np.zeros(mapping_matrix.shape)
+
+        for chunk_start in range(
+            0, mapping_matrix.shape[1], curvature_matrix_chunk_size
+        ):
+
+            chunk = slice(chunk_start, chunk_start + curvature_matrix_chunk_size)
+
+            mapping_matrix_chunk = mapping_matrix[:, chunk].T
+
+            array_2d = np.zeros((mapping_matrix_chunk.shape[0],) + self.fft_shape_2d)
+            array_2d[
+                :, image_2d_indexes[:, 0], image_2d_indexes[:, 1]
+            ] = mapping_matrix_chunk
+
+            convolved_array_2d = scipy.fft.irfft2(
+                scipy.fft.rfft2(array_2d, axes=(1, 2)) * self.kernel_fft,
+                s=self.fft_shape_2d,
+                axes=(1, 2),
+            )
+
+            convolved_mapping_matrix[:, chunk] = convolved_array_2d[
+                :,
+                image_2d_indexes[:, 0] + kernel_centre_2d_indexes[0],
+                image_2d_indexes[:, 1] + kernel_centre_2d_indexes[1],
+            ].T
+
+        curvature_matrix = np.matmul(mapping_matrix.T, convolved_mapping_matrix)
+
+        return 0.5 * (curvature_matrix + curvature_matrix.T)
+
+
+def kernel_from_transformer_and_noise_map(transformer, noise_map):
+    """Compute the curvature kernel of the visibilities of a NUFFT transformer weighted by the inverse square of a \
+    noise-map (see *CurvatureKernel*).
+
+    The separations between the image pixels are a uniform grid of shape (2 * shape_y - 1, 2 * shape_x - 1) centred \
+    on zero. The adjoint NUFFT of the weights onto this grid is sum_v w_v exp(+2 pi i (dx u_v + dy v_v)), whose \
+    real part is the kernel.
+
+    Parameters
+    ----------
+    transformer : NUFFTTransformer
+        The NUFFT transformer of the image pixels.
+    noise_map : aa.Visibilities
+        The noise-map of the visibilities, whose real and imaginary noise must be equal.
+    """
+
+    noise_map = np.asarray(noise_map)
+
+    if not np.allclose(noise_map[:, 0], noise_map[:, 1]):
+        raise exc.SettingsException(
+            "An inversion using linear operators requires the real and imaginary noise of every visibility to be "
+            "equal"
+        )
+
+    kernel_shape_2d = tuple(2 * size - 1 for size in transformer.image_shape_2d)
+
+    fft_shape_2d = nufft_transformer.fft_shape_2d_from_shape_2d_and_oversampling_factor(
+        shape_2d=kernel_shape_2d, oversampling_factor=transformer.oversampling_factor
+    )
+
+    interpolation_matrix = nufft_transformer.interpolation_matrix_from(
+        uv_frequencies=nufft_transformer.uv_frequencies_from_uv_wavelengths_and_pixel_scales_radians(
+            uv_wavelengths=transformer.uv_wavelengths,
+            pixel_scales_radians=transformer.pixel_scales_radians,
+        ),
+        fft_shape_2d=fft_shape_2d,
+        kernel_width=transformer.kernel_width,
+        beta=transformer.beta,
+    )
+
+    fft_grid = interpolation_matrix.T @ (1.0 / np.square(noise_map[:, 0]))
+
+    fft_grid = scipy.fft.ifft2(fft_grid.reshape(fft_shape_2d)) * np.prod(fft_shape_2d)
+
+    separation_2d_indexes = np.indices(kernel_shape_2d).reshape(2, -1).T - (
+        np.array(kernel_shape_2d) // 2
+    )
+
+    fft_2d_indexes = np.mod(separation_2d_indexes, fft_shape_2d)
+
+    kernel = fft_grid[
+        fft_2d_indexes[:, 0], fft_2d_indexes[:, 1]
+    ].real * nufft_transformer.deapodization_from(
+        centred_2d_indexes=separation_2d_indexes,
+        fft_shape_2d=fft_shape_2d,
+        kernel_width=transformer.kernel_width,
+        beta=transformer.beta,
+    )
+
+    return kernel.reshape(kernel_shape_2d)
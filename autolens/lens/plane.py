@@ -9,6 +9,7 @@ from autoastro.util import cosmology_util
 from autolens import exc
 from autoastro import dimensions as dim
 from autolens.util import lens_util
+from autolens.util import transformer_util
 
 
 class AbstractPlane(lensing.LensingObject):
@@ -291,11 +292,17 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
         -----------
 
         """
-        if self.galaxies:
+        if self.has_light_profile:
+            grid_key = lens_util.grid_key_from_grid(grid=grid)
             profile_image = sum(
                 map(
-                    lambda galaxy: galaxy.profile_image_from_grid(grid=grid),
-                    self.galaxies,
+                    lambda galaxy: lens_util.profile_grid_cache.value_from_profiles_grid_key_and_func(
+                        name="profile_image",
+                        profiles=galaxy.light_profiles,
+                        grid_key=grid_key,
+                        func=lambda: galaxy.profile_image_from_grid(grid=grid),
+                    ),
+                    self.galaxies_with_light_profile,
                 )
             )
             return grid.mapping.array_stored_1d_from_sub_array_1d(
@@ -375,9 +382,18 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
 
     @grids.convert_coordinates_to_grid
     def deflections_from_grid(self, grid):
-        if self.galaxies:
+        if self.has_mass_profile:
+            grid_key = lens_util.grid_key_from_grid(grid=grid)
             deflections = sum(
-                map(lambda g: g.deflections_from_grid(grid=grid), self.galaxies)
+                map(
+                    lambda galaxy: lens_util.profile_grid_cache.value_from_profiles_grid_key_and_func(
+                        name="deflections",
+                        profiles=galaxy.mass_profiles,
+                        grid_key=grid_key,
+                        func=lambda: galaxy.deflections_from_grid(grid=grid),
+                    ),
+                    self.galaxies_with_mass_profile,
+                )
             )
             return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=deflections)
         else:
@@ -514,12 +530,12 @@ class AbstractPlaneData(AbstractPlaneLensing):
     def profile_visibilities_of_galaxies_from_grid_and_transformer(
         self, grid, transformer
     ):
-        return [
-            galaxy.profile_visibilities_from_grid_and_transformer(
-                grid=grid, transformer=transformer
-            )
-            for galaxy in self.galaxies
-        ]
+        """Compute the visibilities of the profile image of every galaxy, which are transformed together (see \
+        *transformer_util.visibilities_of_images_from_images_and_transformer*)."""
+        return transformer_util.visibilities_of_images_from_images_and_transformer(
+            images=self.profile_images_of_galaxies_from_grid(grid=grid),
+            transformer=transformer,
+        )
 
     def sparse_image_plane_grid_from_grid(self, grid):
 
@@ -1,9 +1,11 @@
 from abc import ABC
 
 import numpy as np
+import scipy.signal
 from astropy import cosmology as cosmo
 
 from autoastro import lensing
+from autoarray import exc as aa_exc
 from autoarray.util import array_util, grid_util
 from autoarray.mask import mask as msk
 from autoarray.structures import grids
@@ -12,7 +14,13 @@ from autoarray.operators.inversion import inversions as inv
 from autoastro.galaxy import galaxy as g
 from autoastro.util import cosmology_util
 from autolens.lens import plane as pl
+from autolens.lens import cholesky_inversion
+from autolens.lens import linear_operator_inversion
+from autolens.lens import sparse_inversion
 from autolens.util import lens_util
+from autolens.util import transformer_util
+
+traced_grids_of_planes_cache_size = 8
 
 
 class AbstractTracer(lensing.LensingObject, ABC):
@@ -44,6 +52,20 @@ class AbstractTracer(lensing.LensingObject, ABC):
         self.plane_redshifts = [plane.redshift for plane in planes]
         self.cosmology = cosmology
 
+        self.traced_grids_cached_by_content = False
+        self._traced_grids_of_planes_cache = {}
+
+        self.plane_indexes_with_light_profile = [
+            plane_index
+            for (plane_index, plane) in enumerate(planes)
+            if plane.has_light_profile
+        ]
+        self.plane_indexes_with_mass_profile = [
+            plane_index
+            for (plane_index, plane) in enumerate(planes)
+            if plane.has_mass_profile
+        ]
+
     @property
     def total_planes(self):
         return len(self.plane_redshifts)
@@ -86,12 +108,7 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
     @property
     def upper_plane_index_with_light_profile(self):
-        return max(
-            [
-                plane_index if plane.has_light_profile else 0
-                for (plane_index, plane) in enumerate(self.planes)
-            ]
-        )
+        return max(self.plane_indexes_with_light_profile, default=0)
 
     @property
     def planes_with_light_profile(self):
@@ -273,6 +290,12 @@ class AbstractTracerCosmology(AbstractTracer, ABC):
             unit_mass=unit_mass,
         )
 
+    @property
+    def scaling_factors_between_planes(self):
+        return lens_util.scaling_factors_between_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=self.plane_redshifts, cosmology=self.cosmology
+        )
+
     def scaling_factor_between_planes(self, i, j):
         return cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
             redshift_0=self.plane_redshifts[i],
@@ -292,38 +315,117 @@ class AbstractTracerCosmology(AbstractTracer, ABC):
 class AbstractTracerLensing(AbstractTracerCosmology, ABC):
     @grids.convert_coordinates_to_grid
     def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """Trace an input grid of (y,x) image-plane coordinates to every plane of the tracer, using multi-plane \
+        ray-tracing.
 
-        grid_calc = grid.copy()  # TODO looks unnecessary? Probably pretty expensive too
+        The traced grids are cached by the tracer, such that the deflection angles of every plane are computed only \
+        once for a given grid (e.g. a fit's grid is traced once to compute its model image and inversion). By \
+        default grids are cached by their identity, or by their values if *traced_grids_cached_by_content* is \
+        *True*. The cache can be cleared using *clear_traced_grids_of_planes_cache*.
 
-        traced_grids = []
-        traced_deflections = []
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane grid which is traced.
+        plane_index_limit : int or None
+            If input, only the grids of planes up to and including this plane index are traced and returned.
+        """
 
-        for (plane_index, plane) in enumerate(self.planes):
+        if plane_index_limit is None:
+            total_traced_planes = self.total_planes
+        else:
+            total_traced_planes = plane_index_limit + 1
 
-            scaled_grid = grid_calc.copy()
+        cache_key = self.traced_grids_of_planes_cache_key_from_grid(grid=grid)
 
-            if plane_index > 0:
-                for previous_plane_index in range(plane_index):
-                    scaling_factor = cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
-                        redshift_0=self.plane_redshifts[previous_plane_index],
-                        redshift_1=plane.redshift,
-                        redshift_final=self.plane_redshifts[-1],
-                        cosmology=self.cosmology,
-                    )
+        if cache_key in self._traced_grids_of_planes_cache:
 
-                    scaled_deflections = (
-                        scaling_factor * traced_deflections[previous_plane_index]
-                    )
+            traced_grids = self._traced_grids_of_planes_cache[cache_key][1]
+
+            if len(traced_grids) >= total_traced_planes:
+                return traced_grids[0:total_traced_planes]
+
+        traced_grids = self.ray_traced_grids_of_planes_from_grid(
+            grid=grid, total_traced_planes=total_traced_planes
+        )
+
+        self._traced_grids_of_planes_cache.pop(cache_key, None)
+
+        if len(self._traced_grids_of_planes_cache) >= traced_grids_of_planes_cache_size:
+            del self._traced_grids_of_planes_cache[
+                next(iter(self._traced_grids_of_planes_cache))
+            ]
+
+        self._traced_grids_of_planes_cache[cache_key] = (grid, traced_grids)
+
+        return traced_grids[0:total_traced_planes]
+
+    def traced_grids_of_planes_cache_key_from_grid(self, grid):
+        """The key of a grid in the traced grids cache. A reference to every cached grid is stored with its traced \
+        grids, so the identity of a cached grid cannot be reused by a different grid."""
+        if self.traced_grids_cached_by_content:
+            return grid.shape, grid.tobytes()
+        return id(grid)
+
+    def clear_traced_grids_of_planes_cache(self, grid=None):
+        """Clear the traced grids cache, either of one grid or (if no grid is input) of every grid. This must be \
+        called if a grid is modified in-place after it has been traced and the cache uses grid identities."""
+        if grid is None:
+            self._traced_grids_of_planes_cache = {}
+        else:
+            self._traced_grids_of_planes_cache.pop(
+                self.traced_grids_of_planes_cache_key_from_grid(grid=grid), None
+            )
+
+    def ray_traced_grids_of_planes_from_grid(self, grid, total_traced_planes):
+        """Ray-trace an input grid to the first *total_traced_planes* planes of the tracer.
+
+        The traced grids of all planes are stored in one preallocated buffer, which is updated in-place plane by \
+        plane as the deflection angles of each plane are computed. The grid of each plane is a view of this buffer \
+        with the same type and attributes (e.g. mask, interpolator) as the input grid, except for the image-plane \
+        whose coordinates are not deflected and which is the input grid itself. Quantities of the image-plane's \
+        fixed profiles are therefore recognised by *lens_util.profile_grid_cache* in every fit.
+        """
+
+        scaling_factors = self.scaling_factors_between_planes
+
+        traced_grids_of_planes_buffer = np.empty(
+            shape=(total_traced_planes,) + grid.shape
+        )
+        traced_grids_of_planes_buffer[:] = grid
+
+        traced_grids_of_planes_buffer_1d = traced_grids_of_planes_buffer.reshape(
+            total_traced_planes, -1, 2
+        )
+
+        traced_grids = []
+
+        for plane_index in range(total_traced_planes):
+
+            if plane_index == 0:
+                traced_grid = grid
+            else:
+                traced_grid = traced_grid_view_from_buffer_and_grid(
+                    buffer=traced_grids_of_planes_buffer[plane_index], grid=grid
+                )
 
-                    scaled_grid -= scaled_deflections
+            traced_grids.append(traced_grid)
 
-            traced_grids.append(scaled_grid)
+            if (
+                plane_index < total_traced_planes - 1
+                and plane_index in self.plane_indexes_with_mass_profile
+            ):
 
-            if plane_index_limit is not None:
-                if plane_index == plane_index_limit:
-                    return traced_grids
+                deflections = self.planes[plane_index].deflections_from_grid(
+                    grid=traced_grid
+                )
 
-            traced_deflections.append(plane.deflections_from_grid(grid=scaled_grid))
+                lens_util.traced_grids_of_planes_subtract_scaled_deflections_of_plane(
+                    traced_grids_of_planes=traced_grids_of_planes_buffer_1d,
+                    deflections=np.asarray(deflections).reshape(-1, 2),
+                    scaling_factors=scaling_factors,
+                    plane_index=plane_index,
+                )
 
         return traced_grids
 
@@ -336,36 +438,52 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
 
     @grids.convert_coordinates_to_grid
     def profile_image_from_grid(self, grid):
-        profile_image = sum(self.profile_images_of_planes_from_grid(grid=grid))
+        """Compute the summed profile image of every plane, where only planes with a light profile are traced to and \
+        evaluated."""
+
+        if not self.plane_indexes_with_light_profile:
+            return grid.mapping.array_stored_1d_from_sub_array_1d(
+                sub_array_1d=np.zeros((grid.sub_shape_1d,))
+            )
+
+        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
+        )
+
+        profile_image = sum(
+            [
+                self.planes[plane_index].profile_image_from_grid(
+                    grid=traced_grids_of_planes[plane_index]
+                )
+                for plane_index in self.plane_indexes_with_light_profile
+            ]
+        )
+
         return grid.mapping.array_stored_1d_from_sub_array_1d(
             sub_array_1d=profile_image
         )
 
     @grids.convert_coordinates_to_grid
     def profile_images_of_planes_from_grid(self, grid):
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
-        )
+        """Compute the profile image of every plane. Planes without a light profile are not traced to or evaluated \
+        and their image is zeros."""
 
-        profile_images_of_planes = [
+        if self.plane_indexes_with_light_profile:
+            traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+                grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
+            )
+
+        return [
             self.planes[plane_index].profile_image_from_grid(
                 grid=traced_grids_of_planes[plane_index]
             )
-            for plane_index in range(len(traced_grids_of_planes))
+            if plane_index in self.plane_indexes_with_light_profile
+            else grid.mapping.array_stored_1d_from_sub_array_1d(
+                sub_array_1d=np.zeros((grid.sub_shape_1d,))
+            )
+            for plane_index in range(self.total_planes)
         ]
 
-        if self.upper_plane_index_with_light_profile < self.total_planes - 1:
-            for plane_index in range(
-                self.upper_plane_index_with_light_profile, self.total_planes - 1
-            ):
-                profile_images_of_planes.append(
-                    grid.mapping.array_stored_1d_from_sub_array_1d(
-                        sub_array_1d=np.zeros(shape=profile_images_of_planes[0].shape)
-                    )
-                )
-
-        return profile_images_of_planes
-
     def padded_profile_image_from_grid_and_psf_shape(self, grid, psf_shape_2d):
 
         padded_grid = grid.padded_grid_from_kernel_shape(kernel_shape_2d=psf_shape_2d)
@@ -430,7 +548,7 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
             if redshift < plane_redshift:
                 plane_index_insert = plane_index
 
-        planes = self.planes
+        planes = self.planes[:]
         planes.insert(
             plane_index_insert,
             pl.Plane(redshift=redshift, galaxies=[], cosmology=self.cosmology),
@@ -542,6 +660,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         """Extract the 1D image and 1D blurring image of every plane and blur each with the \
         PSF using a psf (see imaging.convolution).
 
+        The 2D images of every plane with a light profile are stacked and blurred together in a single FFT \
+        convolution, as opposed to convolving each plane separately.
+
         The blurred image of every plane is returned in 1D.
 
         Parameters
@@ -550,20 +671,53 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        if not self.plane_indexes_with_light_profile:
+            return [
+                blurred_image_of_plane_without_light_profile_from_grid(grid=grid)
+                for plane in self.planes
+            ]
+
+        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
+        )
         traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+            grid=blurring_grid,
+            plane_index_limit=self.upper_plane_index_with_light_profile,
         )
 
-        return [
-            plane.blurred_profile_image_from_grid_and_psf(
-                grid=traced_grids_of_planes[plane_index],
-                psf=psf,
-                blurring_grid=traced_blurring_grids_of_planes[plane_index],
-            )
-            for (plane_index, plane) in enumerate(self.planes)
+        blurred_images_2d = blurred_arrays_2d_from_arrays_2d_and_psf(
+            arrays_2d=[
+                self.planes[plane_index]
+                .profile_image_from_grid(grid=traced_grids_of_planes[plane_index])
+                .in_2d_binned
+                + self.planes[plane_index]
+                .profile_image_from_grid(
+                    grid=traced_blurring_grids_of_planes[plane_index]
+                )
+                .in_2d_binned
+                for plane_index in self.plane_indexes_with_light_profile
+            ],
+            psf=psf,
+        )
+
+        mask_sub_1 = grid.mask.mapping.mask_sub_1
+
+        blurred_images_of_planes = [
+            blurred_image_of_plane_without_light_profile_from_grid(grid=grid)
+            for plane in self.planes
         ]
 
+        for plane_index, blurred_image_2d in zip(
+            self.plane_indexes_with_light_profile, blurred_images_2d
+        ):
+            blurred_images_of_planes[
+                plane_index
+            ] = mask_sub_1.mapping.array_stored_1d_from_array_2d(
+                array_2d=blurred_image_2d
+            )
+
+        return blurred_images_of_planes
+
     def blurred_profile_image_from_grid_and_convolver(
         self, grid, convolver, blurring_grid
     ):
@@ -600,10 +754,14 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
-        )
+        if self.plane_indexes_with_light_profile:
+            traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+                grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
+            )
+            traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
+                grid=blurring_grid,
+                plane_index_limit=self.upper_plane_index_with_light_profile,
+            )
 
         return [
             plane.blurred_profile_image_from_grid_and_convolver(
@@ -611,6 +769,8 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
                 convolver=convolver,
                 blurring_grid=traced_blurring_grids_of_planes[plane_index],
             )
+            if plane_index in self.plane_indexes_with_light_profile
+            else blurred_image_of_plane_without_light_profile_from_grid(grid=grid)
             for (plane_index, plane) in enumerate(self.planes)
         ]
 
@@ -684,11 +844,12 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         self, grid, transformer
     ):
 
-        profile_images_1d_of_planes = self.profile_images_of_planes_from_grid(grid=grid)
-        return [
-            transformer.visibilities_from_image(image=profile_image_1d)
-            for profile_image_1d in profile_images_1d_of_planes
-        ]
+        """Compute the visibilities of the profile image of every plane, which are transformed together (see \
+        *transformer_util.visibilities_of_images_from_images_and_transformer*)."""
+        return transformer_util.visibilities_of_images_from_images_and_transformer(
+            images=self.profile_images_of_planes_from_grid(grid=grid),
+            transformer=transformer,
+        )
 
     def sparse_image_plane_grids_of_planes_from_grid(self, grid):
 
@@ -724,36 +885,158 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
                 traced_sparse_grids = self.traced_grids_of_planes_from_grid(
                     grid=sparse_image_plane_grids_of_planes[plane_index]
                 )
-                traced_sparse_grids_of_planes.append(traced_sparse_grids[plane_index])
+                traced_sparse_grids_of_planes.append(
+                    traced_sparse_grids[plane_index].copy()
+                )
 
         return traced_sparse_grids_of_planes
 
     def mappers_of_planes_from_grid(
         self, grid, inversion_uses_border=False, preload_sparse_grids_of_planes=None
     ):
+        """Compute the mapper of every plane with a pixelization, which maps the grid traced to that plane to its \
+        pixelization.
 
-        mappers_of_planes = []
-
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        The traced grid, traced sparse grid and mapper of every plane are stored in *lens_util.inversion_cache*, \
+        keyed by the mass profiles which trace the grid to the plane and by its pixelization, if they are fixed (see \
+        *lens_util.set_fixed_objects*). In a phase where the lens mass model is fixed (e.g. an inversion phase) the \
+        traced grids are therefore computed once, and if the pixelization is also fixed the mapper is reused.
+        """
 
-        traced_sparse_grids_of_planes = self.traced_sparse_grids_of_planes_from_grid(
-            grid=grid, preload_sparse_grids_of_planes=preload_sparse_grids_of_planes
-        )
+        mappers_of_planes = []
 
         for (plane_index, plane) in enumerate(self.planes):
 
             if not plane.has_pixelization:
                 mappers_of_planes.append(None)
             else:
-                mapper = plane.mapper_from_grid_and_sparse_grid(
-                    grid=traced_grids_of_planes[plane_index],
-                    sparse_grid=traced_sparse_grids_of_planes[plane_index],
-                    inversion_uses_border=inversion_uses_border,
+                mappers_of_planes.append(
+                    self.mapper_of_plane_from_grid(
+                        grid=grid,
+                        plane_index=plane_index,
+                        inversion_uses_border=inversion_uses_border,
+                        preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+                    )
                 )
-                mappers_of_planes.append(mapper)
 
         return mappers_of_planes
 
+    def mapper_of_plane_from_grid(
+        self,
+        grid,
+        plane_index,
+        inversion_uses_border=False,
+        preload_sparse_grids_of_planes=None,
+    ):
+
+        plane = self.planes[plane_index]
+
+        mass_profiles, mass_key = self.inversion_cache_mass_profiles_and_key_from_grid(
+            grid=grid, plane_index=plane_index
+        )
+
+        pixelization_key = self.inversion_cache_pixelization_key_of_plane(
+            plane_index=plane_index,
+            mass_profiles=mass_profiles,
+            preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+        )
+
+        traced_grid = lens_util.inversion_cache.value_from_profiles_grid_key_and_func(
+            name="traced_grid",
+            profiles=mass_profiles,
+            grid_key=mass_key,
+            func=lambda: self.traced_grids_of_planes_from_grid(grid=grid)[
+                plane_index
+            ].copy(),
+        )
+
+        def traced_sparse_grid_func():
+
+            if preload_sparse_grids_of_planes is None:
+                sparse_grid = plane.sparse_image_plane_grid_from_grid(grid=grid)
+            else:
+                sparse_grid = preload_sparse_grids_of_planes[plane_index]
+
+            if sparse_grid is None:
+                return None
+
+            return self.traced_grids_of_planes_from_grid(grid=sparse_grid)[
+                plane_index
+            ].copy()
+
+        traced_sparse_grid = lens_util.inversion_cache.value_from_profiles_grid_key_and_func(
+            name="traced_sparse_grid",
+            profiles=mass_profiles + [plane.pixelization],
+            grid_key=(mass_key, pixelization_key),
+            func=traced_sparse_grid_func,
+        )
+
+        return lens_util.inversion_cache.value_from_profiles_grid_key_and_func(
+            name="mapper",
+            profiles=mass_profiles + [plane.pixelization],
+            grid_key=(mass_key, pixelization_key, inversion_uses_border),
+            func=lambda: plane.mapper_from_grid_and_sparse_grid(
+                grid=traced_grid.copy(),
+                sparse_grid=None
+                if traced_sparse_grid is None
+                else traced_sparse_grid.copy(),
+                inversion_uses_border=inversion_uses_border,
+            ),
+        )
+
+    def inversion_cache_mass_profiles_and_key_from_grid(self, grid, plane_index):
+        """The mass profiles which trace a grid to a plane and the key of the grid, plane redshifts and cosmology \
+        they trace it with, which together determine the traced grid of the plane in the inversion cache."""
+
+        mass_profiles = [
+            mass_profile
+            for plane in self.planes[0:plane_index]
+            for mass_profile in plane.mass_profiles
+        ]
+
+        mass_key = (
+            lens_util.grid_key_from_grid(grid=grid),
+            tuple(self.plane_redshifts[0 : plane_index + 1]),
+            tuple(len(plane.mass_profiles) for plane in self.planes[0:plane_index]),
+            repr(self.cosmology),
+        )
+
+        return mass_profiles, mass_key
+
+    def inversion_cache_pixelization_key_of_plane(
+        self, plane_index, mass_profiles, preload_sparse_grids_of_planes=None
+    ):
+        """The key of the hyper image and preloaded sparse grid of a plane's pixelization, which (with the \
+        pixelization's parameters) determine its sparse grid in the inversion cache.
+
+        The arrays are keyed by identity (see *lens_util.array_key_from_array*), and the key is only computed if the \
+        mass profiles tracing to the plane and its pixelization are fixed, as otherwise the inversion cache is not \
+        used and *None* is returned."""
+
+        pixelization = self.planes[plane_index].pixelization
+
+        if (
+            lens_util.profiles_key_from_profiles(
+                profiles=mass_profiles + [pixelization]
+            )
+            is None
+        ):
+            return None
+
+        if preload_sparse_grids_of_planes is None:
+            preload_sparse_grid = None
+        else:
+            preload_sparse_grid = preload_sparse_grids_of_planes[plane_index]
+
+        return (
+            lens_util.array_key_from_array(
+                array=self.planes[
+                    plane_index
+                ].hyper_galaxy_image_of_galaxy_with_pixelization
+            ),
+            lens_util.grid_key_from_grid(grid=preload_sparse_grid),
+        )
+
     def inversion_imaging_from_grid_and_data(
         self,
         grid,
@@ -762,20 +1045,76 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         convolver,
         inversion_uses_border=False,
         preload_sparse_grids_of_planes=None,
+        inversion_uses_sparse_matrices=False,
     ):
+        """Perform the inversion of the source plane's pixelization.
 
-        mappers_of_planes = self.mappers_of_planes_from_grid(
+        The blurred mapping matrix is stored in *lens_util.inversion_cache* with the mapper (see \
+        *mappers_of_planes_from_grid*), so that if the mass model and pixelization are fixed (e.g. only the \
+        regularization varies) the inversion is only a linear algebra solve.
+
+        If *inversion_uses_sparse_matrices* is *True*, the mapping matrix and blurred mapping matrix are sparse \
+        matrices (see *sparse_inversion.SparseInversionImaging*), such that the dense (image pixels x pixelization \
+        pixels) matrices are never formed.
+        """
+
+        plane_index = self.total_planes - 1
+
+        mapper = self.mappers_of_planes_from_grid(
             grid=grid,
             inversion_uses_border=inversion_uses_border,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+        )[plane_index]
+
+        mass_profiles, mass_key = self.inversion_cache_mass_profiles_and_key_from_grid(
+            grid=grid, plane_index=plane_index
         )
 
-        return inv.InversionImaging.from_data_mapper_and_regularization(
+        def blurred_mapping_matrix_func():
+
+            if inversion_uses_sparse_matrices:
+                return sparse_inversion.blurred_mapping_matrix_sparse_from_mapper_and_convolver(
+                    mapper=mapper, convolver=convolver
+                )
+
+            return convolver.convolve_mapping_matrix(
+                mapping_matrix=mapper.mapping_matrix
+            )
+
+        blurred_mapping_matrix = lens_util.inversion_cache.value_from_profiles_grid_key_and_func(
+            name="blurred_mapping_matrix_sparse"
+            if inversion_uses_sparse_matrices
+            else "blurred_mapping_matrix",
+            profiles=mass_profiles + [self.planes[plane_index].pixelization],
+            grid_key=(
+                mass_key,
+                self.inversion_cache_pixelization_key_of_plane(
+                    plane_index=plane_index,
+                    mass_profiles=mass_profiles,
+                    preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+                ),
+                inversion_uses_border,
+                lens_util.array_key_from_array(array=convolver.kernel),
+            ),
+            func=blurred_mapping_matrix_func,
+        )
+
+        if inversion_uses_sparse_matrices:
+            return sparse_inversion.SparseInversionImaging.from_data_mapper_and_regularization(
+                image=image,
+                noise_map=noise_map,
+                convolver=convolver,
+                mapper=mapper,
+                regularization=self.regularizations_of_planes[-1],
+                blurred_mapping_matrix=blurred_mapping_matrix,
+            )
+
+        return cholesky_inversion.CholeskyInversionImaging.from_blurred_mapping_matrix_and_data(
             image=image,
             noise_map=noise_map,
-            convolver=convolver,
-            mapper=mappers_of_planes[-1],
+            mapper=mapper,
             regularization=self.regularizations_of_planes[-1],
+            blurred_mapping_matrix=blurred_mapping_matrix,
         )
 
     def inversion_interferometer_from_grid_and_data(
@@ -786,13 +1125,30 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         transformer,
         inversion_uses_border=False,
         preload_sparse_grids_of_planes=None,
+        curvature_kernel=None,
     ):
+        """Perform the inversion of the source plane's pixelization.
+
+        If a *curvature_kernel* of the uv coverage is input, the inversion is performed using linear operators \
+        (see *linear_operator_inversion.LinearOperatorInversionInterferometer*), such that the transformed mapping \
+        matrices (of dimensions visibilities x pixelization pixels) are never formed.
+        """
         mappers_of_planes = self.mappers_of_planes_from_grid(
             grid=grid,
             inversion_uses_border=inversion_uses_border,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
         )
 
+        if curvature_kernel is not None:
+            return linear_operator_inversion.LinearOperatorInversionInterferometer.from_data_mapper_and_regularization(
+                visibilities=visibilities,
+                noise_map=noise_map,
+                transformer=transformer,
+                mapper=mappers_of_planes[-1],
+                regularization=self.regularizations_of_planes[-1],
+                curvature_kernel=curvature_kernel,
+            )
+
         return inv.InversionInterferometer.from_data_mapper_and_regularization(
             visibilities=visibilities,
             noise_map=noise_map,
@@ -865,23 +1221,84 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         self, grid, transformer
     ) -> {g.Galaxy: np.ndarray}:
         """
-        A dictionary associating galaxies with their corresponding model images
-        """
+        A dictionary associating galaxies with their corresponding model visibilities.
 
-        galaxy_profile_visibilities_image_dict = dict()
+        The profile images of the galaxies of every plane are transformed together, so this costs roughly one \
+        transform instead of one per galaxy.
+        """
 
         traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
 
+        galaxies = []
+        profile_images_of_galaxies = []
+
         for (plane_index, plane) in enumerate(self.planes):
-            profile_visibilities_of_galaxies = plane.profile_visibilities_of_galaxies_from_grid_and_transformer(
-                grid=traced_grids_of_planes[plane_index], transformer=transformer
+            galaxies += plane.galaxies
+            profile_images_of_galaxies += plane.profile_images_of_galaxies_from_grid(
+                grid=traced_grids_of_planes[plane_index]
             )
-            for (galaxy_index, galaxy) in enumerate(plane.galaxies):
-                galaxy_profile_visibilities_image_dict[
-                    galaxy
-                ] = profile_visibilities_of_galaxies[galaxy_index]
 
-        return galaxy_profile_visibilities_image_dict
+        profile_visibilities_of_galaxies = transformer_util.visibilities_of_images_from_images_and_transformer(
+            images=profile_images_of_galaxies, transformer=transformer
+        )
+
+        return dict(zip(galaxies, profile_visibilities_of_galaxies))
+
+
+def traced_grid_view_from_buffer_and_grid(buffer, grid):
+    """Return a view of a buffer of traced (y,x) coordinates which has the same type and attributes (e.g. mask, \
+    interpolator) as the grid that was traced, without copying the buffer.
+
+    Parameters
+    ----------
+    buffer : ndarray
+        The traced coordinates, with the same shape as the grid.
+    grid : aa.Grid or ndarray
+        The grid which was traced.
+    """
+    traced_grid = buffer.view(type(grid))
+
+    if hasattr(grid, "__dict__"):
+        traced_grid.__dict__.update(grid.__dict__)
+
+    return traced_grid
+
+
+def blurred_arrays_2d_from_arrays_2d_and_psf(arrays_2d, psf):
+    """Blur a list of 2D arrays of the same shape (e.g. the images of every plane of a tracer) with a PSF, by \
+    stacking them into one 3D array and performing a single FFT convolution over their two spatial axes.
+
+    This is equivalent to calling *psf.convolved_array_from_array_2d_and_mask* on every array, but transforms the \
+    PSF once and reuses it for every array.
+
+    Parameters
+    ----------
+    arrays_2d : [ndarray]
+        The 2D arrays which are blurred.
+    psf : aa.Kernel
+        The PSF the arrays are blurred with, which must have odd dimensions.
+    """
+
+    if psf.shape_2d[0] % 2 == 0 or psf.shape_2d[1] % 2 == 0:
+        raise aa_exc.KernelException("Kernel Kernel must be odd")
+
+    return scipy.signal.fftconvolve(
+        np.stack(arrays_2d), psf.in_2d[None, :, :], mode="same", axes=(1, 2)
+    )
+
+
+def blurred_image_of_plane_without_light_profile_from_grid(grid):
+    """The blurred image of a plane without a light profile, which is zeros and therefore not computed by \
+    convolving the plane's (zero) profile image.
+
+    Parameters
+    ----------
+    grid : aa.Grid
+        The grid of the image.
+    """
+    return grid.mask.mapping.array_stored_1d_from_array_1d(
+        array_1d=np.zeros((grid.mask.pixels_in_mask,))
+    )
 
 
 class Tracer(AbstractTracerData):
@@ -905,6 +1322,43 @@ class Tracer(AbstractTracerData):
 
         return Tracer(planes=planes, cosmology=cosmology)
 
+    @classmethod
+    def from_galaxies_with_mass_profiles(cls, galaxies, cosmology=cosmo.Planck15):
+        """A tracer with a plane at the redshift of every input galaxy, but which only contains the galaxies with a \
+        mass profile.
+
+        It traces coordinates to the same planes as the tracer of all galaxies (e.g. to check that positions trace \
+        within a threshold) without the galaxies whose light profiles, pixelizations or hyper images do not deflect \
+        light.
+
+        Parameters
+        ----------
+        galaxies : [Galaxy]
+            The galaxies whose redshifts set the planes of the tracer.
+        cosmology : astropy.cosmology
+            The cosmology of the ray-tracing calculation.
+        """
+
+        plane_redshifts = lens_util.ordered_plane_redshifts_from_galaxies(
+            galaxies=galaxies
+        )
+
+        galaxies_in_planes = lens_util.galaxies_in_redshift_ordered_planes_from_galaxies(
+            galaxies=[galaxy for galaxy in galaxies if galaxy.has_mass_profile],
+            plane_redshifts=plane_redshifts,
+        )
+
+        planes = [
+            pl.Plane(
+                redshift=plane_redshift,
+                galaxies=galaxies_in_planes[plane_index],
+                cosmology=cosmology,
+            )
+            for plane_index, plane_redshift in enumerate(plane_redshifts)
+        ]
+
+        return Tracer(planes=planes, cosmology=cosmology)
+
     @classmethod
     def sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
         cls,
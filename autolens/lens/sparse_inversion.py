@@ -0,0 +1,130 @@
+import numpy as np
+from scipy import sparse
+
+from autolens.lens import cholesky_inversion
+
+
+class SparseInversionImaging(cholesky_inversion.CholeskyInversionImaging):
+    @classmethod
+    def from_data_mapper_and_regularization(
+        cls,
+        image,
+        noise_map,
+        convolver,
+        mapper,
+        regularization,
+        blurred_mapping_matrix=None,
+    ):
+        """Perform an inversion of imaging data where the mapping matrix and blurred mapping matrix are sparse \
+        matrices, built from the pairs of sub-pixels and pixelization pixels of the mapper and the frames of the \
+        convolver.
+
+        The dense matrices have dimensions (image pixels x pixelization pixels), whereas the sparse matrices only \
+        store the non-zero entries, of which there are of order the number of sub-pixels times the PSF size. The \
+        curvature matrix F = f^T N^-2 f and data vector are computed directly from the sparse blurred mapping \
+        matrix *f*, and the reconstruction is solved for as in *CholeskyInversionImaging*.
+
+        Parameters
+        ----------
+        image : aa.Array
+            The image which is reconstructed.
+        noise_map : aa.Array
+            The noise-map of the image.
+        convolver : aa.Convolver
+            The convolver which blurs the mapping matrix with the PSF.
+        mapper : aa.Mapper
+            The mapper of the pixelization the image is reconstructed on.
+        regularization : aa.Regularization
+            The regularization of the reconstruction.
+        blurred_mapping_matrix : scipy.sparse.csr_matrix or None
+            The sparse blurred mapping matrix, if it has already been computed.
+        """
+
+        if blurred_mapping_matrix is None:
+            blurred_mapping_matrix = blurred_mapping_matrix_sparse_from_mapper_and_convolver(
+                mapper=mapper, convolver=convolver
+            )
+
+        inverse_noise_map_squared = 1.0 / np.square(np.asarray(noise_map))
+
+        data_vector = blurred_mapping_matrix.T.dot(
+            np.asarray(image) * inverse_noise_map_squared
+        )
+
+        curvature_matrix = (
+            blurred_mapping_matrix.T.dot(
+                sparse.diags(inverse_noise_map_squared).dot(blurred_mapping_matrix)
+            )
+        ).toarray()
+
+        return cls.from_data_vector_and_curvature_matrix(
+            image=image,
+            noise_map=noise_map,
+            mapper=mapper,
+            regularization=regularization,
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            data_vector=data_vector,
+            curvature_matrix=curvature_matrix,
+        )
+
+    @property
+    def mapped_reconstructed_image(self):
+        return self.mapper.grid.mapping.array_stored_1d_from_array_1d(
+            array_1d=self.blurred_mapping_matrix.dot(self.reconstruction)
+        )
+
+
+def mapping_matrix_sparse_from_mapper(mapper):
+    """Compute the mapping matrix of a mapper as a sparse matrix, where every sub-pixel adds its sub-fraction to the \
+    entry of its pixel and the pixelization pixel it maps to (see *Mapper.mapping_matrix*)."""
+
+    pixelization_1d_index_for_sub_mask_1d_index = np.asarray(
+        mapper.pixelization_1d_index_for_sub_mask_1d_index
+    )
+
+    return sparse.csr_matrix(
+        (
+            np.full(
+                pixelization_1d_index_for_sub_mask_1d_index.shape[0],
+                mapper.grid.mask.sub_fraction,
+            ),
+            (
+                np.asarray(mapper._mask_1d_index_for_sub_mask_1d_index),
+                pixelization_1d_index_for_sub_mask_1d_index,
+            ),
+        ),
+        shape=(mapper.grid.mask.pixels_in_mask, mapper.pixels),
+    )
+
+
+def convolution_matrix_sparse_from_convolver(convolver):
+    """Compute the sparse (image pixels x image pixels) matrix which blurs a masked image with the PSF of a \
+    convolver, from the frames the convolver uses to blur mapping matrices (see *Convolver.convolve_mapping_matrix*).
+
+    Entry [i, j] is the fraction of the flux of image pixel j the PSF blurs into image pixel i.
+    """
+
+    frame_lengths = convolver.image_frame_1d_lengths
+
+    in_frame = (
+        np.arange(convolver.image_frame_1d_indexes.shape[1])[None, :]
+        < frame_lengths[:, None]
+    )
+
+    return sparse.csr_matrix(
+        (
+            convolver.image_frame_1d_kernels[in_frame],
+            (
+                convolver.image_frame_1d_indexes[in_frame],
+                np.repeat(np.arange(frame_lengths.shape[0]), frame_lengths),
+            ),
+        ),
+        shape=(convolver.pixels_in_mask, convolver.pixels_in_mask),
+    )
+
+
+def blurred_mapping_matrix_sparse_from_mapper_and_convolver(mapper, convolver):
+    """Compute the blurred mapping matrix of a mapper as a sparse matrix, without forming the dense mapping matrix."""
+    return convolution_matrix_sparse_from_convolver(convolver=convolver).dot(
+        mapping_matrix_sparse_from_mapper(mapper=mapper)
+    )
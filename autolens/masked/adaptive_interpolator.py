@@ -0,0 +1,244 @@
+import numpy as np
+from scipy.spatial import Delaunay
+
+from autoarray.structures import grids
+from autolens import exc
+
+
+class AdaptiveInterpolator:
+    def __init__(self, grid, interp_grid, pixel_scale_interpolation_grid, vtx, wts):
+        """An interpolator which interpolates values computed on an irregular, adaptively refined interpolation grid \
+        to a grid, using the barycentric weights of the Delaunay triangle every grid coordinate lands in.
+
+        It is a drop-in replacement for the uniform autoarray *Interpolator*, so that mass profiles decorated with \
+        *grid_interpolate* compute their deflection angles on *interp_grid* and interpolate them to *grid*.
+
+        Parameters
+        ----------
+        grid : ndarray
+            The (y,x) coordinates values are interpolated to.
+        interp_grid : grids.GridIrregular
+            The (y,x) coordinates values are computed on.
+        pixel_scale_interpolation_grid : float
+            The pixel scale of the coarsest level of the interpolation grid.
+        vtx : ndarray
+            The indexes of the three interpolation grid coordinates of the triangle every grid coordinate lands in.
+        wts : ndarray
+            The barycentric weights of these three coordinates.
+        """
+        self.grid = grid
+        self.interp_grid = interp_grid
+        self.pixel_scale_interpolation_grid = pixel_scale_interpolation_grid
+        self.vtx = vtx
+        self.wts = wts
+
+    @classmethod
+    def list_from_grids_and_interp_grid(
+        cls, grids_, interp_grid, pixel_scale_interpolation_grid
+    ):
+        """Create an interpolator for every grid in a list of grids (e.g. the grid and blurring grid of a masked \
+        dataset), which all share the same interpolation grid and Delaunay triangulation.
+
+        Sharing the interpolation grid means the deflection angles of a numerically integrated mass profile are \
+        computed on it once per fit, as autoastro's *geometry_profiles.cache* of these profiles (which keys on the \
+        bytes of the grid) returns them for every grid after the first. The deflection angles of other mass profiles \
+        are computed on it once per grid.
+        """
+        delaunay = Delaunay(interp_grid)
+
+        interpolators = []
+
+        for grid in grids_:
+
+            vtx, wts = interp_weights_from_delaunay_and_grid(
+                delaunay=delaunay, grid=grid
+            )
+
+            interpolators.append(
+                cls(
+                    grid=grid,
+                    interp_grid=interp_grid,
+                    pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+                    vtx=vtx,
+                    wts=wts,
+                )
+            )
+
+        return interpolators
+
+    def interpolated_values_from_values(self, values):
+        return np.einsum("nj,nj->n", np.take(values, self.vtx), self.wts)
+
+
+def interp_weights_from_delaunay_and_grid(delaunay, grid):
+    """Compute the vertices of the Delaunay triangle every (y,x) coordinate of a grid lands in and their barycentric \
+    weights, following the uniform autoarray *Interpolator*.
+
+    A coordinate outside the triangulation has no triangle (*find_simplex* returns -1, which would index the last \
+    triangle), so its value cannot be interpolated and an exception is raised. The interpolation grid of a masked \
+    dataset covers its grids with a buffer (see *interp_grid_from_grids_and_pixel_scale_interpolation_grid*), so \
+    this only happens if an interpolator is created for a grid the interpolation grid was not computed for.
+    """
+    grid = np.asarray(grid)
+    simplex = delaunay.find_simplex(grid)
+
+    if np.any(simplex == -1):
+        raise exc.SettingsException(
+            "{} coordinates of the grid lie outside the interpolation grid, so their values cannot be "
+            "interpolated".format(np.sum(simplex == -1))
+        )
+
+    vertices = np.take(delaunay.simplices, simplex, axis=0)
+    temp = np.take(delaunay.transform, simplex, axis=0)
+    delta = grid - temp[:, 2]
+    bary = np.einsum("njk,nk->nj", temp[:, :2, :], delta)
+    return vertices, np.hstack((bary, 1 - bary.sum(axis=1, keepdims=True)))
+
+
+def interp_grid_from_grids_and_pixel_scale_interpolation_grid(
+    grids_,
+    pixel_scale_interpolation_grid,
+    tracer=None,
+    refinement_levels=0,
+    magnification_threshold=10.0,
+    deflection_accuracy=1.0e-3,
+):
+    """Compute a quadtree interpolation grid that covers a list of grids (e.g. the grid and blurring grid of a masked \
+    dataset), which is refined where linear interpolation of a tracer's deflection angles is inaccurate.
+
+    The coarsest level is a uniform grid of square cells of size *pixel_scale_interpolation_grid*, covering every \
+    cell a grid coordinate lands in and a one cell buffer around them. At every level, each cell is split into four \
+    if either:
+
+    - The deflection angle at its centre differs from the mean of those at its corners by more than \
+      *deflection_accuracy*, which estimates the deflection field's second derivatives across the cell.
+    - The magnification estimated from its corners' deflection angles exceeds *magnification_threshold*, such that \
+      cells around the critical curves are refined.
+
+    The interpolation grid is the corners of every cell that is not split. If there is no tracer or refinement \
+    levels the interpolation grid is uniform.
+
+    Parameters
+    ----------
+    grids_ : [aa.Grid]
+        The grids which the interpolation grid covers.
+    pixel_scale_interpolation_grid : float
+        The size of the cells at the coarsest level of the interpolation grid.
+    tracer : ray_tracing.Tracer
+        The tracer whose deflection angles decide which cells are refined.
+    refinement_levels : int
+        The number of times a cell can be split, each halving its size.
+    magnification_threshold : float
+        Cells whose magnification exceeds this value are refined.
+    deflection_accuracy : float
+        Cells whose estimated interpolation error exceeds this deflection angle (arc-seconds) are refined.
+    """
+    points = np.concatenate([np.asarray(grid).reshape(-1, 2) for grid in grids_])
+
+    origin = points.min(axis=0) - 2.0 * pixel_scale_interpolation_grid
+
+    cell_indexes = np.unique(
+        np.floor((points - origin) / pixel_scale_interpolation_grid).astype("int"),
+        axis=0,
+    )
+
+    neighbour_offsets = np.array(
+        [[y, x] for y in range(-1, 2) for x in range(-1, 2)], dtype="int"
+    )
+    child_offsets = np.array([[0, 0], [0, 1], [1, 0], [1, 1]], dtype="int")
+
+    cell_indexes = np.unique(
+        (cell_indexes[:, None, :] + neighbour_offsets[None, :, :]).reshape(-1, 2),
+        axis=0,
+    )
+
+    leaf_cell_indexes_of_levels = []
+
+    for level in range(refinement_levels + 1):
+
+        if tracer is None or level == refinement_levels or len(cell_indexes) == 0:
+            leaf_cell_indexes_of_levels.append(cell_indexes)
+            break
+
+        refine = refine_cells_from_cell_indexes_and_tracer(
+            cell_indexes=cell_indexes,
+            origin=origin,
+            cell_size=pixel_scale_interpolation_grid / 2 ** level,
+            tracer=tracer,
+            magnification_threshold=magnification_threshold,
+            deflection_accuracy=deflection_accuracy,
+        )
+
+        leaf_cell_indexes_of_levels.append(cell_indexes[~refine])
+
+        cell_indexes = (
+            2 * cell_indexes[refine][:, None, :] + child_offsets[None, :, :]
+        ).reshape(-1, 2)
+
+    finest_level = len(leaf_cell_indexes_of_levels) - 1
+
+    node_indexes = np.unique(
+        np.concatenate(
+            [
+                (
+                    (leaf_cell_indexes[:, None, :] + child_offsets[None, :, :])
+                    * 2 ** (finest_level - level)
+                ).reshape(-1, 2)
+                for level, leaf_cell_indexes in enumerate(leaf_cell_indexes_of_levels)
+            ]
+        ),
+        axis=0,
+    )
+
+    return grids.GridIrregular(
+        grid=origin
+        + node_indexes * (pixel_scale_interpolation_grid / 2 ** finest_level)
+    )
+
+
+def refine_cells_from_cell_indexes_and_tracer(
+    cell_indexes,
+    origin,
+    cell_size,
+    tracer,
+    magnification_threshold,
+    deflection_accuracy,
+):
+    """Determine which cells of one level of a quadtree interpolation grid are refined, by computing the tracer's \
+    deflection angles at every cell's four corners and centre in one call (see \
+    *interp_grid_from_grids_and_pixel_scale_interpolation_grid*)."""
+    total_cells = len(cell_indexes)
+
+    corners = (
+        origin
+        + (cell_indexes[:, None, :] + np.array([[0, 0], [0, 1], [1, 0], [1, 1]])[None])
+        * cell_size
+    )
+    centres = origin + (cell_indexes + 0.5) * cell_size
+
+    deflections = np.asarray(
+        tracer.deflections_from_grid(
+            grid=grids.GridIrregular(
+                grid=np.concatenate((corners.reshape(-1, 2), centres))
+            )
+        )
+    )
+
+    corner_deflections = deflections[: 4 * total_cells].reshape(total_cells, 4, 2)
+    centre_deflections = deflections[4 * total_cells :]
+
+    interpolation_errors = np.linalg.norm(
+        centre_deflections - np.mean(corner_deflections, axis=1), axis=1
+    )
+
+    lower, upper = corner_deflections[:, 0:2], corner_deflections[:, 2:4]
+    left, right = corner_deflections[:, 0::2], corner_deflections[:, 1::2]
+
+    dy = np.sum(upper - lower, axis=1) / (2.0 * cell_size)
+    dx = np.sum(right - left, axis=1) / (2.0 * cell_size)
+
+    det_jacobian = (1.0 - dy[:, 0]) * (1.0 - dx[:, 1]) - dx[:, 0] * dy[:, 1]
+
+    return (interpolation_errors > deflection_accuracy) | (
+        np.abs(det_jacobian) < 1.0 / magnification_threshold
+    )
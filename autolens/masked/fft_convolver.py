@@ -0,0 +1,247 @@
+import numpy as np
+import scipy.fft
+
+from autoarray.operators import convolver as conv
+from autolens import exc
+
+fft_cost_per_pixel_log_pixel = 4.0
+
+
+class FFTConvolver(conv.Convolver):
+    @classmethod
+    def from_convolver(cls, convolver):
+        """Create an FFT convolver from a real-space *Convolver*, reusing the frames it has already computed.
+
+        Light profile images are blurred using padded FFTs, whose cost does not depend on the PSF size, whereas \
+        the mapping matrices of an inversion are still blurred in real-space using the frames of the convolver \
+        (as each column of a mapping matrix only has a few non-zero entries).
+
+        The FFT shape and the FFT of the PSF are computed once, so every convolution performs only one forward \
+        and one inverse FFT of the image.
+
+        Parameters
+        ----------
+        convolver : aa.Convolver
+            The real-space convolver of the masked imaging.
+        """
+        fft_convolver = cls.__new__(cls)
+        fft_convolver.__dict__.update(convolver.__dict__)
+
+        kernel_shape_2d = convolver.kernel.shape_2d
+
+        region_origin, region_shape_2d = region_origin_and_shape_2d_from_convolver(
+            convolver=convolver
+        )
+
+        fft_convolver.image_2d_indexes = (
+            np.argwhere(~np.asarray(convolver.mask)) - region_origin
+        )
+        fft_convolver.blurring_2d_indexes = (
+            np.argwhere(~np.asarray(convolver.blurring_mask)) - region_origin
+        )
+        fft_convolver.region_shape_2d = region_shape_2d
+        fft_convolver.fft_shape_2d = fft_shape_2d_from_region_shape_2d_and_kernel_shape_2d(
+            region_shape_2d=fft_convolver.region_shape_2d,
+            kernel_shape_2d=kernel_shape_2d,
+        )
+        fft_convolver.kernel_fft = scipy.fft.rfft2(
+            np.asarray(convolver.kernel.in_2d), s=fft_convolver.fft_shape_2d
+        )
+
+        return fft_convolver
+
+    def convolved_image_from_image_and_blurring_image(self, image, blurring_image):
+        """For a given 1D array and blurring array, convolve the two using a padded FFT of this convolver's PSF.
+
+        Parameters
+        -----------
+        image : ndarray
+            1D array of the values which are to be blurred with the convolver's PSF.
+        blurring_image : ndarray
+            1D array of the blurring values which blur into the array after PSF convolution.
+        """
+
+        array_2d = np.zeros(self.region_shape_2d)
+
+        array_2d[
+            self.image_2d_indexes[:, 0], self.image_2d_indexes[:, 1]
+        ] = image.in_1d_binned
+        array_2d[
+            self.blurring_2d_indexes[:, 0], self.blurring_2d_indexes[:, 1]
+        ] = blurring_image.in_1d_binned
+
+        convolved_array_2d = scipy.fft.irfft2(
+            scipy.fft.rfft2(array_2d, s=self.fft_shape_2d) * self.kernel_fft,
+            s=self.fft_shape_2d,
+        )
+
+        kernel_shape_2d = self.kernel.shape_2d
+
+        convolved_image = convolved_array_2d[
+            self.image_2d_indexes[:, 0] + kernel_shape_2d[0] // 2,
+            self.image_2d_indexes[:, 1] + kernel_shape_2d[1] // 2,
+        ]
+
+        return self.mask.mapping.array_stored_1d_from_array_1d(array_1d=convolved_image)
+
+    def convolved_images_from_images_and_blurring_images(self, images, blurring_images):
+        """For a batch of 1D arrays and blurring arrays, convolve every pair with this convolver's PSF using one \
+        padded FFT of all of them stacked, such that the transforms of the batch are performed in a single call.
+
+        Parameters
+        -----------
+        images : [ndarray]
+            The 1D arrays of the values which are to be blurred with the convolver's PSF.
+        blurring_images : [ndarray]
+            The 1D blurring arrays which blur into each array after PSF convolution.
+
+        Returns
+        -------
+        convolved_images : ndarray
+            A 2D array of shape (total_images, pixels_in_mask) containing every convolved image.
+        """
+
+        arrays_2d = np.zeros((len(images),) + tuple(self.region_shape_2d))
+
+        arrays_2d[:, self.image_2d_indexes[:, 0], self.image_2d_indexes[:, 1]] = [
+            image.in_1d_binned for image in images
+        ]
+        arrays_2d[:, self.blurring_2d_indexes[:, 0], self.blurring_2d_indexes[:, 1]] = [
+            blurring_image.in_1d_binned for blurring_image in blurring_images
+        ]
+
+        convolved_arrays_2d = scipy.fft.irfft2(
+            scipy.fft.rfft2(arrays_2d, s=self.fft_shape_2d) * self.kernel_fft,
+            s=self.fft_shape_2d,
+        )
+
+        kernel_shape_2d = self.kernel.shape_2d
+
+        return convolved_arrays_2d[
+            :,
+            self.image_2d_indexes[:, 0] + kernel_shape_2d[0] // 2,
+            self.image_2d_indexes[:, 1] + kernel_shape_2d[1] // 2,
+        ]
+
+
+def convolved_images_from_convolver_images_and_blurring_images(
+    convolver, images, blurring_images
+):
+    """Convolve a batch of 1D arrays and blurring arrays with a convolver's PSF, returning a 2D array of shape \
+    (total_images, pixels_in_mask).
+
+    An *FFTConvolver* blurs the whole batch with one stacked FFT, whereas a real-space convolver blurs each image \
+    in turn, as the cost of real-space convolution does not change by batching it.
+
+    Parameters
+    ----------
+    convolver : aa.Convolver or FFTConvolver
+        The convolver of the masked imaging.
+    images : [aa.Array]
+        The 1D arrays of the values which are to be blurred with the convolver's PSF.
+    blurring_images : [aa.Array]
+        The 1D blurring arrays which blur into each array after PSF convolution.
+    """
+
+    if isinstance(convolver, FFTConvolver):
+        return convolver.convolved_images_from_images_and_blurring_images(
+            images=images, blurring_images=blurring_images
+        )
+
+    return np.stack(
+        [
+            np.asarray(
+                convolver.convolved_image_from_image_and_blurring_image(
+                    image=image, blurring_image=blurring_image
+                )
+            )
+            for image, blurring_image in zip(images, blurring_images)
+        ]
+    )
+
+
+def region_origin_and_shape_2d_from_convolver(convolver):
+    """The origin and shape of the smallest rectangular region of a convolver's mask which contains every image and \
+    blurring pixel, which is the only region FFT convolution needs to transform."""
+
+    unmasked_2d_indexes = np.argwhere(
+        ~(np.asarray(convolver.mask) & np.asarray(convolver.blurring_mask))
+    )
+
+    region_origin = np.min(unmasked_2d_indexes, axis=0)
+
+    return (
+        region_origin,
+        tuple(np.max(unmasked_2d_indexes, axis=0) - region_origin + 1),
+    )
+
+
+def fft_shape_2d_from_region_shape_2d_and_kernel_shape_2d(
+    region_shape_2d, kernel_shape_2d
+):
+    """The shape of the padded FFTs used to convolve a region of an image with a kernel, which is large enough to \
+    avoid wrap-around and rounded up to sizes the FFT computes fastest."""
+    return tuple(
+        scipy.fft.next_fast_len(region_size + kernel_size - 1, real=True)
+        for region_size, kernel_size in zip(region_shape_2d, kernel_shape_2d)
+    )
+
+
+def convolution_backend_from_convolver(convolver):
+    """Choose the convolution backend which blurs an image fastest with a convolver.
+
+    Real-space convolution costs one multiplication for every PSF pixel of every image and blurring pixel, whereas \
+    FFT convolution costs of order N log N for the N pixels of the padded region containing them. Small PSFs (e.g. \
+    HST) are therefore fastest in real-space, whereas the large PSFs of JWST or ground-based seeing are fastest \
+    with FFTs.
+    """
+
+    kernel_shape_2d = convolver.kernel.shape_2d
+
+    real_space_cost = (convolver.pixels_in_mask + convolver.pixels_in_blurring_mask) * (
+        kernel_shape_2d[0] * kernel_shape_2d[1]
+    )
+
+    region_origin, region_shape_2d = region_origin_and_shape_2d_from_convolver(
+        convolver=convolver
+    )
+
+    fft_pixels = np.prod(
+        fft_shape_2d_from_region_shape_2d_and_kernel_shape_2d(
+            region_shape_2d=region_shape_2d, kernel_shape_2d=kernel_shape_2d
+        )
+    )
+
+    fft_cost = fft_cost_per_pixel_log_pixel * fft_pixels * np.log2(fft_pixels)
+
+    if fft_cost < real_space_cost:
+        return "fft"
+
+    return "real_space"
+
+
+def convolver_from_convolver_and_convolution_backend(convolver, convolution_backend):
+    """Return the convolver of a masked imaging for a convolution backend, which is either the input real-space \
+    convolver, an FFT convolver, or whichever is faster if the backend is "auto".
+
+    Parameters
+    ----------
+    convolver : aa.Convolver
+        The real-space convolver of the masked imaging.
+    convolution_backend : str
+        "real_space", "fft" or "auto".
+    """
+
+    if convolution_backend == "auto":
+        convolution_backend = convolution_backend_from_convolver(convolver=convolver)
+
+    if convolution_backend == "real_space":
+        return convolver
+    elif convolution_backend == "fft":
+        return FFTConvolver.from_convolver(convolver=convolver)
+
+    raise exc.SettingsException(
+        "The convolution backend must be real_space, fft or auto, not {}".format(
+            convolution_backend
+        )
+    )
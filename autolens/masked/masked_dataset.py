@@ -1,6 +1,12 @@
-from autoarray.structures import grids
+from autoarray.structures import grids, kernel
 from autoarray.masked import masked_dataset
 from autolens.fit import fit
+from autolens.lens import linear_operator_inversion
+from autolens.lens import ray_tracing
+from autolens.masked import adaptive_interpolator
+from autolens.masked import fft_convolver
+from autolens.masked import nufft_transformer
+from autolens.masked import visibility_compressor
 from autolens import exc
 
 
@@ -31,6 +37,18 @@ class AbstractLensMasked:
             ):
                 raise exc.RayTracingException
 
+    def check_positions_trace_within_threshold_via_galaxies(self, galaxies, cosmology):
+        """Check the positions trace within the threshold using a tracer of only the galaxies with a mass profile, \
+        such that a model is rejected before the tracer of all galaxies (and their hyper images) is set up."""
+
+        if self.positions is not None and self.positions_threshold is not None:
+
+            self.check_positions_trace_within_threshold_via_tracer(
+                tracer=ray_tracing.Tracer.from_galaxies_with_mass_profiles(
+                    galaxies=galaxies, cosmology=cosmology
+                )
+            )
+
     def check_inversion_pixels_are_below_limit_via_tracer(self, tracer):
 
         if self.inversion_pixel_limit is not None:
@@ -53,6 +71,10 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
         positions=None,
         positions_threshold=None,
         preload_sparse_grids_of_planes=None,
+        interpolation_refinement_levels=None,
+        preload_interpolation_tracer=None,
+        convolution_backend="auto",
+        inversion_uses_sparse_matrices=False,
     ):
         """
         The lens dataset is the collection of data_type (image, noise-map, PSF), a mask, grid, convolver \
@@ -82,13 +104,34 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
         inversion_pixel_limit : int or None
             The maximum number of pixels that can be used by an inversion, with the limit placed primarily to speed \
             up run.
+        interpolation_refinement_levels : int or None
+            If not *None*, the deflection angles are interpolated from an adaptive quadtree grid, whose cells of size \
+            *pixel_scale_interpolation_grid* are split up to this many times around the critical curves and where \
+            the deflection angles vary rapidly. One interpolation grid is shared by the grid, sub and blurring grids.
+        preload_interpolation_tracer : ray_tracing.Tracer or None
+            The tracer (e.g. the most likely tracer of a previous phase) whose deflection angles decide where the \
+            adaptive interpolation grid is refined. If *None* the adaptive interpolation grid is uniform.
+        convolution_backend : str
+            How light profile images are blurred by the convolver: "real_space" convolves the masked pixels directly, \
+            "fft" uses padded FFTs whose cost does not depend on the PSF size and "auto" chooses whichever is faster \
+            for the mask and PSF shape.
+        inversion_uses_sparse_matrices : bool
+            If *True*, inversions represent the mapping matrix and blurred mapping matrix as sparse matrices, which \
+            reduces their memory and run-time for large masks and pixelizations.
         """
 
+        adaptive_interpolation = (
+            pixel_scale_interpolation_grid is not None
+            and interpolation_refinement_levels is not None
+        )
+
         super(MaskedImaging, self).__init__(
             imaging=imaging,
             mask=mask,
             psf_shape_2d=psf_shape_2d,
-            pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+            pixel_scale_interpolation_grid=None
+            if adaptive_interpolation
+            else pixel_scale_interpolation_grid,
             inversion_pixel_limit=inversion_pixel_limit,
             inversion_uses_border=inversion_uses_border,
         )
@@ -100,6 +143,40 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
         )
 
+        self.pixel_scale_interpolation_grid = pixel_scale_interpolation_grid
+        self.interpolation_refinement_levels = interpolation_refinement_levels
+        self.preload_interpolation_tracer = preload_interpolation_tracer
+        self.convolution_backend = convolution_backend
+        self.inversion_uses_sparse_matrices = inversion_uses_sparse_matrices
+
+        if getattr(self, "convolver", None) is not None:
+            self.convolver = fft_convolver.convolver_from_convolver_and_convolution_backend(
+                convolver=self.convolver, convolution_backend=convolution_backend
+            )
+
+        if adaptive_interpolation and self.grid is not None:
+
+            grids_ = [self.grid]
+
+            if getattr(self, "blurring_grid", None) is not None:
+                grids_.append(self.blurring_grid)
+
+            interp_grid = adaptive_interpolator.interp_grid_from_grids_and_pixel_scale_interpolation_grid(
+                grids_=grids_,
+                pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+                tracer=preload_interpolation_tracer,
+                refinement_levels=interpolation_refinement_levels,
+            )
+
+            interpolators = adaptive_interpolator.AdaptiveInterpolator.list_from_grids_and_interp_grid(
+                grids_=grids_,
+                interp_grid=interp_grid,
+                pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+            )
+
+            for grid, interpolator in zip(grids_, interpolators):
+                grid.interpolator = interpolator
+
     def binned_from_bin_up_factor(self, bin_up_factor):
 
         binned_imaging = self.imaging.binned_from_bin_up_factor(
@@ -119,6 +196,10 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
             positions=self.positions,
             positions_threshold=self.positions_threshold,
             preload_sparse_grids_of_planes=self.preload_sparse_grids_of_planes,
+            interpolation_refinement_levels=self.interpolation_refinement_levels,
+            preload_interpolation_tracer=self.preload_interpolation_tracer,
+            convolution_backend=self.convolution_backend,
+            inversion_uses_sparse_matrices=self.inversion_uses_sparse_matrices,
         )
 
     def signal_to_noise_limited_from_signal_to_noise_limit(self, signal_to_noise_limit):
@@ -137,6 +218,10 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
             positions=self.positions,
             positions_threshold=self.positions_threshold,
             preload_sparse_grids_of_planes=self.preload_sparse_grids_of_planes,
+            interpolation_refinement_levels=self.interpolation_refinement_levels,
+            preload_interpolation_tracer=self.preload_interpolation_tracer,
+            convolution_backend=self.convolution_backend,
+            inversion_uses_sparse_matrices=self.inversion_uses_sparse_matrices,
         )
 
 
@@ -153,6 +238,8 @@ class MaskedInterferometer(masked_dataset.MaskedInterferometer, AbstractLensMask
         positions=None,
         positions_threshold=None,
         preload_sparse_grids_of_planes=None,
+        transform_backend="dft",
+        inversion_uses_linear_operators=False,
     ):
         """
         The lens dataset is the collection of data_type (image, noise-map, primary_beam), a mask, grid, convolver \
@@ -182,23 +269,133 @@ class MaskedInterferometer(masked_dataset.MaskedInterferometer, AbstractLensMask
         inversion_pixel_limit : int or None
             The maximum number of pixels that can be used by an inversion, with the limit placed primarily to speed \
             up run.
+        transform_backend : str
+            How images are transformed to visibilities by the transformer: "dft" uses a direct Fourier transform \
+            whose cost scales with the number of visibilities times the number of image pixels, whereas "nufft" \
+            uses a non-uniform FFT whose cost scales with their sum (see *nufft_transformer.NUFFTTransformer*).
+        inversion_uses_linear_operators : bool
+            If *True*, the curvature kernel of the uv coverage is computed once and inversions compute their \
+            curvature matrix from it in image space, instead of from transformed mapping matrices whose size scales \
+            with the number of visibilities (see *linear_operator_inversion.CurvatureKernel*).
         """
 
         self.interferometer = interferometer
 
-        super(MaskedInterferometer, self).__init__(
-            interferometer=interferometer,
-            visibilities_mask=visibilities_mask,
-            real_space_mask=real_space_mask,
-            primary_beam_shape_2d=primary_beam_shape_2d,
+        # The masked interferometer of autoarray always creates a direct Fourier transformer, whose preloaded
+        # transforms have one entry for every image pixel and visibility, so its attributes are set up here instead.
+
+        masked_dataset.AbstractMaskedDataset.__init__(
+            self=self,
+            mask=real_space_mask,
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
             inversion_pixel_limit=inversion_pixel_limit,
             inversion_uses_border=inversion_uses_border,
         )
 
+        self.pixel_scale_interpolation_grid = pixel_scale_interpolation_grid
+
+        if self.interferometer.primary_beam is None:
+            self.primary_beam_shape_2d = None
+        elif primary_beam_shape_2d is None:
+            self.primary_beam_shape_2d = self.interferometer.primary_beam.shape_2d
+        else:
+            self.primary_beam_shape_2d = primary_beam_shape_2d
+
+        if self.primary_beam_shape_2d is not None:
+            self.primary_beam = kernel.Kernel.manual_2d(
+                array=interferometer.primary_beam.resized_from_new_shape(
+                    new_shape=self.primary_beam_shape_2d
+                ).in_2d
+            )
+
+        self.transform_backend = transform_backend
+
+        self.transformer = nufft_transformer.transformer_from_uv_wavelengths_grid_radians_and_transform_backend(
+            uv_wavelengths=interferometer.uv_wavelengths,
+            grid_radians=self.grid.in_1d_binned.in_radians,
+            transform_backend=transform_backend,
+        )
+
+        self.visibilities = interferometer.visibilities
+        self.noise_map = interferometer.noise_map
+        self.visibilities_mask = visibilities_mask
+
+        self.inversion_uses_linear_operators = inversion_uses_linear_operators
+
+        if inversion_uses_linear_operators:
+            self.curvature_kernel = linear_operator_inversion.CurvatureKernel.from_transformer_and_noise_map(
+                transformer=self.transformer, noise_map=self.noise_map
+            )
+        else:
+            self.curvature_kernel = None
+
         AbstractLensMasked.__init__(
             self=self,
             positions=positions,
             positions_threshold=positions_threshold,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
         )
+
+        self.visibility_compression = None
+
+    def compressed_from_uv_cell_size(self, uv_cell_size):
+        """Compress the visibilities into cells of a uniform grid in the uv plane, returning a masked \
+        interferometer which fits the noise-weighted average visibility of every cell (see \
+        *visibility_compressor.VisibilityCompression*).
+
+        The *visibility_compression* of the returned masked interferometer records the information lost by the \
+        compression and keeps the uncompressed dataset, which *uncompressed* restores.
+
+        Parameters
+        ----------
+        uv_cell_size : float
+            The size of a uv cell in wavelengths.
+        """
+
+        visibility_compression = visibility_compressor.VisibilityCompression.from_interferometer_visibilities_mask_and_uv_cell_size(
+            interferometer=self.interferometer,
+            visibilities_mask=self.visibilities_mask,
+            uv_cell_size=uv_cell_size,
+        )
+
+        masked_interferometer = self.__class__(
+            interferometer=visibility_compression.interferometer,
+            visibilities_mask=visibility_compression.visibilities_mask,
+            real_space_mask=self.mask,
+            primary_beam_shape_2d=self.primary_beam_shape_2d,
+            pixel_scale_interpolation_grid=self.pixel_scale_interpolation_grid,
+            inversion_pixel_limit=self.inversion_pixel_limit,
+            inversion_uses_border=self.inversion_uses_border,
+            positions=self.positions,
+            positions_threshold=self.positions_threshold,
+            preload_sparse_grids_of_planes=self.preload_sparse_grids_of_planes,
+            transform_backend=self.transform_backend,
+            inversion_uses_linear_operators=self.inversion_uses_linear_operators,
+        )
+
+        masked_interferometer.visibility_compression = visibility_compression
+
+        return masked_interferometer
+
+    @property
+    def uncompressed(self):
+        """The masked interferometer of the visibilities before they were compressed, which is this masked \
+        interferometer if they are not compressed."""
+
+        if self.visibility_compression is None:
+            return self
+
+        return self.__class__(
+            interferometer=self.visibility_compression.uncompressed_interferometer,
+            visibilities_mask=self.visibility_compression.uncompressed_visibilities_mask,
+            real_space_mask=self.mask,
+            primary_beam_shape_2d=self.primary_beam_shape_2d,
+            pixel_scale_interpolation_grid=self.pixel_scale_interpolation_grid,
+            inversion_pixel_limit=self.inversion_pixel_limit,
+            inversion_uses_border=self.inversion_uses_border,
+            positions=self.positions,
+            positions_threshold=self.positions_threshold,
+            preload_sparse_grids_of_planes=self.preload_sparse_grids_of_planes,
+            transform_backend=self.transform_backend,
+            inversion_uses_linear_operators=self.inversion_uses_linear_operators,
+        )
@@ -0,0 +1,409 @@
+import numpy as np
+import scipy.fft
+import scipy.sparse
+
+from autoarray.operators import transformer as trans
+from autoarray.structures import visibilities as vis
+from autolens import exc
+
+
+class NUFFTTransformer(trans.Transformer):
+    def __init__(
+        self, uv_wavelengths, grid_radians, kernel_width=6, oversampling_factor=2.0
+    ):
+        """A transformer which computes the visibilities of an image using a non-uniform FFT, as opposed to the \
+        direct Fourier transform of a *Transformer*.
+
+        The image is divided by the Fourier transform of a Kaiser-Bessel gridding kernel (deapodized), zero-padded \
+        to an oversampled grid and FFT'd. The visibility at every uv coordinate is then interpolated from the \
+        *kernel_width* x *kernel_width* closest cells of the FFT, using weights which only depend on the uv \
+        coordinates and are therefore computed once and stored as a sparse matrix.
+
+        The cost of a transform is therefore O(N_grid log N_grid + N_vis * kernel_width^2), instead of the \
+        O(N_vis * N_pix) of a direct Fourier transform, and no (N_pix, N_vis) preloaded transforms are stored.
+
+        The image pixels must lie on a uniform grid (e.g. the unmasked pixels of a real-space mask).
+
+        Parameters
+        ----------
+        uv_wavelengths : ndarray
+            The (u,v) coordinates of every visibility in wavelengths.
+        grid_radians : aa.Grid
+            The (y,x) coordinates of every image pixel in radians.
+        kernel_width : int
+            The number of oversampled FFT cells (along each dimension) the visibilities are interpolated from. \
+            Larger kernels are more accurate but interpolate more slowly.
+        oversampling_factor : float
+            The factor by which the FFT grid is larger than the image (along each dimension). Larger factors are \
+            more accurate but require larger FFTs.
+        """
+
+        super(NUFFTTransformer, self).__init__(
+            uv_wavelengths=uv_wavelengths,
+            grid_radians=grid_radians,
+            preload_transform=False,
+        )
+
+        self.kernel_width = kernel_width
+        self.oversampling_factor = oversampling_factor
+
+        grid_radians = np.asarray(self.grid_radians)
+
+        self.image_2d_indexes, self.pixel_scales_radians, self.image_shape_2d = image_2d_indexes_from_grid_radians(
+            grid_radians=grid_radians
+        )
+
+        self.fft_shape_2d = fft_shape_2d_from_shape_2d_and_oversampling_factor(
+            shape_2d=self.image_shape_2d, oversampling_factor=oversampling_factor
+        )
+
+        self.beta = kaiser_bessel_beta_from_kernel_width_and_oversampling_factor(
+            kernel_width=kernel_width, oversampling_factor=oversampling_factor
+        )
+
+        image_centre_2d_indexes = np.array(self.image_shape_2d) // 2
+
+        centred_image_2d_indexes = self.image_2d_indexes - image_centre_2d_indexes
+
+        self.deapodization = deapodization_from(
+            centred_2d_indexes=centred_image_2d_indexes,
+            fft_shape_2d=self.fft_shape_2d,
+            kernel_width=kernel_width,
+            beta=self.beta,
+        )
+
+        self.fft_2d_indexes = np.mod(centred_image_2d_indexes, self.fft_shape_2d)
+
+        self.interpolation_matrix = interpolation_matrix_from(
+            uv_frequencies=uv_frequencies_from_uv_wavelengths_and_pixel_scales_radians(
+                uv_wavelengths=self.uv_wavelengths,
+                pixel_scales_radians=self.pixel_scales_radians,
+            ),
+            fft_shape_2d=self.fft_shape_2d,
+            kernel_width=kernel_width,
+            beta=self.beta,
+        )
+
+        centre_radians = np.min(grid_radians, axis=0) + image_centre_2d_indexes * (
+            self.pixel_scales_radians
+        )
+
+        self.phase_shifts = np.exp(
+            -2.0j
+            * np.pi
+            * (
+                centre_radians[1] * self.uv_wavelengths[:, 0]
+                + centre_radians[0] * self.uv_wavelengths[:, 1]
+            )
+        )
+
+    def complex_visibilities_from_images(self, images):
+        """Compute the complex visibilities of a stack of 1D images, which are transformed together using one \
+        batched FFT and one sparse matrix-matrix product.
+
+        Parameters
+        ----------
+        images : ndarray
+            The 1D images of shape (total_images, total_image_pixels).
+
+        Returns
+        -------
+        ndarray
+            The complex visibilities of every image, of shape (total_visibilities, total_images).
+        """
+
+        images = np.asarray(images, dtype="float")
+
+        fft_grid = np.zeros((images.shape[0],) + self.fft_shape_2d)
+
+        fft_grid[:, self.fft_2d_indexes[:, 0], self.fft_2d_indexes[:, 1]] = (
+            images * self.deapodization
+        )
+
+        fft_grid = scipy.fft.fft2(fft_grid, axes=(1, 2)).reshape(images.shape[0], -1)
+
+        return self.phase_shifts[:, None] * (self.interpolation_matrix @ fft_grid.T)
+
+    def complex_visibilities_from_image(self, image):
+        return self.complex_visibilities_from_images(
+            images=np.asarray(image.in_1d_binned)[None, :]
+        )[:, 0]
+
+    def complex_image_from_complex_visibilities(self, complex_visibilities):
+        """Compute the adjoint of the transform of this transformer for a set of complex visibilities, which is the \
+        1D image sum_v V_v exp(+2 pi i x.u_v) (e.g. the dirty image of noise-weighted visibilities).
+
+        The visibilities are gridded onto the oversampled FFT grid using the transpose of the interpolation matrix, \
+        inverse FFT'd and deapodized, which is exactly the adjoint of *complex_visibilities_from_images*.
+
+        Parameters
+        ----------
+        complex_visibilities : ndarray
+            The complex visibilities of shape (total_visibilities,).
+        """
+
+        fft_grid = self.interpolation_matrix.T @ (
+            np.conj(self.phase_shifts) * complex_visibilities
+        )
+
+        fft_grid = scipy.fft.ifft2(fft_grid.reshape(self.fft_shape_2d)) * np.prod(
+            self.fft_shape_2d
+        )
+
+        return (
+            fft_grid[self.fft_2d_indexes[:, 0], self.fft_2d_indexes[:, 1]]
+            * self.deapodization
+        )
+
+    def real_visibilities_from_image(self, image):
+        return self.complex_visibilities_from_image(image=image).real
+
+    def imag_visibilities_from_image(self, image):
+        return self.complex_visibilities_from_image(image=image).imag
+
+    def visibilities_from_image(self, image):
+
+        complex_visibilities = self.complex_visibilities_from_image(image=image)
+
+        return vis.Visibilities(
+            visibilities_1d=np.stack(
+                (complex_visibilities.real, complex_visibilities.imag), axis=-1
+            )
+        )
+
+    def transformed_mapping_matrices_from_mapping_matrix(self, mapping_matrix):
+
+        transformed_mapping_matrix = self.complex_visibilities_from_images(
+            images=np.asarray(mapping_matrix).T
+        )
+
+        return [transformed_mapping_matrix.real, transformed_mapping_matrix.imag]
+
+    def real_transformed_mapping_matrix_from_mapping_matrix(self, mapping_matrix):
+        return self.transformed_mapping_matrices_from_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )[0]
+
+    def imag_transformed_mapping_matrix_from_mapping_matrix(self, mapping_matrix):
+        return self.transformed_mapping_matrices_from_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )[1]
+
+
+def image_2d_indexes_from_grid_radians(grid_radians):
+    """Compute the 2D indexes of every pixel of a grid on the uniform grid of pixels it lies on, the pixel scales of \
+    that grid and its shape. The y index increases with the y coordinate, so a grid is indexed upside-down relative \
+    to its mask, which does not change its Fourier transform.
+
+    Parameters
+    ----------
+    grid_radians : ndarray
+        The (y,x) coordinates of every image pixel in radians.
+    """
+
+    grid_min = np.min(grid_radians, axis=0)
+
+    pixel_scales_radians = np.array(
+        [
+            pixel_scale_from_coordinates(coordinates=grid_radians[:, axis])
+            for axis in range(2)
+        ]
+    )
+
+    image_2d_indexes = np.rint((grid_radians - grid_min) / pixel_scales_radians).astype(
+        "int"
+    )
+
+    if not np.allclose(
+        grid_min + image_2d_indexes * pixel_scales_radians,
+        grid_radians,
+        rtol=0.0,
+        atol=1.0e-6 * np.max(pixel_scales_radians),
+    ):
+        raise exc.SettingsException(
+            "The NUFFT transformer requires the image pixels to lie on a uniform grid"
+        )
+
+    return (
+        image_2d_indexes,
+        pixel_scales_radians,
+        tuple(np.max(image_2d_indexes, axis=0) + 1),
+    )
+
+
+def pixel_scale_from_coordinates(coordinates):
+    """The smallest spacing between the unique values of a grid's coordinates along one axis, which for a grid with \
+    a single value along that axis is taken to be 1 (as it does not change the transform)."""
+
+    spacings = np.diff(np.unique(coordinates))
+    spacings = spacings[spacings > 1.0e-6 * np.max(np.abs(coordinates))]
+
+    if spacings.size == 0:
+        return 1.0
+
+    return np.min(spacings)
+
+
+def fft_shape_2d_from_shape_2d_and_oversampling_factor(shape_2d, oversampling_factor):
+    """The shape of the oversampled FFT grid of a NUFFT, rounded up to sizes the FFT computes fastest."""
+    return tuple(
+        scipy.fft.next_fast_len(int(np.ceil(oversampling_factor * size)))
+        for size in shape_2d
+    )
+
+
+def uv_frequencies_from_uv_wavelengths_and_pixel_scales_radians(
+    uv_wavelengths, pixel_scales_radians
+):
+    """Convert the (u,v) coordinates of visibilities in wavelengths to the (y,x) frequencies of a uniform grid of \
+    pixels in cycles per pixel. The u and v coordinates are the Fourier transform along the x (second) and y \
+    (first) axes of the image respectively."""
+    return np.stack(
+        (
+            uv_wavelengths[:, 1] * pixel_scales_radians[0],
+            uv_wavelengths[:, 0] * pixel_scales_radians[1],
+        ),
+        axis=-1,
+    )
+
+
+def deapodization_from(centred_2d_indexes, fft_shape_2d, kernel_width, beta):
+    """The factor every pixel of an image is multiplied by to correct for the apodization of the Kaiser-Bessel \
+    gridding kernel, given the pixel's 2D index relative to the centre of the image."""
+    return 1.0 / np.prod(
+        [
+            kaiser_bessel_fourier_transform_from(
+                frequencies=centred_2d_indexes[:, axis] / fft_shape_2d[axis],
+                kernel_width=kernel_width,
+                beta=beta,
+            )
+            for axis in range(2)
+        ],
+        axis=0,
+    )
+
+
+def kaiser_bessel_beta_from_kernel_width_and_oversampling_factor(
+    kernel_width, oversampling_factor
+):
+    """The shape parameter of a Kaiser-Bessel gridding kernel which minimizes the aliasing error of a NUFFT for a \
+    given kernel width and oversampling factor (Beatty et al. 2005)."""
+    return np.pi * np.sqrt(
+        (kernel_width / oversampling_factor) ** 2.0 * (oversampling_factor - 0.5) ** 2.0
+        - 0.8
+    )
+
+
+def kaiser_bessel_kernel_from(distances, kernel_width, beta):
+    """The Kaiser-Bessel gridding kernel, evaluated at distances (in units of FFT cells) from the kernel centre."""
+
+    distances = np.asarray(distances)
+
+    argument = 1.0 - (2.0 * distances / kernel_width) ** 2.0
+
+    return np.where(
+        argument >= 0.0, np.i0(beta * np.sqrt(np.maximum(argument, 0.0))), 0.0
+    )
+
+
+def kaiser_bessel_fourier_transform_from(frequencies, kernel_width, beta):
+    """The Fourier transform of the Kaiser-Bessel gridding kernel, evaluated at frequencies in cycles per FFT cell, \
+    which the image is divided by before it is FFT'd to correct for the kernel's apodization."""
+
+    argument = np.sqrt(
+        beta ** 2.0 - (np.pi * kernel_width * np.asarray(frequencies)) ** 2.0 + 0.0j
+    )
+
+    return (kernel_width * np.sinh(argument) / argument).real
+
+
+def interpolation_matrix_from(uv_frequencies, fft_shape_2d, kernel_width, beta):
+    """Compute the sparse matrix which interpolates the visibilities at uv coordinates from an oversampled FFT of an \
+    image, whose rows contain the Kaiser-Bessel weights of the kernel_width x kernel_width FFT cells closest to a \
+    visibility.
+
+    Parameters
+    ----------
+    uv_frequencies : ndarray
+        The (y,x) frequencies of every visibility in cycles per image pixel.
+    fft_shape_2d : (int, int)
+        The shape of the oversampled FFT.
+    kernel_width : int
+        The number of FFT cells (along each dimension) the visibilities are interpolated from.
+    beta : float
+        The shape parameter of the Kaiser-Bessel gridding kernel.
+    """
+
+    total_visibilities = uv_frequencies.shape[0]
+
+    offsets = np.arange(kernel_width)
+
+    fft_indexes_of_axes = []
+    weights_of_axes = []
+
+    for axis in range(2):
+
+        fft_coordinates = uv_frequencies[:, axis] * fft_shape_2d[axis]
+
+        fft_indexes = (
+            np.floor(fft_coordinates - kernel_width / 2.0).astype("int")[:, None]
+            + 1
+            + offsets[None, :]
+        )
+
+        weights_of_axes.append(
+            kaiser_bessel_kernel_from(
+                distances=fft_coordinates[:, None] - fft_indexes,
+                kernel_width=kernel_width,
+                beta=beta,
+            )
+        )
+        fft_indexes_of_axes.append(np.mod(fft_indexes, fft_shape_2d[axis]))
+
+    columns = (
+        fft_indexes_of_axes[0][:, :, None] * fft_shape_2d[1]
+        + fft_indexes_of_axes[1][:, None, :]
+    ).reshape(total_visibilities, -1)
+
+    weights = (weights_of_axes[0][:, :, None] * weights_of_axes[1][:, None, :]).reshape(
+        total_visibilities, -1
+    )
+
+    return scipy.sparse.csr_matrix(
+        (
+            weights.ravel(),
+            columns.ravel(),
+            np.arange(0, weights.size + 1, weights.shape[1]),
+        ),
+        shape=(total_visibilities, fft_shape_2d[0] * fft_shape_2d[1]),
+    )
+
+
+def transformer_from_uv_wavelengths_grid_radians_and_transform_backend(
+    uv_wavelengths, grid_radians, transform_backend
+):
+    """Return the transformer of a masked interferometer for a transform backend, which is either a *Transformer* \
+    performing a direct Fourier transform or a *NUFFTTransformer*.
+
+    Parameters
+    ----------
+    uv_wavelengths : ndarray
+        The (u,v) coordinates of every visibility in wavelengths.
+    grid_radians : aa.Grid
+        The (y,x) coordinates of every image pixel in radians.
+    transform_backend : str
+        "dft" or "nufft".
+    """
+
+    if transform_backend == "dft":
+        return trans.Transformer(
+            uv_wavelengths=uv_wavelengths, grid_radians=grid_radians
+        )
+    elif transform_backend == "nufft":
+        return NUFFTTransformer(
+            uv_wavelengths=uv_wavelengths, grid_radians=grid_radians
+        )
+
+    raise exc.SettingsException(
+        "The transform backend must be dft or nufft, not {}".format(transform_backend)
+    )
@@ -0,0 +1,285 @@
+import numpy as np
+
+import autoarray as aa
+from autolens import exc
+
+
+class VisibilityCompression:
+    def __init__(
+        self,
+        uv_cell_size,
+        compressed_indexes,
+        conjugates,
+        uv_wavelengths,
+        visibilities,
+        noise_map,
+        within_cell_chi_squared,
+        uncompressed_interferometer,
+        uncompressed_visibilities_mask,
+    ):
+        """The compression of the visibilities of an interferometer dataset into cells of a uniform grid in the uv \
+        plane, where every cell is a single visibility which is the noise-weighted average of the visibilities \
+        inside it.
+
+        Visibilities in the lower half of the uv plane are folded onto the upper half using the Hermitian symmetry \
+        of the visibilities of a real image, V(-u, -v) = V(u, v)*, before they are gridded.
+
+        The compression is lossless for a model whose visibilities are constant across a cell, and the difference \
+        between the visibilities inside each cell and their average is the information it loses. Two diagnostics of \
+        this loss are provided:
+
+        - *reduced_within_cell_chi_squared*, the chi-squared of the visibilities about their cell averages per \
+        degree of freedom, which is 1 if the visibilities vary within cells only by their noise and above 1 if the \
+        signal varies within cells.
+
+        - *maximum_phase_error_from_grid_radians*, the largest phase error the model visibilities of an image \
+        inside the real-space mask can have due to the offset of a visibility from the centre of its cell.
+
+        The uncompressed interferometer and visibilities mask are kept, such that the compression can be reversed.
+
+        Parameters
+        ----------
+        uv_cell_size : float
+            The size of a uv cell in wavelengths.
+        compressed_indexes : ndarray
+            The index of the compressed visibility every uncompressed visibility is averaged into, which is -1 for \
+            masked visibilities.
+        conjugates : ndarray
+            Whether every uncompressed visibility is conjugated when it is folded onto the upper half of the uv plane.
+        uv_wavelengths : ndarray
+            The noise-weighted mean (u, v) of the visibilities of every cell.
+        visibilities : aa.Visibilities
+            The compressed visibilities.
+        noise_map : aa.Visibilities
+            The noise-map of the compressed visibilities.
+        within_cell_chi_squared : float
+            The chi-squared of the uncompressed visibilities about the average of their cell.
+        uncompressed_interferometer : aa.Interferometer
+            The interferometer dataset before compression.
+        uncompressed_visibilities_mask : ndarray
+            The visibilities mask before compression.
+        """
+
+        self.uv_cell_size = uv_cell_size
+        self.compressed_indexes = compressed_indexes
+        self.conjugates = conjugates
+        self.uv_wavelengths = uv_wavelengths
+        self.visibilities = visibilities
+        self.noise_map = noise_map
+        self.within_cell_chi_squared = within_cell_chi_squared
+        self.uncompressed_interferometer = uncompressed_interferometer
+        self.uncompressed_visibilities_mask = uncompressed_visibilities_mask
+
+    @classmethod
+    def from_interferometer_visibilities_mask_and_uv_cell_size(
+        cls, interferometer, visibilities_mask, uv_cell_size
+    ):
+        """Compress the unmasked visibilities of an interferometer dataset into uv cells of a given size.
+
+        The real and imaginary parts of every cell are the inverse-variance weighted means of those of its \
+        visibilities, and their noise is the inverse square root of the sum of the inverse variances.
+
+        Parameters
+        ----------
+        interferometer : aa.Interferometer
+            The interferometer dataset whose visibilities are compressed.
+        visibilities_mask : ndarray
+            The mask of the visibilities, where a visibility is removed if its real or imaginary part is masked.
+        uv_cell_size : float
+            The size of a uv cell in wavelengths.
+        """
+
+        if uv_cell_size <= 0.0:
+            raise exc.SettingsException(
+                "The uv cell size of a visibility compression must be positive"
+            )
+
+        uv_wavelengths = np.asarray(interferometer.uv_wavelengths)
+        visibilities = np.asarray(interferometer.visibilities)
+        noise_map = np.asarray(interferometer.noise_map)
+
+        unmasked = ~np.any(np.asarray(visibilities_mask), axis=1)
+
+        conjugates = conjugates_from_uv_wavelengths(uv_wavelengths=uv_wavelengths)
+
+        folded_uv_wavelengths = np.where(
+            conjugates[:, None], -uv_wavelengths, uv_wavelengths
+        )
+        folded_visibilities = np.where(
+            conjugates[:, None], visibilities * np.array([1.0, -1.0]), visibilities
+        )
+
+        compressed_indexes = np.full(uv_wavelengths.shape[0], -1)
+        compressed_indexes[
+            unmasked
+        ] = compressed_indexes_from_uv_wavelengths_and_uv_cell_size(
+            uv_wavelengths=folded_uv_wavelengths[unmasked], uv_cell_size=uv_cell_size
+        )
+
+        total_compressed_visibilities = np.max(compressed_indexes) + 1
+
+        indexes = compressed_indexes[unmasked]
+        weights = 1.0 / np.square(noise_map[unmasked])
+
+        weights_sum = np.stack(
+            [
+                np.bincount(
+                    indexes,
+                    weights=weights[:, i],
+                    minlength=total_compressed_visibilities,
+                )
+                for i in range(2)
+            ],
+            axis=1,
+        )
+
+        compressed_visibilities = (
+            np.stack(
+                [
+                    np.bincount(
+                        indexes,
+                        weights=weights[:, i] * folded_visibilities[unmasked, i],
+                        minlength=total_compressed_visibilities,
+                    )
+                    for i in range(2)
+                ],
+                axis=1,
+            )
+            / weights_sum
+        )
+
+        uv_weights = np.mean(weights, axis=1)
+        uv_weights_sum = np.bincount(
+            indexes, weights=uv_weights, minlength=total_compressed_visibilities
+        )
+
+        compressed_uv_wavelengths = (
+            np.stack(
+                [
+                    np.bincount(
+                        indexes,
+                        weights=uv_weights * folded_uv_wavelengths[unmasked, i],
+                        minlength=total_compressed_visibilities,
+                    )
+                    for i in range(2)
+                ],
+                axis=1,
+            )
+            / uv_weights_sum[:, None]
+        )
+
+        within_cell_chi_squared = np.sum(
+            weights
+            * np.square(
+                folded_visibilities[unmasked] - compressed_visibilities[indexes]
+            )
+        )
+
+        return cls(
+            uv_cell_size=uv_cell_size,
+            compressed_indexes=compressed_indexes,
+            conjugates=conjugates,
+            uv_wavelengths=compressed_uv_wavelengths,
+            visibilities=aa.visibilities.manual_1d(
+                visibilities=compressed_visibilities
+            ),
+            noise_map=aa.visibilities.manual_1d(
+                visibilities=1.0 / np.sqrt(weights_sum)
+            ),
+            within_cell_chi_squared=within_cell_chi_squared,
+            uncompressed_interferometer=interferometer,
+            uncompressed_visibilities_mask=visibilities_mask,
+        )
+
+    @property
+    def total_uncompressed_visibilities(self):
+        return int(np.sum(self.compressed_indexes >= 0))
+
+    @property
+    def total_compressed_visibilities(self):
+        return self.uv_wavelengths.shape[0]
+
+    @property
+    def compression_factor(self):
+        return self.total_uncompressed_visibilities / self.total_compressed_visibilities
+
+    @property
+    def within_cell_degrees_of_freedom(self):
+        return 2 * (
+            self.total_uncompressed_visibilities - self.total_compressed_visibilities
+        )
+
+    @property
+    def reduced_within_cell_chi_squared(self):
+        if self.within_cell_degrees_of_freedom == 0:
+            return 0.0
+        return self.within_cell_chi_squared / self.within_cell_degrees_of_freedom
+
+    @property
+    def interferometer(self):
+        """The compressed interferometer dataset, whose primary beam is that of the uncompressed dataset."""
+        return aa.interferometer.manual(
+            visibilities=self.visibilities,
+            noise_map=self.noise_map,
+            uv_wavelengths=self.uv_wavelengths,
+            primary_beam=self.uncompressed_interferometer.primary_beam,
+        )
+
+    @property
+    def visibilities_mask(self):
+        return np.full(fill_value=False, shape=self.visibilities.shape)
+
+    def maximum_phase_error_from_grid_radians(self, grid_radians):
+        """The largest phase error (in radians) of the compressed model visibilities of an image on a grid, which \
+        is 2 pi times the largest product of the offset of a visibility from the mean (u, v) of its cell and the \
+        extent of the grid.
+
+        Parameters
+        ----------
+        grid_radians : aa.Grid
+            The (y,x) coordinates in radians of the real-space grid of the masked interferometer.
+        """
+
+        unmasked = self.compressed_indexes >= 0
+
+        uv_wavelengths = np.asarray(self.uncompressed_interferometer.uv_wavelengths)[
+            unmasked
+        ]
+        uv_wavelengths = np.where(
+            self.conjugates[unmasked, None], -uv_wavelengths, uv_wavelengths
+        )
+
+        uv_offsets = np.abs(
+            uv_wavelengths - self.uv_wavelengths[self.compressed_indexes[unmasked]]
+        )
+
+        grid_extent = np.max(np.abs(np.asarray(grid_radians)), axis=0)
+
+        return (
+            2.0
+            * np.pi
+            * np.max(
+                uv_offsets[:, 0] * grid_extent[1] + uv_offsets[:, 1] * grid_extent[0]
+            )
+        )
+
+
+def conjugates_from_uv_wavelengths(uv_wavelengths):
+    """Whether every visibility is in the lower half of the uv plane (v < 0, or v = 0 and u < 0), such that it is \
+    conjugated when it is folded onto the upper half."""
+    return (uv_wavelengths[:, 1] < 0.0) | (
+        (uv_wavelengths[:, 1] == 0.0) & (uv_wavelengths[:, 0] < 0.0)
+    )
+
+
+def compressed_indexes_from_uv_wavelengths_and_uv_cell_size(
+    uv_wavelengths, uv_cell_size
+):
+    """The index of the uv cell of every visibility, where the cells are numbered in order of their (u, v) indexes \
+    and only cells containing a visibility are numbered."""
+
+    cell_2d_indexes = np.floor(uv_wavelengths / uv_cell_size).astype("int")
+
+    _, compressed_indexes = np.unique(cell_2d_indexes, axis=0, return_inverse=True)
+
+    return compressed_indexes.reshape(-1)
@@ -1,3 +1,7 @@
+import hashlib
+
+import numpy as np
+
 import autofit as af
 from autoastro.galaxy import galaxy as g
 
@@ -19,9 +23,57 @@ class Result(af.Result):
         self.analysis = analysis
         self.optimizer = optimizer
 
+        self._cached_values = {}
+
+        self.instance_key = instance_key_from_instance(
+            instance=instance, analysis=analysis
+        )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_cached_values"] = {}
+        return state
+
+    def update_instance_key(self):
+        """Recompute the instance key, which must be called after the most likely instance or the hyper images of \
+        the analysis are changed in-place (e.g. the hyper galaxies a hyper phase sets on a copy of a result), such \
+        that values cached for the previous instance are recomputed."""
+        self.instance_key = instance_key_from_instance(
+            instance=self.instance, analysis=self.analysis
+        )
+
+    def cached_value_from_name_and_func(self, name, func):
+        """Return a value derived from the most likely instance (e.g. its tracer or fit), which is computed by the \
+        input function the first time it is accessed and cached in memory.
+
+        The cached value is stored with the instance key it was computed for and is recomputed if the instance key \
+        changes (see *update_instance_key*). Cached values are not pickled or deep copied, so a copied result (e.g. \
+        the result of a hyper phase) computes its own.
+
+        Parameters
+        ----------
+        name : str
+            The name the value is cached under.
+        func : func
+            Computes the value.
+        """
+
+        instance_key, value = self._cached_values.get(name, (None, None))
+
+        if instance_key != self.instance_key:
+
+            value = func()
+
+            self._cached_values[name] = (self.instance_key, value)
+
+        return value
+
     @property
     def most_likely_tracer(self):
-        return self.analysis.tracer_for_instance(instance=self.instance)
+        return self.cached_value_from_name_and_func(
+            name="most_likely_tracer",
+            func=lambda: self.analysis.tracer_for_instance(instance=self.instance),
+        )
 
     @property
     def path_galaxy_tuples(self) -> [(str, g.Galaxy)]:
@@ -29,3 +81,91 @@ class Result(af.Result):
         Tuples associating the names of galaxies with instances from the best fit
         """
         return self.instance.path_instance_tuples_for_class(cls=g.Galaxy)
+
+
+# Model instances and hyper galaxies are numbered by counters of every object created in the process.
+non_parameter_names = ("id", "component_number")
+
+
+def instance_key_from_instance(instance, analysis=None):
+    """A hash of the parameter values of a model instance, which is the same for instances with the same parameters \
+    (e.g. the most likely instance of a phase which is resumed) and differs if any parameter is changed.
+
+    The hyper galaxy images and hyper model image an analysis associates with the instance's galaxies (see \
+    *Analysis.associate_hyper_images*) are not parameters, but change every image computed for the instance, so a \
+    digest of their values is included in the hash.
+
+    Parameters
+    ----------
+    instance : af.ModelInstance
+        The instance whose parameters are hashed.
+    analysis : Analysis or None
+        The analysis whose hyper images are hashed with the instance.
+    """
+    hyper_image_dict = {
+        name: getattr(analysis, name, None)
+        for name in ("hyper_galaxy_image_path_dict", "hyper_model_image")
+    }
+
+    parameter_tuples = sorted(
+        parameter_tuples_from_object(obj=instance)
+        + parameter_tuples_from_object(obj=hyper_image_dict, path=("analysis",)),
+        key=lambda parameter_tuple: tuple(map(str, parameter_tuple[0])),
+    )
+
+    return hashlib.md5(repr(parameter_tuples).encode()).hexdigest()
+
+
+def array_digest_from_array(array):
+    """An md5 digest of the shape, type and values of an array (e.g. a hyper galaxy image)."""
+    array = np.ascontiguousarray(array)
+
+    digest = hashlib.md5(repr((array.shape, array.dtype.str)).encode())
+    digest.update(array.tobytes())
+
+    return digest.hexdigest()
+
+
+def parameter_tuples_from_object(obj, path=()):
+    """The (path, value) tuples of every parameter of an object (e.g. a model instance) and the objects it contains, \
+    where the class of every object is included so that swapping a profile for a different profile changes the \
+    parameters. Arrays (e.g. hyper galaxy images) are represented by a digest of their values (see \
+    *array_digest_from_array*), and attributes which differ between runs for the same parameters are skipped (see \
+    *non_parameter_names*).
+
+    Parameters
+    ----------
+    obj
+        The object whose parameters are returned.
+    path : tuple
+        The path of the object in the instance.
+    """
+
+    if obj is None or isinstance(obj, (bool, str)):
+        return [(path, obj)]
+
+    if isinstance(obj, (int, float, np.number)):
+        return [(path, float(obj))]
+
+    if isinstance(obj, np.ndarray):
+        return [(path, array_digest_from_array(array=obj))]
+
+    if isinstance(obj, dict):
+        items = obj.items()
+    elif isinstance(obj, (list, tuple)):
+        items = enumerate(obj)
+    elif hasattr(obj, "__dict__"):
+        items = obj.__dict__.items()
+    else:
+        return []
+
+    parameter_tuples = [(path, obj.__class__.__name__)]
+
+    for name, value in items:
+        if name in non_parameter_names or (
+            isinstance(name, str) and name.startswith("_")
+        ):
+            continue
+        parameter_tuples += parameter_tuples_from_object(obj=value, path=path + (name,))
+
+    return parameter_tuples
@@ -2,10 +2,13 @@ from astropy import cosmology as cosmo
 
 import autofit as af
 import autoarray as aa
+from autoarray.operators.inversion import pixelizations
+from autoastro.profiles import geometry_profiles
 from autofit.tools.phase import Dataset
 from autolens.pipeline.phase import abstract
 from autolens.pipeline.phase import extensions
 from autolens.pipeline.phase.dataset.result import Result
+from autolens.util import lens_util
 
 
 def isinstance_or_prior(obj, cls):
@@ -16,6 +19,18 @@ def isinstance_or_prior(obj, cls):
     return False
 
 
+def fixed_objects_from_model(model):
+    """The light and mass profiles and pixelizations of a model which are instances instead of models, such that the \
+    non-linear search passes the same objects to every fit and their quantities can be cached (see \
+    *lens_util.set_fixed_objects*)."""
+    return [
+        instance
+        for _, instance in model.path_instance_tuples_for_class(
+            (geometry_profiles.GeometryProfile, pixelizations.Pixelization)
+        )
+    ]
+
+
 class PhaseDataset(abstract.AbstractPhase):
     galaxies = af.PhaseProperty("galaxies")
 
@@ -65,6 +80,7 @@ class PhaseDataset(abstract.AbstractPhase):
         result: AbstractPhase.Result
             A result object comprising the best fit model and other hyper_galaxies.
         """
+        # A memory-mapped dataset (e.g. a MemoryMappedInterferometer) saves a reference to its files, not a copy.
         dataset.save(self.paths.phase_output_path)
         self.model = self.model.populate(results)
 
@@ -75,7 +91,14 @@ class PhaseDataset(abstract.AbstractPhase):
         self.customize_priors(results)
         self.assert_and_save_pickle()
 
-        result = self.run_analysis(analysis)
+        previous_fixed_objects = lens_util.set_fixed_objects(
+            objects=fixed_objects_from_model(model=self.model)
+        )
+
+        try:
+            result = self.run_analysis(analysis)
+        finally:
+            lens_util.set_fixed_objects(objects=previous_fixed_objects)
 
         return self.make_result(result=result, analysis=analysis)
 
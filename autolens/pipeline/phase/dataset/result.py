@@ -1,9 +1,19 @@
+import os
+
+import numpy as np
+
+from autoarray.structures import grids
 from autolens.pipeline.phase import abstract
 
 
 class Result(abstract.result.Result):
     @property
     def most_likely_fit(self):
+        return self.cached_value_from_name_and_func(
+            name="most_likely_fit", func=self.most_likely_fit_from_instance
+        )
+
+    def most_likely_fit_from_instance(self):
 
         hyper_image_sky = self.analysis.hyper_image_sky_for_instance(
             instance=self.instance
@@ -33,8 +43,157 @@ class Result(abstract.result.Result):
             if galaxy.pixelization is not None:
                 return galaxy.pixelization
 
+    @property
+    def arrays_path(self):
+        """The folder in the phase's output path the arrays of this result (its pixelization grids and hyper images) \
+        are saved to, so they are computed once and loaded by later phases, resumed runs and the aggregator.
+
+        The folder is named after the instance key of the result (see *instance_key_from_instance*), which hashes the \
+        most likely model and the hyper images of the analysis, so arrays saved by a previous run of the phase which \
+        found a different most likely model or used different hyper images are never loaded. If the result has no \
+        optimizer (and therefore no output path), *None* is returned and the arrays are always computed.
+        """
+
+        if self.optimizer is None:
+            return None
+
+        return os.path.join(
+            self.optimizer.paths.phase_output_path, "arrays", self.instance_key
+        )
+
+    def array_dict_from_arrays_path(self, name, keys, func):
+        """Load a dictionary of arrays saved in the arrays path as memory-mapped .npy files, computing and saving \
+        them first if any are missing.
+
+        Parameters
+        ----------
+        name : str
+            The name the files of the arrays begin with.
+        keys : [tuple]
+            The keys of the dictionary, each of which is a tuple of strings (e.g. the path of a galaxy).
+        func : func
+            Computes the dictionary of arrays, which is only called if they have not been saved.
+        """
+
+        arrays_path = self.arrays_path
+
+        if arrays_path is None:
+            return {key: np.asarray(array) for key, array in func().items()}
+
+        file_paths = {
+            key: os.path.join(arrays_path, "__".join((name,) + tuple(key)) + ".npy")
+            for key in keys
+        }
+
+        if not all(map(os.path.isfile, file_paths.values())):
+
+            array_dict = func()
+
+            for key, file_path in file_paths.items():
+                save_array_to_file_path(array=array_dict[key], file_path=file_path)
+
+        return {
+            key: np.load(file_path, mmap_mode="r")
+            for key, file_path in file_paths.items()
+        }
+
     @property
     def most_likely_pixelization_grids_of_planes(self):
-        return self.most_likely_tracer.sparse_image_plane_grids_of_planes_from_grid(
-            grid=self.most_likely_fit.grid
+        """The image-plane pixelization grids of every plane of the most likely tracer, which are used as the \
+        preloaded pixelization grids of later phases.
+
+        Computing these grids requires the most likely fit and, for a *VoronoiBrightnessImage* pixelization, a \
+        KMeans clustering, so they are saved to the arrays path and memory-mapped by every subsequent run.
+        """
+        return self.cached_value_from_name_and_func(
+            name="most_likely_pixelization_grids_of_planes",
+            func=self.most_likely_pixelization_grids_of_planes_from_arrays_path,
         )
+
+    def most_likely_pixelization_grids_of_planes_from_arrays_path(self):
+        def pixelization_grids_of_planes():
+            return self.most_likely_tracer.sparse_image_plane_grids_of_planes_from_grid(
+                grid=self.most_likely_fit.grid
+            )
+
+        arrays_path = self.arrays_path
+
+        if arrays_path is None:
+            return pixelization_grids_of_planes()
+
+        planes_file_path = os.path.join(arrays_path, "pixelization_grids_of_planes.npy")
+
+        if not os.path.isfile(planes_file_path):
+
+            pixelization_grids = pixelization_grids_of_planes()
+
+            for plane_index, pixelization_grid in enumerate(pixelization_grids):
+                if pixelization_grid is not None:
+                    save_array_to_file_path(
+                        array=pixelization_grid,
+                        file_path=pixelization_grid_file_path_from_arrays_path_and_plane_index(
+                            arrays_path=arrays_path, plane_index=plane_index
+                        ),
+                    )
+                    save_array_to_file_path(
+                        array=pixelization_grid.nearest_pixelization_1d_index_for_mask_1d_index,
+                        file_path=pixelization_grid_file_path_from_arrays_path_and_plane_index(
+                            arrays_path=arrays_path,
+                            plane_index=plane_index,
+                            name="nearest_pixelization_1d_index_for_mask_1d_index",
+                        ),
+                    )
+
+            save_array_to_file_path(
+                array=np.array(
+                    [
+                        pixelization_grid is not None
+                        for pixelization_grid in pixelization_grids
+                    ]
+                ),
+                file_path=planes_file_path,
+            )
+
+        return [
+            grids.GridIrregular(
+                grid=np.load(
+                    pixelization_grid_file_path_from_arrays_path_and_plane_index(
+                        arrays_path=arrays_path, plane_index=plane_index
+                    ),
+                    mmap_mode="r",
+                ),
+                nearest_pixelization_1d_index_for_mask_1d_index=np.load(
+                    pixelization_grid_file_path_from_arrays_path_and_plane_index(
+                        arrays_path=arrays_path,
+                        plane_index=plane_index,
+                        name="nearest_pixelization_1d_index_for_mask_1d_index",
+                    ),
+                    mmap_mode="r",
+                ),
+            )
+            if has_pixelization_grid
+            else None
+            for plane_index, has_pixelization_grid in enumerate(
+                np.load(planes_file_path)
+            )
+        ]
+
+
+def pixelization_grid_file_path_from_arrays_path_and_plane_index(
+    arrays_path, plane_index, name="pixelization_grid"
+):
+    return os.path.join(arrays_path, "{}__plane_{}.npy".format(name, plane_index))
+
+
+def save_array_to_file_path(array, file_path):
+    """Save an array to a .npy file, by writing it to a temporary file which then replaces the file path, so that \
+    a process loading the array (e.g. a parallel phase) never reads a partially written file."""
+
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+    temporary_file_path = "{}.{}.tmp".format(file_path, os.getpid())
+
+    with open(temporary_file_path, "wb") as f:
+        np.save(f, np.asarray(array))
+
+    os.replace(temporary_file_path, file_path)
@@ -1,5 +1,6 @@
 import autofit as af
 from autolens.pipeline.phase import imaging
+from . import hyper_phase_scheduler
 from .hyper_galaxy_phase import HyperGalaxyPhase
 from .hyper_phase import HyperPhase
 from .inversion_phase import InversionBackgroundBothPhase
@@ -11,21 +12,36 @@ from .inversion_phase import ModelFixingHyperPhase
 
 class CombinedHyperPhase(HyperPhase):
     def __init__(
-        self, phase: imaging.PhaseImaging, hyper_phase_classes: (type,) = tuple()
+        self,
+        phase: imaging.PhaseImaging,
+        hyper_phase_classes: (type,) = tuple(),
+        hyper_phase_dependencies=None,
+        number_of_cores=1,
     ):
         """
         A hyper_combined hyper_galaxies phase that can run zero or more other hyper_galaxies phases after the initial phase is
         run.
 
+        The hyper phases all read the result of the initial phase and, unless a dependency between them is given, do \
+        not depend on one another. Hyper phases which are independent are run at the same time in separate \
+        processes if more than one core is available (see *hyper_phase_scheduler*).
+
         Parameters
         ----------
         phase : phase_imaging.PhaseImaging
             The phase wrapped by this hyper_galaxies phase
         hyper_phase_classes
             The classes of hyper_galaxies phases to be run following the initial phase
+        hyper_phase_dependencies : {str: (str,)} or None
+            A dictionary mapping the hyper name of a hyper phase to the hyper names of the hyper phases which must be \
+            run before it.
+        number_of_cores : int
+            The maximum number of independent hyper phases which are run at the same time.
         """
         super().__init__(phase, "hyper_combined")
         self.hyper_phases = list(map(lambda cls: cls(phase), hyper_phase_classes))
+        self.hyper_phase_dependencies = hyper_phase_dependencies or {}
+        self.number_of_cores = number_of_cores
 
     @property
     def phase_names(self) -> [str]:
@@ -69,9 +85,24 @@ class CombinedHyperPhase(HyperPhase):
         )
         results.add(self.phase.paths.phase_name, result)
 
-        for phase in self.hyper_phases:
-            hyper_result = phase.run_hyper(dataset=dataset, results=results, **kwargs)
-            setattr(result, phase.hyper_name, hyper_result)
+        for (
+            hyper_phases
+        ) in hyper_phase_scheduler.hyper_phase_levels_from_hyper_phases_and_dependencies(
+            hyper_phases=self.hyper_phases,
+            hyper_phase_dependencies=self.hyper_phase_dependencies,
+        ):
+
+            hyper_results = hyper_phase_scheduler.hyper_results_from_hyper_phases(
+                hyper_phases=hyper_phases,
+                dataset=dataset,
+                results=results,
+                number_of_cores=self.number_of_cores,
+                **kwargs
+            )
+
+            hyper_phase_scheduler.set_hyper_results_of_hyper_phases(
+                result=result, hyper_phases=hyper_phases, hyper_results=hyper_results
+            )
 
         setattr(
             result, self.hyper_name, self.run_hyper(dataset=dataset, results=results)
@@ -11,8 +11,28 @@ from autoastro.galaxy import galaxy as g
 from autoastro.hyper import hyper_data as hd
 from autolens.pipeline.phase import imaging
 from autolens.pipeline import visualizer
+from autolens.util import parallel_util
 from .hyper_phase import HyperPhase
 
+worker_hyper_galaxy_fits = None
+
+
+def initialize_worker(hyper_galaxy_fits):
+    """
+    Store the (optimizer, model, analysis) tuples of the hyper galaxy fits a worker process of a parallel \
+    *HyperGalaxyPhase* runs.
+
+    With the fork start method the fits are inherited from the parent process, so the masked imaging and hyper \
+    images are shared copy-on-write and never pickled. Otherwise they are pickled once per worker.
+    """
+    global worker_hyper_galaxy_fits
+    worker_hyper_galaxy_fits = hyper_galaxy_fits
+
+
+def result_in_worker_from_index(index):
+    optimizer, model, analysis = worker_hyper_galaxy_fits[index]
+    return optimizer.fit(analysis=analysis, model=model)
+
 
 class Analysis(af.Analysis):
     def __init__(
@@ -147,6 +167,8 @@ class Analysis(af.Analysis):
 class HyperGalaxyPhase(HyperPhase):
     Analysis = Analysis
 
+    result_is_copy_of_last_result = True
+
     def __init__(self, phase):
 
         super().__init__(phase=phase, hyper_name="hyper_galaxy")
@@ -199,6 +221,9 @@ class HyperGalaxyPhase(HyperPhase):
             results.last.hyper_galaxy_image_path_dict
         )
 
+        paths = []
+        hyper_galaxy_fits = []
+
         for path, galaxy in results.last.path_galaxy_tuples:
 
             # TODO : NEed t be sure these wont mess up anything else.
@@ -250,36 +275,46 @@ class HyperGalaxyPhase(HyperPhase):
                     image_path=optimizer.paths.image_path,
                 )
 
-                result = optimizer.fit(analysis=analysis, model=model)
-
-                def transfer_field(name):
-                    if hasattr(result.instance, name):
-                        setattr(
-                            hyper_result.instance.object_for_path(path),
-                            name,
-                            getattr(result.instance, name),
-                        )
-                        setattr(
-                            hyper_result.model.object_for_path(path),
-                            name,
-                            getattr(result.model, name),
-                        )
-
-                transfer_field("hyper_galaxy")
-
-                hyper_result.instance.hyper_image_sky = getattr(
-                    result.instance, "hyper_image_sky"
-                )
-                hyper_result.model.hyper_image_sky = getattr(
-                    result.model, "hyper_image_sky"
-                )
+                paths.append(path)
+                hyper_galaxy_fits.append((optimizer, model, analysis))
 
-                hyper_result.instance.hyper_background_noise = getattr(
-                    result.instance, "hyper_background_noise"
-                )
-                hyper_result.model.hyper_background_noise = getattr(
-                    result.model, "hyper_background_noise"
-                )
+        hyper_galaxy_results = results_from_hyper_galaxy_fits_and_number_of_cores(
+            hyper_galaxy_fits=hyper_galaxy_fits,
+            number_of_cores=cast(imaging.PhaseImaging, phase).number_of_cores,
+        )
+
+        for path, result in zip(paths, hyper_galaxy_results):
+
+            def transfer_field(name):
+                if hasattr(result.instance, name):
+                    setattr(
+                        hyper_result.instance.object_for_path(path),
+                        name,
+                        getattr(result.instance, name),
+                    )
+                    setattr(
+                        hyper_result.model.object_for_path(path),
+                        name,
+                        getattr(result.model, name),
+                    )
+
+            transfer_field("hyper_galaxy")
+
+            hyper_result.instance.hyper_image_sky = getattr(
+                result.instance, "hyper_image_sky"
+            )
+            hyper_result.model.hyper_image_sky = getattr(
+                result.model, "hyper_image_sky"
+            )
+
+            hyper_result.instance.hyper_background_noise = getattr(
+                result.instance, "hyper_background_noise"
+            )
+            hyper_result.model.hyper_background_noise = getattr(
+                result.model, "hyper_background_noise"
+            )
+
+        hyper_result.update_instance_key()
 
         return hyper_result
 
@@ -303,3 +338,38 @@ class HyperGalaxyBackgroundBothPhase(HyperGalaxyPhase):
         super().__init__(phase=phase)
         self.include_sky_background = True
         self.include_noise_background = True
+
+
+def results_from_hyper_galaxy_fits_and_number_of_cores(
+    hyper_galaxy_fits, number_of_cores=1
+):
+    """
+    Run the non-linear search of every hyper galaxy fit, returning their results in the order the fits are input.
+
+    The fits of different galaxies are independent and only share read-only inputs (the masked imaging and hyper \
+    images), so if more than one core is available they are run by a pool of worker processes, one fit per \
+    process (see *parallel_util.pool_from_processes_and_initializer*), which share these inputs with this process \
+    where the fork start method is available instead of each receiving a copy.
+
+    Parameters
+    ----------
+    hyper_galaxy_fits : [(af.NonLinearOptimizer, af.ModelMapper, Analysis)]
+        The optimizer, model and analysis of every hyper galaxy fit.
+    number_of_cores : int
+        The number of worker processes the fits are run with.
+    """
+
+    if number_of_cores == 1 or len(hyper_galaxy_fits) < 2:
+        return [
+            optimizer.fit(analysis=analysis, model=model)
+            for optimizer, model, analysis in hyper_galaxy_fits
+        ]
+
+    with parallel_util.pool_from_processes_and_initializer(
+        processes=min(number_of_cores, len(hyper_galaxy_fits)),
+        initializer=initialize_worker,
+        initargs=(hyper_galaxy_fits,),
+    ) as pool:
+        return pool.map(
+            result_in_worker_from_index, range(len(hyper_galaxy_fits)), chunksize=1
+        )
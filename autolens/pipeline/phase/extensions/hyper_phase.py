@@ -6,6 +6,11 @@ from autolens.pipeline.phase import abstract
 
 
 class HyperPhase:
+
+    # Whether the result of the hyper phase is a copy of the result of the phase it extends, which therefore has the
+    # results of the hyper phases run before it as attributes (see *hyper_phase_scheduler*).
+    result_is_copy_of_last_result = False
+
     def __init__(self, phase: abstract.AbstractPhase, hyper_name: str):
         """
         Abstract HyperPhase. Wraps a phase, performing that phase before performing the action
@@ -0,0 +1,187 @@
+from autolens import exc
+from autolens.util import parallel_util
+
+
+def hyper_phase_levels_from_hyper_phases_and_dependencies(
+    hyper_phases, hyper_phase_dependencies=None
+):
+    """
+    Order the hyper phases of a *CombinedHyperPhase* into levels, where every hyper phase only depends on hyper \
+    phases in earlier levels. The hyper phases of a level are independent of one another and can therefore be run \
+    at the same time.
+
+    Within a level the hyper phases are in the order they are input, so if there are no dependencies there is one \
+    level containing every hyper phase in its input order.
+
+    Parameters
+    ----------
+    hyper_phases : [HyperPhase]
+        The hyper phases which are ordered.
+    hyper_phase_dependencies : {str: (str,)} or None
+        A dictionary mapping the hyper name of a hyper phase to the hyper names of the hyper phases which must be \
+        run before it.
+    """
+
+    hyper_phase_dependencies = hyper_phase_dependencies or {}
+
+    hyper_names = [phase.hyper_name for phase in hyper_phases]
+
+    for hyper_name, dependency_names in hyper_phase_dependencies.items():
+        for name in (hyper_name,) + tuple(dependency_names):
+            if name not in hyper_names:
+                raise exc.PhaseException(
+                    "The hyper phase dependencies include {}, which is not one of the hyper phases {}".format(
+                        name, hyper_names
+                    )
+                )
+
+    hyper_phase_levels = []
+    completed_hyper_names = set()
+    remaining_hyper_phases = list(hyper_phases)
+
+    while remaining_hyper_phases:
+
+        hyper_phase_level = [
+            phase
+            for phase in remaining_hyper_phases
+            if set(hyper_phase_dependencies.get(phase.hyper_name, ()))
+            <= completed_hyper_names
+        ]
+
+        if not hyper_phase_level:
+            raise exc.PhaseException(
+                "The hyper phase dependencies {} contain a cycle".format(
+                    hyper_phase_dependencies
+                )
+            )
+
+        hyper_phase_levels.append(hyper_phase_level)
+        completed_hyper_names.update(phase.hyper_name for phase in hyper_phase_level)
+        remaining_hyper_phases = [
+            phase for phase in remaining_hyper_phases if phase not in hyper_phase_level
+        ]
+
+    return hyper_phase_levels
+
+
+def hyper_results_from_hyper_phases(
+    hyper_phases, dataset, results, number_of_cores=1, **kwargs
+):
+    """
+    Run independent hyper phases, returning their results in the order the hyper phases are input.
+
+    If more than one core is available, up to that many hyper phases are run at the same time, each in its own \
+    process. Every hyper phase writes to its own output path (named after its hyper name), and its result is \
+    returned to this process once its non-linear search is complete.
+
+    The processes are not daemons, so a hyper phase can itself use a pool of worker processes (e.g. the parallel \
+    fits of a *HyperGalaxyPhase*).
+
+    Parameters
+    ----------
+    hyper_phases : [HyperPhase]
+        The hyper phases which are run, none of which depend on one another.
+    dataset : Dataset
+        The dataset the hyper phases fit.
+    results : af.ResultsCollection
+        The results of the previous phases, which every hyper phase reads but does not change.
+    number_of_cores : int
+        The maximum number of hyper phases which are run at the same time.
+    """
+
+    if number_of_cores == 1 or len(hyper_phases) < 2:
+        return [
+            phase.run_hyper(dataset=dataset, results=results, **kwargs)
+            for phase in hyper_phases
+        ]
+
+    context = parallel_util.multiprocessing_context()
+
+    hyper_results = []
+
+    for batch_start in range(0, len(hyper_phases), number_of_cores):
+
+        receivers = []
+        processes = []
+
+        for phase in hyper_phases[batch_start : batch_start + number_of_cores]:
+
+            receiver, sender = context.Pipe(duplex=False)
+
+            process = context.Process(
+                target=run_hyper_in_process,
+                args=(sender, phase, dataset, results, kwargs),
+            )
+            process.start()
+            sender.close()
+
+            receivers.append(receiver)
+            processes.append(process)
+
+        try:
+            for receiver in receivers:
+
+                try:
+                    hyper_result, exception = receiver.recv()
+                except EOFError:
+                    raise exc.PhaseException(
+                        "A hyper phase run in a separate process exited without returning its result"
+                    )
+
+                if exception is not None:
+                    raise exception
+
+                hyper_results.append(hyper_result)
+
+        except Exception:
+            for process in processes:
+                process.terminate()
+            raise
+
+        finally:
+            for process in processes:
+                process.join()
+
+    return hyper_results
+
+
+def set_hyper_results_of_hyper_phases(result, hyper_phases, hyper_results):
+    """
+    Attach the results of a level of hyper phases to the result of the phase they extend, by the hyper name of each \
+    hyper phase.
+
+    If the hyper phases were run one after another, a hyper phase whose result is a copy of the phase's result (e.g. \
+    a *HyperGalaxyPhase*) would copy the results of the hyper phases before it in the level. These are attached to \
+    its result here instead, so the results are the same whether the level was run in this process or in separate \
+    processes.
+
+    Parameters
+    ----------
+    result : af.Result
+        The result of the phase the hyper phases extend.
+    hyper_phases : [HyperPhase]
+        The hyper phases of the level, in the order they are input.
+    hyper_results : [af.Result]
+        The results of the hyper phases.
+    """
+
+    for index, (phase, hyper_result) in enumerate(zip(hyper_phases, hyper_results)):
+
+        setattr(result, phase.hyper_name, hyper_result)
+
+        if phase.result_is_copy_of_last_result:
+            for previous_phase, previous_hyper_result in zip(
+                hyper_phases[:index], hyper_results[:index]
+            ):
+                setattr(hyper_result, previous_phase.hyper_name, previous_hyper_result)
+
+
+def run_hyper_in_process(sender, phase, dataset, results, kwargs):
+    """Run a hyper phase in a separate process, sending its result (or the exception it raised) back through a \
+    pipe."""
+    try:
+        sender.send((phase.run_hyper(dataset=dataset, results=results, **kwargs), None))
+    except Exception as exception:
+        sender.send((None, exception))
+    finally:
+        sender.close()
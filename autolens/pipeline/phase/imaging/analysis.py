@@ -1,12 +1,44 @@
+import contextlib
+import pickle
+
+import numpy as np
+
 from autoarray.exc import InversionException, GridException
 from autofit.exc import FitException
 from autolens.fit import fit
+from autolens.masked import fft_convolver
 from autolens.pipeline import visualizer
 from autolens.pipeline.phase.dataset import analysis as analysis_dataset
+from autolens.util import parallel_util
+
+worker_analysis = None
+
+
+def initialize_worker(analysis_pickle):
+    """
+    Unpickle the analysis a worker process of the parallel *fit_batch* fits instances with.
+
+    The analysis is pickled once per phase by *parallel_util.memory_mapped_pickle_from_obj*, so the masked \
+    imaging's read-only arrays are memory-mapped from the same files by every worker instead of being copied into \
+    each of them.
+    """
+    global worker_analysis
+    worker_analysis = pickle.loads(analysis_pickle)
+
+
+def figures_of_merit_in_worker_from_instances(instances):
+    return worker_analysis.figures_of_merit_from_instances(instances=instances)
 
 
 class Analysis(analysis_dataset.Analysis):
-    def __init__(self, masked_imaging, cosmology, image_path=None, results=None):
+    def __init__(
+        self,
+        masked_imaging,
+        cosmology,
+        image_path=None,
+        results=None,
+        number_of_cores=1,
+    ):
 
         super(Analysis, self).__init__(cosmology=cosmology, results=results)
 
@@ -16,10 +48,48 @@ class Analysis(analysis_dataset.Analysis):
 
         self.masked_dataset = masked_imaging
 
+        self.number_of_cores = number_of_cores
+
+        self.pool = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["pool"] = None
+        return state
+
     @property
     def masked_imaging(self):
         return self.masked_dataset
 
+    @contextlib.contextmanager
+    def worker_pool(self):
+        """
+        Open the pool of worker processes *fit_batch* fits instances with, which the phase keeps open for the whole \
+        non-linear search (see *PhaseImaging.run_analysis*) and which is terminated when the *with* block exits.
+
+        The analysis is pickled once, with the masked imaging's read-only arrays (image, noise-map, grids, \
+        convolver and blurring grid) saved to temporary files which every worker memory-maps, so the workers share \
+        one copy of them whichever start method they use. If the analysis has one core no pool is opened.
+        """
+
+        if self.number_of_cores == 1:
+            yield None
+            return
+
+        with parallel_util.memory_mapped_pickle_from_obj(obj=self) as analysis_pickle:
+            with parallel_util.pool_from_processes_and_initializer(
+                processes=self.number_of_cores,
+                initializer=initialize_worker,
+                initargs=(analysis_pickle,),
+            ) as pool:
+
+                self.pool = pool
+
+                try:
+                    yield pool
+                finally:
+                    self.pool = None
+
     def fit(self, instance):
         """
         Determine the fit of a lens galaxy and source galaxy to the masked_imaging in this lens.
@@ -35,34 +105,198 @@ class Analysis(analysis_dataset.Analysis):
             A fractional value indicating how well this model fit and the model masked_imaging itself
         """
 
-        self.associate_hyper_images(instance=instance)
-        tracer = self.tracer_for_instance(instance=instance)
+        try:
+            return self.masked_imaging_fit_for_instance(
+                instance=instance
+            ).figure_of_merit
+        except (InversionException, GridException) as e:
+            raise FitException from e
 
-        self.masked_dataset.check_positions_trace_within_threshold_via_tracer(
-            tracer=tracer
+    def fit_batch(self, instances):
+        """
+        Determine the figures of merit of a batch of model instances, for example the walkers of a vectorized \
+        emcee run or the population of another population-based sampler.
+
+        If the worker pool of the analysis is open (see *worker_pool*) the batch is split into one chunk per core, \
+        which are fitted by its worker processes, such that every batch of a phase reuses the same workers. \
+        Otherwise the batch is fitted in this process.
+
+        Parameters
+        ----------
+        instances : [af.ModelInstance]
+            The model instances that are fitted.
+
+        Returns
+        -------
+        figures_of_merit : ndarray
+            The figure of merit of every instance, in the order the instances are input.
+        """
+
+        if self.pool is None or len(instances) < 2:
+            return self.figures_of_merit_from_instances(instances=instances)
+
+        chunks = [
+            [instances[index] for index in chunk_indexes]
+            for chunk_indexes in np.array_split(
+                np.arange(len(instances)), min(self.number_of_cores, len(instances))
+            )
+        ]
+
+        return np.concatenate(
+            self.pool.map(figures_of_merit_in_worker_from_instances, chunks)
         )
 
-        self.masked_dataset.check_inversion_pixels_are_below_limit_via_tracer(
-            tracer=tracer
+    def figures_of_merit_from_instances(self, instances):
+        """
+        Determine the figures of merit of a batch of model instances in this process, which are those of *fit*.
+
+        Every instance is fitted to the same masked imaging. The profile images of the instances without an \
+        inversion are stacked and blurred together (with one batched FFT if the masked imaging uses an \
+        *FFTConvolver*), and their likelihoods are reduced over the stack in one pass, with the image and noise-map \
+        shared across the batch unless a hyper image sky or hyper noise changes them. Instances with an inversion \
+        are fitted one at a time.
+
+        Instances whose fit raises a *FitException* are given a figure of merit of -inf, which samplers treat as a \
+        rejected sample.
+
+        Parameters
+        ----------
+        instances : [af.ModelInstance]
+            The model instances that are fitted.
+
+        Returns
+        -------
+        figures_of_merit : ndarray
+            The figure of merit of every instance, in the order the instances are input.
+        """
+
+        figures_of_merit = np.full(len(instances), -np.inf)
+
+        batched_fits = []
+
+        for index, instance in enumerate(instances):
+
+            try:
+
+                tracer, hyper_image_sky, hyper_background_noise = self.tracer_and_hyper_data_for_instance(
+                    instance=instance
+                )
+
+                if tracer.has_pixelization:
+
+                    figures_of_merit[index] = self.masked_imaging_fit_for_tracer(
+                        tracer=tracer,
+                        hyper_image_sky=hyper_image_sky,
+                        hyper_background_noise=hyper_background_noise,
+                    ).figure_of_merit
+
+                    continue
+
+                batched_fits.append(
+                    (
+                        index,
+                        fit.hyper_image_from_image_and_hyper_image_sky(
+                            image=self.masked_imaging.image,
+                            hyper_image_sky=hyper_image_sky,
+                        ),
+                        fit.hyper_noise_map_from_noise_map_tracer_and_hyper_backkground_noise(
+                            noise_map=self.masked_imaging.noise_map,
+                            tracer=tracer,
+                            hyper_background_noise=hyper_background_noise,
+                        ),
+                        tracer.profile_image_from_grid(grid=self.masked_imaging.grid),
+                        tracer.profile_image_from_grid(
+                            grid=self.masked_imaging.blurring_grid
+                        ),
+                    )
+                )
+
+            except (FitException, InversionException, GridException):
+                continue
+
+        if not batched_fits:
+            return figures_of_merit
+
+        indexes, images, noise_maps, profile_images, blurring_images = zip(
+            *batched_fits
         )
 
-        hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
+        blurred_profile_images = fft_convolver.convolved_images_from_convolver_images_and_blurring_images(
+            convolver=self.masked_imaging.convolver,
+            images=profile_images,
+            blurring_images=blurring_images,
+        )
 
-        hyper_background_noise = self.hyper_background_noise_for_instance(
+        figures_of_merit[
+            list(indexes)
+        ] = fit.likelihoods_from_data_model_data_and_noise_map_stacks(
+            data=fit.array_stack_from_arrays(arrays=images),
+            model_data=blurred_profile_images,
+            noise_map=fit.array_stack_from_arrays(arrays=noise_maps),
+        )
+
+        return figures_of_merit
+
+    def masked_imaging_fit_for_instance(self, instance):
+        """
+        Fit the masked imaging with the tracer of a model instance, after checking the instance's positions trace \
+        within the threshold and its inversion has fewer pixels than the limit.
+
+        Parameters
+        ----------
+        instance
+            A model instance with attributes
+
+        Returns
+        -------
+        fit : ImagingFit
+            The fit of the model instance to the masked imaging.
+        """
+
+        tracer, hyper_image_sky, hyper_background_noise = self.tracer_and_hyper_data_for_instance(
             instance=instance
         )
 
         try:
-            fit = self.masked_imaging_fit_for_tracer(
+            return self.masked_imaging_fit_for_tracer(
                 tracer=tracer,
                 hyper_image_sky=hyper_image_sky,
                 hyper_background_noise=hyper_background_noise,
             )
-
-            return fit.figure_of_merit
-        except InversionException or GridException as e:
+        except (InversionException, GridException) as e:
             raise FitException from e
 
+    def tracer_and_hyper_data_for_instance(self, instance):
+        """
+        Return the tracer, hyper image sky and hyper background noise a model instance fits the masked imaging \
+        with, after checking the instance's positions trace within the threshold and its inversion has fewer pixels \
+        than the limit, which raise a *FitException* otherwise.
+
+        Parameters
+        ----------
+        instance
+            A model instance with attributes
+        """
+
+        self.masked_dataset.check_positions_trace_within_threshold_via_galaxies(
+            galaxies=instance.galaxies, cosmology=self.cosmology
+        )
+
+        self.associate_hyper_images(instance=instance)
+        tracer = self.tracer_for_instance(instance=instance)
+
+        self.masked_dataset.check_inversion_pixels_are_below_limit_via_tracer(
+            tracer=tracer
+        )
+
+        hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
+
+        hyper_background_noise = self.hyper_background_noise_for_instance(
+            instance=instance
+        )
+
+        return tracer, hyper_image_sky, hyper_background_noise
+
     def masked_imaging_fit_for_tracer(
         self, tracer, hyper_image_sky, hyper_background_noise
     ):
@@ -15,6 +15,9 @@ class MetaImagingFit(dataset.MetaDatasetFit):
         inversion_pixel_limit=None,
         psf_shape_2d=None,
         bin_up_factor=None,
+        interpolation_refinement_levels=None,
+        convolution_backend="auto",
+        inversion_uses_sparse_matrices=False,
     ):
 
         super().__init__(
@@ -29,6 +32,9 @@ class MetaImagingFit(dataset.MetaDatasetFit):
         )
         self.psf_shape_2d = psf_shape_2d
         self.bin_up_factor = bin_up_factor
+        self.interpolation_refinement_levels = interpolation_refinement_levels
+        self.convolution_backend = convolution_backend
+        self.inversion_uses_sparse_matrices = inversion_uses_sparse_matrices
 
     def masked_dataset_from(self, dataset, mask, positions, results, modified_image):
 
@@ -50,6 +56,12 @@ class MetaImagingFit(dataset.MetaDatasetFit):
             inversion_pixel_limit=self.inversion_pixel_limit,
             inversion_uses_border=self.inversion_uses_border,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+            interpolation_refinement_levels=self.interpolation_refinement_levels,
+            preload_interpolation_tracer=self.preload_interpolation_tracer_from_results(
+                results=results
+            ),
+            convolution_backend=self.convolution_backend,
+            inversion_uses_sparse_matrices=self.inversion_uses_sparse_matrices,
         )
 
         if self.signal_to_noise_limit is not None:
@@ -63,3 +75,20 @@ class MetaImagingFit(dataset.MetaDatasetFit):
             )
 
         return masked_imaging
+
+    def preload_interpolation_tracer_from_results(self, results):
+        """The most likely tracer of the previous phase, whose deflection angles decide where an adaptive \
+        interpolation grid is refined, if the phase uses one and the tracer has a mass profile."""
+
+        if self.pixel_scale_interpolation_grid is None:
+            return None
+
+        if self.interpolation_refinement_levels is None:
+            return None
+
+        if results is not None and results.last is not None:
+            tracer = results.last.most_likely_tracer
+            if tracer.has_mass_profile:
+                return tracer
+
+        return None
@@ -33,8 +33,12 @@ class PhaseImaging(dataset.PhaseDataset):
         psf_shape_2d=None,
         positions_threshold=None,
         pixel_scale_interpolation_grid=None,
+        interpolation_refinement_levels=None,
         inversion_uses_border=True,
         inversion_pixel_limit=None,
+        number_of_cores=1,
+        convolution_backend="auto",
+        inversion_uses_sparse_matrices=False,
     ):
 
         """
@@ -48,6 +52,17 @@ class PhaseImaging(dataset.PhaseDataset):
             The class of a non_linear optimizer
         sub_size: int
             The side length of the subgrid
+        interpolation_refinement_levels: int or None
+            If not *None*, deflection angles are interpolated from an adaptive grid refined up to this many times \
+            around the critical curves of the previous phase's most likely tracer.
+        number_of_cores: int
+            The number of worker processes the analysis uses to fit batches of instances in parallel, which the \
+            hyper galaxy phase also uses to fit the hyper galaxies of different galaxies in parallel.
+        convolution_backend: str
+            Whether light profile images are blurred in "real_space", via "fft" or "auto" (whichever is faster for \
+            the mask and PSF shape).
+        inversion_uses_sparse_matrices: bool
+            If *True*, inversions use sparse mapping and blurred mapping matrices.
         """
 
         phase_tag = phase_tagging.phase_tag_from_phase_settings(
@@ -57,6 +72,7 @@ class PhaseImaging(dataset.PhaseDataset):
             psf_shape_2d=psf_shape_2d,
             positions_threshold=positions_threshold,
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+            interpolation_refinement_levels=interpolation_refinement_levels,
         )
         paths.phase_tag = phase_tag
 
@@ -72,6 +88,8 @@ class PhaseImaging(dataset.PhaseDataset):
 
         self.is_hyper_phase = False
 
+        self.number_of_cores = number_of_cores
+
         self.meta_imaging_fit = MetaImagingFit(
             model=self.model,
             bin_up_factor=bin_up_factor,
@@ -80,8 +98,11 @@ class PhaseImaging(dataset.PhaseDataset):
             signal_to_noise_limit=signal_to_noise_limit,
             positions_threshold=positions_threshold,
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+            interpolation_refinement_levels=interpolation_refinement_levels,
             inversion_uses_border=inversion_uses_border,
             inversion_pixel_limit=inversion_pixel_limit,
+            convolution_backend=convolution_backend,
+            inversion_uses_sparse_matrices=inversion_uses_sparse_matrices,
         )
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
@@ -141,10 +162,19 @@ class PhaseImaging(dataset.PhaseDataset):
             cosmology=self.cosmology,
             image_path=self.optimizer.paths.image_path,
             results=results,
+            number_of_cores=self.number_of_cores,
         )
 
         return analysis
 
+    def run_analysis(self, analysis):
+        """
+        Run the non-linear search with the worker pool of the analysis open, such that every batch of instances it \
+        fits in parallel reuses the same worker processes (see *Analysis.worker_pool*).
+        """
+        with analysis.worker_pool():
+            return super().run_analysis(analysis=analysis)
+
     def output_phase_info(self):
 
         file_phase_info = "{}/{}".format(
@@ -206,13 +236,19 @@ class PhaseImaging(dataset.PhaseDataset):
                     extensions.hyper_galaxy_phase.HyperGalaxyBackgroundBothPhase
                 )
 
+        hyper_phase_dependencies = None
+
         if hyper_galaxy_phase_first:
             if inversion and hyper_galaxy:
                 hyper_phase_classes = [cls for cls in reversed(hyper_phase_classes)]
+                hyper_phase_dependencies = {"inversion": ("hyper_galaxy",)}
 
         if len(hyper_phase_classes) == 0:
             return self
         else:
             return extensions.CombinedHyperPhase(
-                phase=self, hyper_phase_classes=hyper_phase_classes
+                phase=self,
+                hyper_phase_classes=hyper_phase_classes,
+                hyper_phase_dependencies=hyper_phase_dependencies,
+                number_of_cores=self.number_of_cores,
             )
@@ -45,12 +45,13 @@ class Analysis(analysis_data.Analysis):
             A fractional value indicating how well this model fit and the model masked_interferometer itself
         """
 
+        self.masked_dataset.check_positions_trace_within_threshold_via_galaxies(
+            galaxies=instance.galaxies, cosmology=self.cosmology
+        )
+
         self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
 
-        self.masked_dataset.check_positions_trace_within_threshold_via_tracer(
-            tracer=tracer
-        )
         self.masked_dataset.check_inversion_pixels_are_below_limit_via_tracer(
             tracer=tracer
         )
@@ -1,4 +1,5 @@
 from autolens.masked import masked_dataset
+from autolens.masked import visibility_compressor
 from autolens.pipeline.phase import dataset
 
 
@@ -15,6 +16,9 @@ class MetaInterferometerFit(dataset.MetaDatasetFit):
         inversion_pixel_limit=None,
         primary_beam_shape_2d=None,
         bin_up_factor=None,
+        transform_backend="dft",
+        inversion_uses_linear_operators=False,
+        uv_cell_size=None,
     ):
         super().__init__(
             model=model,
@@ -28,6 +32,9 @@ class MetaInterferometerFit(dataset.MetaDatasetFit):
         self.real_space_mask = real_space_mask
         self.primary_beam_shape_2d = primary_beam_shape_2d
         self.bin_up_factor = bin_up_factor
+        self.transform_backend = transform_backend
+        self.inversion_uses_linear_operators = inversion_uses_linear_operators
+        self.uv_cell_size = uv_cell_size
 
     def masked_dataset_from(
         self, dataset, mask, positions, results, modified_visibilities
@@ -43,10 +50,30 @@ class MetaInterferometerFit(dataset.MetaDatasetFit):
             results=results
         )
 
+        interferometer = dataset.modified_visibilities_from_visibilities(
+            modified_visibilities
+        )
+
+        # The visibilities are compressed before the masked interferometer is created, so its transformer and
+        # curvature kernel are only computed for the compressed uv coverage.
+
+        if self.uv_cell_size is not None:
+
+            visibility_compression = visibility_compressor.VisibilityCompression.from_interferometer_visibilities_mask_and_uv_cell_size(
+                interferometer=interferometer,
+                visibilities_mask=mask,
+                uv_cell_size=self.uv_cell_size,
+            )
+
+            interferometer = visibility_compression.interferometer
+            mask = visibility_compression.visibilities_mask
+
+        else:
+
+            visibility_compression = None
+
         masked_interferometer = masked_dataset.MaskedInterferometer(
-            interferometer=dataset.modified_visibilities_from_visibilities(
-                modified_visibilities
-            ),
+            interferometer=interferometer,
             visibilities_mask=mask,
             real_space_mask=real_space_mask,
             primary_beam_shape_2d=self.primary_beam_shape_2d,
@@ -56,6 +83,10 @@ class MetaInterferometerFit(dataset.MetaDatasetFit):
             inversion_pixel_limit=self.inversion_pixel_limit,
             inversion_uses_border=self.inversion_uses_border,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+            transform_backend=self.transform_backend,
+            inversion_uses_linear_operators=self.inversion_uses_linear_operators,
         )
 
+        masked_interferometer.visibility_compression = visibility_compression
+
         return masked_interferometer
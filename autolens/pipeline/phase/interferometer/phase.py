@@ -34,6 +34,9 @@ class PhaseInterferometer(dataset.PhaseDataset):
         pixel_scale_interpolation_grid=None,
         inversion_uses_border=True,
         inversion_pixel_limit=None,
+        transform_backend="dft",
+        inversion_uses_linear_operators=False,
+        uv_cell_size=None,
     ):
 
         """
@@ -47,6 +50,16 @@ class PhaseInterferometer(dataset.PhaseDataset):
             The class of a non_linear optimizer
         sub_size: int
             The side length of the subgrid
+        transform_backend: str
+            How images are transformed to visibilities: "dft" uses a direct Fourier transform and "nufft" a \
+            non-uniform FFT, which is much faster for datasets with many visibilities.
+        inversion_uses_linear_operators: bool
+            If *True*, inversions compute their curvature matrix in image space from the curvature kernel of the uv \
+            coverage, such that their memory and run-time do not scale with the number of visibilities.
+        uv_cell_size: float or None
+            If input, the visibilities are compressed into uv cells of this size (in wavelengths), which are fitted \
+            instead of every visibility for faster run times. Later phases without a uv cell size fit the \
+            uncompressed visibilities.
         """
 
         paths.phase_tag = phase_tagging.phase_tag_from_phase_settings(
@@ -56,6 +69,7 @@ class PhaseInterferometer(dataset.PhaseDataset):
             primary_beam_shape_2d=primary_beam_shape_2d,
             positions_threshold=positions_threshold,
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+            uv_cell_size=uv_cell_size,
         )
 
         super().__init__(
@@ -78,6 +92,9 @@ class PhaseInterferometer(dataset.PhaseDataset):
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
             inversion_uses_border=inversion_uses_border,
             inversion_pixel_limit=inversion_pixel_limit,
+            transform_backend=transform_backend,
+            inversion_uses_linear_operators=inversion_uses_linear_operators,
+            uv_cell_size=uv_cell_size,
         )
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
@@ -132,7 +149,7 @@ class PhaseInterferometer(dataset.PhaseDataset):
             modified_visibilities=modified_visibilities,
         )
 
-        self.output_phase_info()
+        self.output_phase_info(masked_interferometer=masked_interferometer)
 
         analysis = self.Analysis(
             masked_interferometer=masked_interferometer,
@@ -143,7 +160,7 @@ class PhaseInterferometer(dataset.PhaseDataset):
 
         return analysis
 
-    def output_phase_info(self):
+    def output_phase_info(self, masked_interferometer=None):
 
         file_phase_info = "{}/{}".format(
             self.optimizer.paths.phase_output_path, "phase.info"
@@ -166,6 +183,32 @@ class PhaseInterferometer(dataset.PhaseDataset):
             )
             phase_info.write("Cosmology = {} \n".format(self.cosmology))
 
+            visibility_compression = getattr(
+                masked_interferometer, "visibility_compression", None
+            )
+
+            if visibility_compression is not None:
+                phase_info.write(
+                    "UV Cell Size = {} \n".format(visibility_compression.uv_cell_size)
+                )
+                phase_info.write(
+                    "Compression Factor = {} \n".format(
+                        visibility_compression.compression_factor
+                    )
+                )
+                phase_info.write(
+                    "Reduced Within Cell Chi-Squared = {} \n".format(
+                        visibility_compression.reduced_within_cell_chi_squared
+                    )
+                )
+                phase_info.write(
+                    "Maximum Phase Error = {} \n".format(
+                        visibility_compression.maximum_phase_error_from_grid_radians(
+                            grid_radians=masked_interferometer.grid.in_radians
+                        )
+                    )
+                )
+
             phase_info.close()
 
     def extend_with_multiple_hyper_phases(
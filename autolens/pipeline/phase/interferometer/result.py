@@ -7,8 +7,7 @@ from autolens.pipeline.phase import dataset
 
 
 class Result(dataset.Result):
-    @property
-    def most_likely_fit(self):
+    def most_likely_fit_from_instance(self):
 
         hyper_background_noise = self.analysis.hyper_background_noise_for_instance(
             instance=self.instance
@@ -54,9 +53,15 @@ class Result(dataset.Result):
     def visibilities_galaxy_dict(self) -> {str: g.Galaxy}:
         """
         A dictionary associating galaxy names with model visibilities of those galaxies
+
+        The visibilities of every galaxy are computed together from one most likely fit.
         """
+        galaxy_model_visibilities_dict = (
+            self.most_likely_fit.galaxy_model_visibilities_dict
+        )
+
         return {
-            galaxy_path: self.visibilities_for_galaxy(galaxy)
+            galaxy_path: galaxy_model_visibilities_dict[galaxy]
             for galaxy_path, galaxy in self.path_galaxy_tuples
         }
 
@@ -66,13 +71,13 @@ class Result(dataset.Result):
         A dictionary associating 1D hyper_galaxies galaxy visibilities with their names.
         """
 
+        visibilities_galaxy_dict = self.visibilities_galaxy_dict
+
         hyper_galaxy_visibilities_path_dict = {}
 
         for path, galaxy in self.path_galaxy_tuples:
 
-            hyper_galaxy_visibilities_path_dict[path] = self.visibilities_galaxy_dict[
-                path
-            ]
+            hyper_galaxy_visibilities_path_dict[path] = visibilities_galaxy_dict[path]
 
         return hyper_galaxy_visibilities_path_dict
 
@@ -83,8 +88,10 @@ class Result(dataset.Result):
             shape_1d=(self.most_likely_fit.visibilities.shape_1d,)
         )
 
+        hyper_galaxy_visibilities_path_dict = self.hyper_galaxy_visibilities_path_dict
+
         for path, galaxy in self.path_galaxy_tuples:
-            hyper_model_visibilities += self.hyper_galaxy_visibilities_path_dict[path]
+            hyper_model_visibilities += hyper_galaxy_visibilities_path_dict[path]
 
         return hyper_model_visibilities
 
@@ -106,9 +113,35 @@ class Result(dataset.Result):
     def image_galaxy_dict(self) -> {str: g.Galaxy}:
         """
         A dictionary associating galaxy names with model images of those galaxies
+
+        The images of every galaxy are computed from one most likely fit and saved to the arrays path of the result \
+        (see *arrays_path*).
         """
+        return self.cached_value_from_name_and_func(
+            name="image_galaxy_dict", func=self.image_galaxy_dict_from_arrays_path
+        )
+
+    def image_galaxy_dict_from_arrays_path(self):
+
+        mask = self.analysis.masked_dataset.real_space_mask.mask_sub_1
+
+        return {
+            galaxy_path: mask.mapping.array_stored_1d_from_sub_array_1d(
+                sub_array_1d=galaxy_image
+            )
+            for galaxy_path, galaxy_image in self.array_dict_from_arrays_path(
+                name="galaxy_model_image",
+                keys=[galaxy_path for galaxy_path, galaxy in self.path_galaxy_tuples],
+                func=self.image_galaxy_dict_from_most_likely_fit,
+            ).items()
+        }
+
+    def image_galaxy_dict_from_most_likely_fit(self):
+
+        galaxy_model_image_dict = self.most_likely_fit.galaxy_model_image_dict
+
         return {
-            galaxy_path: self.image_for_galaxy(galaxy)
+            galaxy_path: galaxy_model_image_dict[galaxy]
             for galaxy_path, galaxy in self.path_galaxy_tuples
         }
 
@@ -116,7 +149,31 @@ class Result(dataset.Result):
     def hyper_galaxy_image_path_dict(self):
         """
         A dictionary associating 1D hyper_galaxies galaxy images with their names.
+
+        The images are saved to the arrays path of the result (see *arrays_path*), so the most likely fit is only \
+        performed the first time they are accessed.
         """
+        return self.cached_value_from_name_and_func(
+            name="hyper_galaxy_image_path_dict",
+            func=self.hyper_galaxy_image_path_dict_from_arrays_path,
+        )
+
+    def hyper_galaxy_image_path_dict_from_arrays_path(self):
+
+        mask = self.analysis.masked_dataset.real_space_mask.mask_sub_1
+
+        return {
+            path: mask.mapping.array_stored_1d_from_sub_array_1d(
+                sub_array_1d=hyper_galaxy_image
+            )
+            for path, hyper_galaxy_image in self.array_dict_from_arrays_path(
+                name="hyper_galaxy_image",
+                keys=[path for path, galaxy in self.path_galaxy_tuples],
+                func=self.hyper_galaxy_image_path_dict_from_most_likely_fit,
+            ).items()
+        }
+
+    def hyper_galaxy_image_path_dict_from_most_likely_fit(self):
 
         hyper_minimum_percent = af.conf.instance.general.get(
             "hyper", "hyper_minimum_percent", float
@@ -124,9 +181,11 @@ class Result(dataset.Result):
 
         hyper_galaxy_image_path_dict = {}
 
+        image_galaxy_dict = self.image_galaxy_dict
+
         for path, galaxy in self.path_galaxy_tuples:
 
-            galaxy_image = self.image_galaxy_dict[path]
+            galaxy_image = np.array(image_galaxy_dict[path])
 
             if not np.all(galaxy_image == 0):
                 minimum_galaxy_value = hyper_minimum_percent * max(galaxy_image)
@@ -138,10 +197,25 @@ class Result(dataset.Result):
 
     @property
     def hyper_model_image(self):
+        return self.cached_value_from_name_and_func(
+            name="hyper_model_image", func=self.hyper_model_image_from_arrays_path
+        )
 
-        hyper_model_image = aa.masked.array.zeros(mask=self.real_space_mask.mask_sub_1)
+    def hyper_model_image_from_arrays_path(self):
 
-        for path, galaxy in self.path_galaxy_tuples:
-            hyper_model_image += self.hyper_galaxy_image_path_dict[path]
+        mask = self.analysis.masked_dataset.real_space_mask.mask_sub_1
+
+        def hyper_model_image_dict():
 
-        return hyper_model_image
+            hyper_model_image = aa.masked.array.zeros(mask=mask)
+
+            for hyper_galaxy_image in self.hyper_galaxy_image_path_dict.values():
+                hyper_model_image += hyper_galaxy_image
+
+            return {(): hyper_model_image}
+
+        return mask.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=self.array_dict_from_arrays_path(
+                name="hyper_model_image", keys=[()], func=hyper_model_image_dict
+            )[()]
+        )
@@ -6,8 +6,10 @@ def phase_tag_from_phase_settings(
     primary_beam_shape_2d=None,
     positions_threshold=None,
     pixel_scale_interpolation_grid=None,
+    interpolation_refinement_levels=None,
     real_space_shape_2d=None,
     real_space_pixel_scales=None,
+    uv_cell_size=None,
 ):
 
     sub_size_tag = sub_size_tag_from_sub_size(sub_size=sub_size)
@@ -25,6 +27,11 @@ def phase_tag_from_phase_settings(
     pixel_scale_interpolation_grid_tag = pixel_scale_interpolation_grid_tag_from_pixel_scale_interpolation_grid(
         pixel_scale_interpolation_grid=pixel_scale_interpolation_grid
     )
+    interpolation_refinement_levels_tag = interpolation_refinement_levels_tag_from_interpolation_refinement_levels(
+        interpolation_refinement_levels=interpolation_refinement_levels
+        if pixel_scale_interpolation_grid is not None
+        else None
+    )
 
     primary_beam_shape_tag = primary_beam_shape_tag_from_primary_beam_shape_2d(
         primary_beam_shape_2d=primary_beam_shape_2d
@@ -35,6 +42,7 @@ def phase_tag_from_phase_settings(
     real_space_pixel_scales_tag = real_space_pixel_scales_tag_from_real_space_pixel_scales(
         real_space_pixel_scales=real_space_pixel_scales
     )
+    uv_cell_size_tag = uv_cell_size_tag_from_uv_cell_size(uv_cell_size=uv_cell_size)
 
     return (
         "phase_tag"
@@ -43,10 +51,12 @@ def phase_tag_from_phase_settings(
         + sub_size_tag
         + signal_to_noise_limit_tag
         + bin_up_factor_tag
+        + uv_cell_size_tag
         + psf_shape_tag
         + primary_beam_shape_tag
         + positions_threshold_tag
         + pixel_scale_interpolation_grid_tag
+        + interpolation_refinement_levels_tag
     )
 
 
@@ -110,6 +120,22 @@ def bin_up_factor_tag_from_bin_up_factor(bin_up_factor):
         return "__bin_" + str(bin_up_factor)
 
 
+def uv_cell_size_tag_from_uv_cell_size(uv_cell_size):
+    """Generate a uv cell size tag, to customize phase names based on the size of the uv cells the visibilities are \
+    compressed into for faster run times.
+
+    This changes the phase name 'phase_name' as follows:
+
+    uv_cell_size = None -> phase_name
+    uv_cell_size = 1000.0 -> phase_name__uv_1000
+    uv_cell_size = 2500.0 -> phase_name__uv_2500
+    """
+    if uv_cell_size is None:
+        return ""
+    else:
+        return "__uv_{0:.0f}".format(uv_cell_size)
+
+
 def psf_shape_tag_from_psf_shape_2d(psf_shape_2d):
     """Generate an image psf shape tag, to customize phase names based on size of the image PSF that the original PSF \
     is trimmed to for faster run times.
@@ -146,6 +172,24 @@ def pixel_scale_interpolation_grid_tag_from_pixel_scale_interpolation_grid(
         return "__interp_{0:.3f}".format(pixel_scale_interpolation_grid)
 
 
+def interpolation_refinement_levels_tag_from_interpolation_refinement_levels(
+    interpolation_refinement_levels
+):
+    """Generate an interpolation refinement tag, to customize phase names based on the number of times the cells of \
+    an adaptive interpolation grid can be refined.
+
+    This changes the phase name 'phase_name' as follows:
+
+    interpolation_refinement_levels = None -> phase_name
+    interpolation_refinement_levels = 0 -> phase_name__ref_0
+    interpolation_refinement_levels = 2 -> phase_name__ref_2
+    """
+    if interpolation_refinement_levels is None:
+        return ""
+    else:
+        return "__ref_{}".format(interpolation_refinement_levels)
+
+
 def primary_beam_shape_tag_from_primary_beam_shape_2d(primary_beam_shape_2d):
     """Generate an image psf shape tag, to customize phase names based on size of the image PSF that the original PSF \
     is trimmed to for faster run times.
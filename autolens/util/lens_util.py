@@ -1,4 +1,9 @@
+import functools
+from collections import OrderedDict
+
 from autoarray.structures import grids
+from autoastro.util import cosmology_util
+from autolens import decorator_util
 from autolens import exc
 from autolens.lens import plane as pl
 
@@ -130,3 +135,298 @@ def galaxies_in_redshift_ordered_planes_from_galaxies(galaxies, plane_redshifts)
         galaxies_in_redshift_ordered_planes[index].append(galaxy)
 
     return galaxies_in_redshift_ordered_planes
+
+
+class CosmologyKey:
+    def __init__(self, cosmology):
+        """Wraps a cosmology so it can be used as the key of a cache.
+
+        Astropy cosmologies are not hashable, so two cosmologies are treated as equal when their representations \
+        (which include their name and every cosmological parameter) are identical.
+
+        Parameters
+        -----------
+        cosmology : astropy.cosmology
+            The cosmology which is wrapped.
+        """
+        self.cosmology = cosmology
+        self.key = repr(cosmology)
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, CosmologyKey) and self.key == other.key
+
+
+class GridKey:
+    def __init__(self, grid):
+        """Wraps a grid so it can be used as the key of a cache by its identity.
+
+        Hashing the contents of a grid costs as much as copying it, so grids are keyed by identity instead (like the \
+        traced grids cache of a tracer). The grids of a masked dataset (and the image-plane grids a tracer traces \
+        from them) are the same objects for every fit of a phase, so they are recognised without being hashed. The \
+        key holds a reference to the grid, such that its identity cannot be reused by a different grid while it is \
+        cached. Grids must therefore not be modified in-place after they are used by a cache.
+
+        Parameters
+        -----------
+        grid : aa.Grid
+            The grid which is wrapped.
+        """
+        self.grid = grid
+
+    def __hash__(self):
+        return id(self.grid)
+
+    def __eq__(self, other):
+        return isinstance(other, GridKey) and self.grid is other.grid
+
+
+class ProfileGridCache:
+    def __init__(self, maxsize):
+        """A least-recently-used cache of quantities computed by a galaxy's profiles on a grid (e.g. its profile image \
+        or deflection angles), keyed by the identities of the profiles and the grid.
+
+        Only the quantities of fixed profiles (see *set_fixed_objects*) are cached. A fixed profile (e.g. the lens \
+        light in a source-only inversion phase, or every galaxy of a hyper phase) is the same object in every fit of \
+        a phase, so its quantities are computed once and reused by every subsequent fit. The profiles of free \
+        galaxies are created anew for every fit, so they are never cached.
+
+        Parameters
+        -----------
+        maxsize : int
+            The maximum number of quantities stored, after which the least recently used is removed. If 0, nothing \
+            is cached.
+        """
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+
+    def value_from_profiles_grid_key_and_func(self, name, profiles, grid_key, func):
+        """Return the quantity *name* of a list of profiles on the grid with key *grid_key*, computing it with *func* \
+        if it is not cached.
+
+        Cached arrays are read-only, as they are shared by every fit which uses them.
+        """
+        profiles_key = profiles_key_from_profiles(profiles=profiles)
+
+        if profiles_key is None or self.maxsize == 0:
+            return func()
+
+        key = (name, profiles_key, grid_key)
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        value = func()
+
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+
+        self.cache[key] = value
+
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        self.cache.clear()
+
+
+def profiles_key_from_profiles(profiles):
+    """Compute a key from the identities of a list of profiles (or pixelizations) if they are all fixed (see \
+    *set_fixed_objects*), or *None* otherwise (in which case their quantities are not cached)."""
+
+    if not profiles:
+        return None
+
+    if not all(id(profile) in fixed_objects for profile in profiles):
+        return None
+
+    return tuple(id(profile) for profile in profiles)
+
+
+def grid_key_from_grid(grid):
+    """Compute the key of a grid in a *ProfileGridCache*, which is its identity (see *GridKey*)."""
+    return GridKey(grid=grid)
+
+
+def array_key_from_array(array):
+    """Compute the key of an array which is not a grid (e.g. a hyper galaxy image or PSF kernel) in a \
+    *ProfileGridCache*, which is its identity like that of a grid (see *GridKey*), as the arrays of a masked dataset \
+    and the hyper images of a phase are the same objects for every fit."""
+    return GridKey(grid=array)
+
+
+def set_fixed_objects(objects):
+    """Set the objects whose parameters are fixed (e.g. the light and mass profiles and pixelizations which are \
+    instances instead of models in a phase), whose quantities are cached by *profile_grid_cache* and \
+    *inversion_cache*. Both caches are cleared, and the previously fixed objects are returned so they can be \
+    restored.
+
+    The fixed objects are stored by identity with a reference to each, such that the identity of a fixed object \
+    cannot be reused by a different object.
+
+    Parameters
+    -----------
+    objects : [object]
+        The objects whose parameters are fixed.
+    """
+
+    global fixed_objects
+
+    previous_fixed_objects = list(fixed_objects.values())
+
+    fixed_objects = {id(obj): obj for obj in objects}
+
+    profile_grid_cache.clear()
+    inversion_cache.clear()
+
+    return previous_fixed_objects
+
+
+fixed_objects = {}
+
+profile_grid_cache_size = 32
+
+profile_grid_cache = ProfileGridCache(maxsize=profile_grid_cache_size)
+
+inversion_cache_size = 8
+
+inversion_cache = ProfileGridCache(maxsize=inversion_cache_size)
+
+
+def scaling_factors_between_planes_from_plane_redshifts_and_cosmology(
+    plane_redshifts, cosmology
+):
+    """Given the redshifts of the planes of a tracer and a cosmology, return the matrix of scaling factors used to \
+    rescale deflection angles in multi-plane ray-tracing.
+
+    Entry [i, j] (for i < j) is the factor by which the deflection angles of plane i are scaled when tracing to \
+    plane j, where the last plane is the final (source) plane. All other entries are zero.
+
+    Computing these factors requires astropy distance integrals, therefore the matrix is cached for every unique \
+    set of plane redshifts and cosmology and shared by all tracers with the same plane redshifts. The returned array \
+    is read-only for this reason.
+
+    Parameters
+    -----------
+    plane_redshifts : [float]
+        The redshifts of the planes of the tracer, in ascending order.
+    cosmology : astropy.cosmology
+        The cosmology of the ray-tracing calculation.
+    """
+    return _scaling_factors_between_planes_from_plane_redshifts_and_cosmology_key(
+        plane_redshifts=tuple(plane_redshifts),
+        cosmology_key=CosmologyKey(cosmology=cosmology),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _scaling_factors_between_planes_from_plane_redshifts_and_cosmology_key(
+    plane_redshifts, cosmology_key
+):
+
+    total_planes = len(plane_redshifts)
+
+    scaling_factors = np.zeros(shape=(total_planes, total_planes))
+
+    for plane_index in range(total_planes):
+        for previous_plane_index in range(plane_index):
+            scaling_factors[
+                previous_plane_index, plane_index
+            ] = cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                redshift_0=plane_redshifts[previous_plane_index],
+                redshift_1=plane_redshifts[plane_index],
+                redshift_final=plane_redshifts[-1],
+                cosmology=cosmology_key.cosmology,
+            )
+
+    scaling_factors.flags.writeable = False
+
+    return scaling_factors
+
+
+@decorator_util.jit()
+def traced_grids_of_planes_subtract_scaled_deflections_of_plane(
+    traced_grids_of_planes, deflections, scaling_factors, plane_index
+):
+    """Subtract the deflection angles of one plane, rescaled by the multi-plane scaling factors, from the traced \
+    grids of every plane behind it.
+
+    This is the update step of the multi-plane ray-tracing recurrence. Calling it for each plane in ascending \
+    redshift order (using the deflections computed on that plane's fully traced grid) gives the traced grid of \
+    every plane. The update is performed in-place, so no temporary arrays are allocated.
+
+    Parameters
+    -----------
+    traced_grids_of_planes : ndarray
+        The (total_planes, total_coordinates, 2) buffer of traced (y,x) coordinates of every plane, which is updated \
+        in-place.
+    deflections : ndarray
+        The (total_coordinates, 2) deflection angles of the plane at *plane_index*, computed on its traced grid.
+    scaling_factors : ndarray
+        The (total_planes, total_planes) matrix of scaling factors between planes (see \
+        *scaling_factors_between_planes_from_plane_redshifts_and_cosmology*).
+    plane_index : int
+        The index of the plane whose deflections are subtracted.
+    """
+
+    for next_plane_index in range(plane_index + 1, traced_grids_of_planes.shape[0]):
+
+        scaling_factor = scaling_factors[plane_index, next_plane_index]
+
+        for coordinate_index in range(traced_grids_of_planes.shape[1]):
+            traced_grids_of_planes[next_plane_index, coordinate_index, 0] -= (
+                scaling_factor * deflections[coordinate_index, 0]
+            )
+            traced_grids_of_planes[next_plane_index, coordinate_index, 1] -= (
+                scaling_factor * deflections[coordinate_index, 1]
+            )
+
+    return traced_grids_of_planes
+
+
+@decorator_util.jit()
+def maximum_separations_from_grid_1d_and_group_sizes(grid_1d, group_sizes):
+    """Compute the maximum separation between any two (y,x) coordinates of every group of coordinates in a grid, \
+    where the groups are stored consecutively (e.g. the traced positions of every set of multiple images).
+
+    This is used to reject lens models whose positions do not trace close to one another in the source-plane \
+    before any expensive calculation is performed, so every group is computed in one compiled call.
+
+    Parameters
+    -----------
+    grid_1d : ndarray
+        The (total_coordinates, 2) (y,x) coordinates of every group.
+    group_sizes : ndarray
+        The number of coordinates in every group.
+    """
+
+    maximum_separations = np.zeros(group_sizes.shape[0])
+
+    group_start = 0
+
+    for group_index in range(group_sizes.shape[0]):
+
+        group_end = group_start + group_sizes[group_index]
+
+        maximum_separation_squared = 0.0
+
+        for i in range(group_start, group_end):
+            for j in range(i + 1, group_end):
+
+                separation_squared = (grid_1d[i, 0] - grid_1d[j, 0]) ** 2 + (
+                    grid_1d[i, 1] - grid_1d[j, 1]
+                ) ** 2
+
+                if separation_squared > maximum_separation_squared:
+                    maximum_separation_squared = separation_squared
+
+        maximum_separations[group_index] = np.sqrt(maximum_separation_squared)
+
+        group_start = group_end
+
+    return maximum_separations
@@ -0,0 +1,139 @@
+import contextlib
+import io
+import multiprocessing
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+memory_mapped_array_minimum_bytes = 4096
+
+
+def multiprocessing_context():
+    """The multiprocessing context worker processes are started with.
+
+    The fork start method is used where available, so workers inherit the read-only inputs of this process (e.g. a \
+    masked imaging and its hyper images) copy-on-write instead of each receiving a pickled copy.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+@contextlib.contextmanager
+def pool_from_processes_and_initializer(processes, initializer=None, initargs=()):
+    """A pool of worker processes started with *multiprocessing_context*, which is terminated and joined when the \
+    *with* block using it exits (including when it raises an exception), such that no worker outlives it.
+
+    Parameters
+    ----------
+    processes : int
+        The number of worker processes.
+    initializer : callable or None
+        The function every worker process calls with *initargs* when it starts.
+    initargs : tuple
+        The arguments of *initializer*.
+    """
+
+    pool = multiprocessing_context().Pool(
+        processes=processes, initializer=initializer, initargs=initargs
+    )
+
+    try:
+        yield pool
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+class MemoryMappingPickler(pickle.Pickler):
+    def __init__(
+        self, file, directory, minimum_bytes=memory_mapped_array_minimum_bytes
+    ):
+        """A pickler which saves every array of the pickled object to a .npy file in a directory instead of copying \
+        its values into the pickle, such that unpickling the object memory-maps these files read-only.
+
+        Every process that unpickles the object therefore shares one copy of its arrays (in the page cache of the \
+        files), instead of each holding its own copy. The attributes of an array subclass (e.g. the mask of an \
+        *aa.Array* or the interpolator of an *aa.Grid*) are pickled as normal.
+
+        Parameters
+        ----------
+        file : file
+            The binary file the pickle is written to.
+        directory : str
+            The directory the .npy files of the arrays are saved in, which must exist for as long as the pickle is \
+            unpickled.
+        minimum_bytes : int
+            Arrays smaller than this are copied into the pickle, as memory-mapping them saves no memory.
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.directory = directory
+        self.minimum_bytes = minimum_bytes
+        self.total_memory_mapped_arrays = 0
+
+    def reducer_override(self, obj):
+
+        if (
+            not isinstance(obj, np.ndarray)
+            or obj.dtype.hasobject
+            or obj.nbytes < self.minimum_bytes
+        ):
+            return NotImplemented
+
+        file_path = os.path.join(
+            self.directory, "array_{}.npy".format(self.total_memory_mapped_arrays)
+        )
+        self.total_memory_mapped_arrays += 1
+
+        np.save(file_path, np.asarray(obj))
+
+        cls = np.ndarray if isinstance(obj, np.memmap) else type(obj)
+
+        return (
+            memory_mapped_array_from_file_path_and_class,
+            (file_path, cls),
+            getattr(obj, "__dict__", None) or None,
+            None,
+            None,
+            set_attributes_of_array,
+        )
+
+
+def memory_mapped_array_from_file_path_and_class(file_path, cls):
+    """Memory-map the .npy file of an array saved by a *MemoryMappingPickler* read-only, as a view of its class."""
+    return np.load(file_path, mmap_mode="r").view(cls)
+
+
+def set_attributes_of_array(array, attributes):
+    array.__dict__.update(attributes)
+
+
+@contextlib.contextmanager
+def memory_mapped_pickle_from_obj(obj, minimum_bytes=memory_mapped_array_minimum_bytes):
+    """Pickle an object with a *MemoryMappingPickler*, whose arrays are saved to a temporary directory which is \
+    removed when the *with* block using the pickle exits.
+
+    Passing this pickle to worker processes, which unpickle it when they start, gives every worker the object's \
+    read-only arrays (e.g. the image, noise-map, grids and convolver of a masked imaging) as memory-maps of the \
+    same files, whichever start method the workers use.
+
+    Parameters
+    ----------
+    obj : object
+        The object that is pickled.
+    minimum_bytes : int
+        Arrays smaller than this are copied into the pickle instead of being memory-mapped.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        file = io.BytesIO()
+
+        MemoryMappingPickler(
+            file=file, directory=directory, minimum_bytes=minimum_bytes
+        ).dump(obj)
+
+        yield file.getvalue()
@@ -0,0 +1,160 @@
+import numpy as np
+
+from autoarray.structures import visibilities
+from autolens import decorator_util
+
+
+@decorator_util.jit()
+def visibilities_of_images_via_preload_jit(images, preloaded_reals, preloaded_imags):
+    """Compute the real and imaginary visibilities of a stack of 1D images using the preloaded direct Fourier \
+    transforms of a *Transformer*, in one sweep over the preloaded transforms.
+
+    The preloaded transforms are the largest arrays of a transform, so reading them once for every image instead of \
+    once per image is what makes the transform of many images cheaper. The visibilities of every image are summed in \
+    the same order as *Transformer.visibilities_from_image*, so they are identical to transforming it individually.
+
+    Parameters
+    -----------
+    images : ndarray
+        The 1D images of shape (total_image_pixels, total_images).
+    preloaded_reals : ndarray
+        The preloaded real transforms of shape (total_image_pixels, total_visibilities).
+    preloaded_imags : ndarray
+        The preloaded imaginary transforms of shape (total_image_pixels, total_visibilities).
+    """
+
+    real_visibilities = np.zeros((preloaded_reals.shape[1], images.shape[1]))
+    imag_visibilities = np.zeros((preloaded_imags.shape[1], images.shape[1]))
+
+    for image_1d_index in range(images.shape[0]):
+        for vis_1d_index in range(preloaded_reals.shape[1]):
+
+            preloaded_real = preloaded_reals[image_1d_index, vis_1d_index]
+            preloaded_imag = preloaded_imags[image_1d_index, vis_1d_index]
+
+            for image_index in range(images.shape[1]):
+                real_visibilities[vis_1d_index, image_index] += (
+                    images[image_1d_index, image_index] * preloaded_real
+                )
+                imag_visibilities[vis_1d_index, image_index] += (
+                    images[image_1d_index, image_index] * preloaded_imag
+                )
+
+    return real_visibilities, imag_visibilities
+
+
+@decorator_util.jit()
+def visibilities_of_images_jit(images, grid_radians, uv_wavelengths):
+    """Compute the real and imaginary visibilities of a stack of 1D images using a direct Fourier transform, where \
+    the cosine and sine of every image pixel and visibility are computed once for all images.
+
+    Parameters
+    -----------
+    images : ndarray
+        The 1D images of shape (total_image_pixels, total_images).
+    grid_radians : ndarray
+        The (y,x) coordinates of every image pixel in radians.
+    uv_wavelengths : ndarray
+        The (u,v) coordinates of every visibility in wavelengths.
+    """
+
+    real_visibilities = np.zeros((uv_wavelengths.shape[0], images.shape[1]))
+    imag_visibilities = np.zeros((uv_wavelengths.shape[0], images.shape[1]))
+
+    for image_1d_index in range(images.shape[0]):
+        for vis_1d_index in range(uv_wavelengths.shape[0]):
+
+            phase = (
+                -2.0
+                * np.pi
+                * (
+                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
+                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
+                )
+            )
+
+            cos_phase = np.cos(phase)
+            sin_phase = np.sin(phase)
+
+            for image_index in range(images.shape[1]):
+                real_visibilities[vis_1d_index, image_index] += (
+                    images[image_1d_index, image_index] * cos_phase
+                )
+                imag_visibilities[vis_1d_index, image_index] += (
+                    images[image_1d_index, image_index] * sin_phase
+                )
+
+    return real_visibilities, imag_visibilities
+
+
+def visibilities_of_images_from_images_and_transformer(images, transformer):
+    """Compute the visibilities of a list of images (e.g. the profile images of every galaxy or plane of a tracer) \
+    by transforming them together, instead of calling *visibilities_from_image* once per image.
+
+    The images are stacked into one (total_image_pixels, total_images) array. A *NUFFTTransformer* (or any \
+    transformer with a *complex_visibilities_from_images* method) transforms it using one batched FFT and one \
+    sparse matrix-matrix product, and a *Transformer* using one sweep over its direct Fourier transforms. Images \
+    which are all zeros (e.g. of galaxies without a light profile) are not transformed and their visibilities are \
+    zeros.
+
+    Parameters
+    ----------
+    images : [aa.Array]
+        The 1D images whose visibilities are computed.
+    transformer : aa.Transformer
+        The transformer of the masked interferometer.
+    """
+
+    total_visibilities = transformer.uv_wavelengths.shape[0]
+
+    visibilities_of_images = [
+        visibilities.Visibilities.zeros(shape_1d=(total_visibilities,))
+        for image in images
+    ]
+
+    images_1d = [np.asarray(image.in_1d_binned, dtype="float") for image in images]
+
+    image_indexes = [
+        image_index
+        for image_index, image_1d in enumerate(images_1d)
+        if np.any(image_1d != 0.0)
+    ]
+
+    if not image_indexes:
+        return visibilities_of_images
+
+    stacked_images = np.stack(
+        [images_1d[image_index] for image_index in image_indexes], axis=1
+    )
+
+    if hasattr(transformer, "complex_visibilities_from_images"):
+        complex_visibilities = transformer.complex_visibilities_from_images(
+            images=stacked_images.T
+        )
+        real_visibilities = complex_visibilities.real
+        imag_visibilities = complex_visibilities.imag
+    elif transformer.preload_transform:
+        real_visibilities, imag_visibilities = visibilities_of_images_via_preload_jit(
+            images=stacked_images,
+            preloaded_reals=transformer.preload_real_transforms,
+            preloaded_imags=transformer.preload_imag_transforms,
+        )
+    else:
+        real_visibilities, imag_visibilities = visibilities_of_images_jit(
+            images=stacked_images,
+            grid_radians=np.asarray(transformer.grid_radians),
+            uv_wavelengths=transformer.uv_wavelengths,
+        )
+
+    for stacked_index, image_index in enumerate(image_indexes):
+        visibilities_of_images[image_index] = visibilities.Visibilities(
+            visibilities_1d=np.stack(
+                (
+                    real_visibilities[:, stacked_index],
+                    imag_visibilities[:, stacked_index],
+                ),
+                axis=-1,
+            )
+        )
+
+    return visibilities_of_images
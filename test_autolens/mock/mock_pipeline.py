@@ -1,3 +1,5 @@
+import contextlib
+
 import numpy as np
 
 import autofit as af
@@ -16,6 +18,10 @@ class GalaxiesMockAnalysis:
     def fit(self, instance):
         return 1
 
+    @contextlib.contextmanager
+    def worker_pool(self):
+        yield None
+
 
 class MockResults:
     def __init__(
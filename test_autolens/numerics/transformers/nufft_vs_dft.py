@@ -0,0 +1,87 @@
+import time
+
+import autolens as al
+import numpy as np
+
+from autolens.masked import nufft_transformer
+
+# Compare the accuracy and run-time of the visibilities of a lensed source computed with the NUFFT transformer to those
+# of the direct Fourier transform, for an increasing number of visibilities.
+
+real_space_mask = al.mask.circular(
+    shape_2d=(151, 151), pixel_scales=0.05, radius=3.0, sub_size=1
+)
+
+grid = al.masked.grid.from_mask(mask=real_space_mask)
+
+# Setup the lens galaxy's mass (SIE+Shear) and source galaxy light (elliptical Sersic) whose visibilities are computed.
+lens_galaxy = al.Galaxy(
+    redshift=0.5,
+    mass=al.mp.EllipticalIsothermal(
+        centre=(0.0, 0.0), phi=45.0, axis_ratio=0.8, einstein_radius=1.0
+    ),
+    shear=al.mp.ExternalShear(magnitude=0.05, phi=90.0),
+)
+
+source_galaxy = al.Galaxy(
+    redshift=1.0,
+    light=al.lp.EllipticalSersic(
+        centre=(0.1, 0.1),
+        axis_ratio=0.8,
+        phi=60.0,
+        intensity=0.3,
+        effective_radius=1.0,
+        sersic_index=2.5,
+    ),
+)
+
+tracer = al.Tracer.from_galaxies(galaxies=[lens_galaxy, source_galaxy])
+
+image = tracer.profile_image_from_grid(grid=grid)
+
+for total_visibilities in [1000, 10000, 100000]:
+
+    # The uv coverage of an ALMA-like dataset, whose longest baselines resolve the mask's pixels.
+    uv_wavelengths = np.random.RandomState(1).normal(
+        scale=5.0e5, size=(total_visibilities, 2)
+    )
+
+    start = time.time()
+    transformer = al.transformer(
+        uv_wavelengths=uv_wavelengths, grid_radians=grid.in_radians
+    )
+    dft_setup_time = time.time() - start
+
+    start = time.time()
+    visibilities_dft = transformer.visibilities_from_image(image=image)
+    dft_time = time.time() - start
+
+    start = time.time()
+    transformer = nufft_transformer.NUFFTTransformer(
+        uv_wavelengths=uv_wavelengths, grid_radians=grid.in_radians
+    )
+    nufft_setup_time = time.time() - start
+
+    start = time.time()
+    visibilities_nufft = transformer.visibilities_from_image(image=image)
+    nufft_time = time.time() - start
+
+    print(
+        "Visibilities = {}, image pixels = {}".format(total_visibilities, grid.shape_1d)
+    )
+    print(
+        "DFT setup time = {:.4f}s, transform time = {:.4f}s".format(
+            dft_setup_time, dft_time
+        )
+    )
+    print(
+        "NUFFT setup time = {:.4f}s, transform time = {:.4f}s".format(
+            nufft_setup_time, nufft_time
+        )
+    )
+    print(
+        "Maximum fractional difference = {}".format(
+            np.max(np.abs(np.asarray(visibilities_nufft - visibilities_dft)))
+            / np.max(np.abs(np.asarray(visibilities_dft)))
+        )
+    )
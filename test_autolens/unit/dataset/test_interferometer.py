@@ -0,0 +1,132 @@
+import os
+import pickle
+import shutil
+
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens.dataset import interferometer
+from autolens.fit import fit
+
+directory = os.path.dirname(os.path.realpath(__file__))
+
+
+@pytest.fixture(name="npy_path")
+def make_npy_path():
+    npy_path = "{}/../test_files/dataset/interferometer".format(directory)
+
+    yield npy_path
+
+    if os.path.exists(npy_path):
+        shutil.rmtree(npy_path)
+
+
+class TestMemoryMappedInterferometer:
+    def test__from_interferometer_and_directory__arrays_memory_mapped_from_npy_files(
+        self, interferometer_7, npy_path
+    ):
+
+        memory_mapped_interferometer = al.memory_mapped_interferometer.from_interferometer_and_directory(
+            interferometer=interferometer_7, directory=npy_path
+        )
+
+        assert os.path.isfile("{}/visibilities.npy".format(npy_path))
+
+        assert isinstance(memory_mapped_interferometer.visibilities, al.visibilities)
+        assert isinstance(memory_mapped_interferometer.visibilities.base, np.memmap)
+        assert isinstance(memory_mapped_interferometer.uv_wavelengths, np.memmap)
+
+        assert (
+            memory_mapped_interferometer.visibilities == interferometer_7.visibilities
+        ).all()
+        assert (
+            memory_mapped_interferometer.noise_map == interferometer_7.noise_map
+        ).all()
+        assert (
+            memory_mapped_interferometer.uv_wavelengths
+            == interferometer_7.uv_wavelengths
+        ).all()
+        assert (
+            memory_mapped_interferometer.primary_beam == interferometer_7.primary_beam
+        ).all()
+
+    def test__pickle__references_npy_files_instead_of_copying_arrays(
+        self, interferometer_7, npy_path
+    ):
+
+        memory_mapped_interferometer = al.memory_mapped_interferometer.from_interferometer_and_directory(
+            interferometer=interferometer_7, directory=npy_path
+        )
+
+        assert memory_mapped_interferometer.__getstate__()["visibilities_path"] == (
+            os.path.abspath("{}/visibilities.npy".format(npy_path))
+        )
+
+        memory_mapped_interferometer.save(npy_path)
+
+        with open("{}/data.pickle".format(npy_path), "rb") as f:
+            assert b"visibilities.npy" in f.read()
+
+        loaded_interferometer = al.memory_mapped_interferometer.load(
+            "{}/data.pickle".format(npy_path)
+        )
+
+        assert isinstance(
+            loaded_interferometer, interferometer.MemoryMappedInterferometer
+        )
+        assert isinstance(loaded_interferometer.uv_wavelengths, np.memmap)
+        assert (
+            loaded_interferometer.visibilities == interferometer_7.visibilities
+        ).all()
+
+        unpickled_interferometer = pickle.loads(
+            pickle.dumps(memory_mapped_interferometer)
+        )
+
+        assert (unpickled_interferometer.noise_map == interferometer_7.noise_map).all()
+
+    def test__output_interferometer_to_npy__written_in_chunks(
+        self, interferometer_7, npy_path, monkeypatch
+    ):
+
+        monkeypatch.setattr(interferometer, "chunk_size", 3)
+
+        interferometer.output_interferometer_to_npy(
+            interferometer=interferometer_7, directory=npy_path
+        )
+
+        assert (
+            np.load("{}/visibilities.npy".format(npy_path))
+            == interferometer_7.visibilities
+        ).all()
+        assert (
+            np.load("{}/uv_wavelengths.npy".format(npy_path))
+            == interferometer_7.uv_wavelengths
+        ).all()
+
+
+class TestChunkedReductions:
+    def test__chi_squared_and_noise_normalization_in_chunks__same_as_without_chunks(
+        self, monkeypatch
+    ):
+
+        data = np.random.RandomState(1).normal(size=(10, 2))
+        model_data = np.random.RandomState(2).normal(size=(10, 2))
+        noise_map = np.random.RandomState(3).uniform(0.5, 2.0, size=(10, 2))
+
+        chi_squared = fit.chi_squared_from_data_model_data_and_noise_map(
+            data=data, model_data=model_data, noise_map=noise_map
+        )
+        noise_normalization = fit.noise_normalization_from_noise_map(
+            noise_map=noise_map
+        )
+
+        monkeypatch.setattr(fit, "fit_chunk_size", 3)
+
+        assert fit.chi_squared_from_data_model_data_and_noise_map(
+            data=data, model_data=model_data, noise_map=noise_map
+        ) == pytest.approx(chi_squared, 1.0e-8)
+        assert fit.noise_normalization_from_noise_map(
+            noise_map=noise_map
+        ) == pytest.approx(noise_normalization, 1.0e-8)
@@ -0,0 +1,124 @@
+import autolens as al
+import numpy as np
+import pytest
+from autoarray.operators.inversion import inversions as inv
+from autolens.lens import cholesky_inversion
+
+
+class TestRegularizationLogDet:
+    def test__constant_regularization__log_det_same_as_cholesky_of_regularization_matrix(
+        self, sub_grid_7x7
+    ):
+
+        mapper = al.pix.Rectangular(shape=(4, 4)).mapper_from_grid_and_sparse_grid(
+            grid=sub_grid_7x7, sparse_grid=None, inversion_uses_border=False
+        )
+
+        for coefficient in [0.1, 1.0, 10.0]:
+
+            regularization_matrix, log_det = cholesky_inversion.regularization_matrix_and_log_det_from_mapper_and_regularization(
+                mapper=mapper, regularization=al.reg.Constant(coefficient=coefficient)
+            )
+
+            assert regularization_matrix == pytest.approx(
+                al.reg.Constant(
+                    coefficient=coefficient
+                ).regularization_matrix_from_mapper(mapper=mapper),
+                1.0e-8,
+            )
+            assert log_det == pytest.approx(
+                inv.Inversion.log_determinant_of_matrix_cholesky(regularization_matrix),
+                1.0e-6,
+            )
+
+    def test__rectangular_laplacian_eigenvalues_same_as_eigenvalues_of_regularization_matrix(
+        self, sub_grid_7x7
+    ):
+
+        mapper = al.pix.Rectangular(shape=(3, 4)).mapper_from_grid_and_sparse_grid(
+            grid=sub_grid_7x7, sparse_grid=None, inversion_uses_border=False
+        )
+
+        laplacian_eigenvalues = cholesky_inversion.laplacian_eigenvalues_from_rectangular_shape(
+            shape_2d=(3, 4)
+        )
+
+        regularization_matrix = al.reg.Constant(
+            coefficient=1.0
+        ).regularization_matrix_from_mapper(mapper=mapper)
+
+        assert laplacian_eigenvalues.shape == (12,)
+        assert np.sort(laplacian_eigenvalues) == pytest.approx(
+            np.linalg.eigvalsh(regularization_matrix) - 1.0e-8, abs=1.0e-8
+        )
+
+
+class TestCholeskyInversionImaging:
+    def test__reconstruction_and_evidence_terms_same_as_inversion(
+        self, sub_grid_7x7, masked_imaging_7x7
+    ):
+
+        mapper = al.pix.Rectangular(shape=(3, 3)).mapper_from_grid_and_sparse_grid(
+            grid=sub_grid_7x7, sparse_grid=None, inversion_uses_border=False
+        )
+
+        image = masked_imaging_7x7.mask.mapping.array_stored_1d_from_array_1d(
+            array_1d=np.arange(1.0, 10.0)
+        )
+
+        inversion = inv.InversionImaging.from_data_mapper_and_regularization(
+            image=image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=mapper,
+            regularization=al.reg.Constant(coefficient=1.0),
+        )
+
+        cholesky_inversion_imaging = cholesky_inversion.CholeskyInversionImaging.from_blurred_mapping_matrix_and_data(
+            image=image,
+            noise_map=masked_imaging_7x7.noise_map,
+            mapper=mapper,
+            regularization=al.reg.Constant(coefficient=1.0),
+            blurred_mapping_matrix=inversion.blurred_mapping_matrix,
+        )
+
+        assert cholesky_inversion_imaging.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-6
+        )
+        assert cholesky_inversion_imaging.regularization_term == pytest.approx(
+            inversion.regularization_term, 1.0e-6
+        )
+        assert (
+            cholesky_inversion_imaging.log_det_curvature_reg_matrix_term
+            == pytest.approx(inversion.log_det_curvature_reg_matrix_term, 1.0e-6)
+        )
+        assert (
+            cholesky_inversion_imaging.log_det_regularization_matrix_term
+            == pytest.approx(inversion.log_det_regularization_matrix_term, 1.0e-6)
+        )
+
+    def test__tracer_inversion_is_cholesky_inversion(
+        self, sub_grid_7x7, masked_imaging_7x7
+    ):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(3, 3)),
+                    regularization=al.reg.Constant(coefficient=1.0),
+                ),
+            ]
+        )
+
+        inversion = tracer.inversion_imaging_from_grid_and_data(
+            grid=sub_grid_7x7,
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+        )
+
+        assert isinstance(inversion, cholesky_inversion.CholeskyInversionImaging)
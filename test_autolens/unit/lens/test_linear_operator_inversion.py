@@ -0,0 +1,155 @@
+import autolens as al
+import numpy as np
+import pytest
+from autoarray.operators.inversion import inversions as inv
+from autolens import exc
+from autolens.lens import linear_operator_inversion
+
+
+class TestCurvatureKernel:
+    def test__kernel_same_as_direct_sum_over_visibilities(
+        self, masked_interferometer_7
+    ):
+
+        curvature_kernel = linear_operator_inversion.CurvatureKernel.from_transformer_and_noise_map(
+            transformer=masked_interferometer_7.transformer,
+            noise_map=masked_interferometer_7.noise_map,
+        )
+
+        transformer = curvature_kernel.transformer
+
+        assert curvature_kernel.kernel.shape == (5, 5)
+
+        for separation_y, separation_x in [(0, 0), (1, 0), (0, 2), (-2, 1)]:
+
+            kernel_value = np.sum(
+                np.cos(
+                    2.0
+                    * np.pi
+                    * (
+                        separation_x
+                        * transformer.pixel_scales_radians[1]
+                        * masked_interferometer_7.interferometer.uv_wavelengths[:, 0]
+                        + separation_y
+                        * transformer.pixel_scales_radians[0]
+                        * masked_interferometer_7.interferometer.uv_wavelengths[:, 1]
+                    )
+                )
+                / np.square(masked_interferometer_7.noise_map[:, 0])
+            )
+
+            assert curvature_kernel.kernel[
+                separation_y + 2, separation_x + 2
+            ] == pytest.approx(kernel_value, abs=1.0e-4)
+
+    def test__different_real_and_imaginary_noise__raises_exception(
+        self, masked_interferometer_7
+    ):
+
+        noise_map = np.array(masked_interferometer_7.noise_map)
+        noise_map[0, 1] = 3.0
+
+        with pytest.raises(exc.SettingsException):
+            linear_operator_inversion.CurvatureKernel.from_transformer_and_noise_map(
+                transformer=masked_interferometer_7.transformer, noise_map=noise_map
+            )
+
+
+class TestLinearOperatorInversionInterferometer:
+    def test__reconstruction_and_evidence_terms_same_as_inversion(
+        self, sub_grid_7x7, masked_interferometer_7
+    ):
+
+        mapper = al.pix.Rectangular(shape=(3, 3)).mapper_from_grid_and_sparse_grid(
+            grid=sub_grid_7x7, sparse_grid=None, inversion_uses_border=False
+        )
+
+        inversion = inv.InversionInterferometer.from_data_mapper_and_regularization(
+            visibilities=masked_interferometer_7.visibilities,
+            noise_map=masked_interferometer_7.noise_map,
+            transformer=masked_interferometer_7.transformer,
+            mapper=mapper,
+            regularization=al.reg.Constant(coefficient=1.0),
+        )
+
+        linear_operator_inversion_interferometer = linear_operator_inversion.LinearOperatorInversionInterferometer.from_data_mapper_and_regularization(
+            visibilities=masked_interferometer_7.visibilities,
+            noise_map=masked_interferometer_7.noise_map,
+            transformer=masked_interferometer_7.transformer,
+            mapper=mapper,
+            regularization=al.reg.Constant(coefficient=1.0),
+            curvature_kernel=linear_operator_inversion.CurvatureKernel.from_transformer_and_noise_map(
+                transformer=masked_interferometer_7.transformer,
+                noise_map=masked_interferometer_7.noise_map,
+            ),
+        )
+
+        assert (
+            linear_operator_inversion_interferometer.transformed_mapping_matrices
+            is None
+        )
+
+        assert (
+            linear_operator_inversion_interferometer.curvature_reg_matrix
+            == pytest.approx(inversion.curvature_reg_matrix, abs=1.0e-4)
+        )
+        assert linear_operator_inversion_interferometer.reconstruction == pytest.approx(
+            inversion.reconstruction, abs=1.0e-4
+        )
+        assert np.asarray(
+            linear_operator_inversion_interferometer.mapped_reconstructed_visibilities
+        ) == pytest.approx(
+            np.asarray(inversion.mapped_reconstructed_visibilities), abs=1.0e-4
+        )
+        assert (
+            linear_operator_inversion_interferometer.log_det_curvature_reg_matrix_term
+            == pytest.approx(inversion.log_det_curvature_reg_matrix_term, 1.0e-4)
+        )
+        assert (
+            linear_operator_inversion_interferometer.log_det_regularization_matrix_term
+            == pytest.approx(inversion.log_det_regularization_matrix_term, 1.0e-4)
+        )
+
+    def test__fit_with_linear_operators__same_evidence_as_fit_without(
+        self, interferometer_7, mask_7x7, visibilities_mask_7x2
+    ):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(3, 3)),
+                    regularization=al.reg.Constant(coefficient=1.0),
+                ),
+            ]
+        )
+
+        masked_interferometer = al.masked.interferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7x2,
+            real_space_mask=mask_7x7,
+        )
+
+        masked_interferometer_linear_operators = al.masked.interferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7x2,
+            real_space_mask=mask_7x7,
+            inversion_uses_linear_operators=True,
+        )
+
+        assert masked_interferometer.curvature_kernel is None
+
+        fit = al.fit(masked_dataset=masked_interferometer, tracer=tracer)
+
+        fit_linear_operators = al.fit(
+            masked_dataset=masked_interferometer_linear_operators, tracer=tracer
+        )
+
+        assert isinstance(
+            fit_linear_operators.inversion,
+            linear_operator_inversion.LinearOperatorInversionInterferometer,
+        )
+        assert fit_linear_operators.evidence == pytest.approx(fit.evidence, 1.0e-4)
@@ -1,7 +1,10 @@
 import autolens as al
+from autolens.lens import ray_tracing
+from autolens.masked.nufft_transformer import NUFFTTransformer
 from skimage import measure
 import numpy as np
 import pytest
+import scipy.signal
 from astropy import cosmology as cosmo
 from test_autoarray.mock import mock_inversion as mock_inv
 
@@ -1135,6 +1138,19 @@ class TestAbstractTracerCosmology:
             1.0, 1e-4
         )
 
+        assert tracer.scaling_factors_between_planes[0, 1] == pytest.approx(
+            0.9348, 1e-4
+        )
+        assert tracer.scaling_factors_between_planes[1, 2] == pytest.approx(0.754, 1e-4)
+        assert tracer.scaling_factors_between_planes[2, 3] == pytest.approx(1.0, 1e-4)
+
+        tracer_new = al.Tracer.from_galaxies(galaxies=[g0, g1, g2, g3])
+
+        assert (
+            tracer_new.scaling_factors_between_planes
+            is tracer.scaling_factors_between_planes
+        )
+
     def test__6_galaxies__tracer_planes_are_correct(self):
 
         g0 = al.Galaxy(redshift=2.0)
@@ -1657,6 +1673,139 @@ class TestAbstractTracerLensing:
 
             assert len(traced_grids_of_planes) == 2
 
+        def test__traced_grids_keep_grid_type_and_mask__input_grid_is_unchanged(
+            self, sub_grid_7x7_simple, gal_x1_mp
+        ):
+
+            grid_before = np.array(sub_grid_7x7_simple)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7_simple
+            )
+
+            assert type(traced_grids_of_planes[0]) is type(sub_grid_7x7_simple)
+            assert type(traced_grids_of_planes[1]) is type(sub_grid_7x7_simple)
+            assert (traced_grids_of_planes[1].mask == sub_grid_7x7_simple.mask).all()
+            assert traced_grids_of_planes[1].sub_size == sub_grid_7x7_simple.sub_size
+
+            assert (np.array(sub_grid_7x7_simple) == grid_before).all()
+
+    class TestTracedGridsCache:
+        def test__same_grid_traced_twice__traced_grids_reused_from_cache(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            traced_grids_of_planes_cached = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert traced_grids_of_planes_cached[1] is traced_grids_of_planes[1]
+
+            traced_grids_of_planes_limited = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=0
+            )
+
+            assert len(traced_grids_of_planes_limited) == 1
+            assert traced_grids_of_planes_limited[0] is traced_grids_of_planes[0]
+
+        def test__grid_with_same_values__only_reused_if_cached_by_content(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            traced_grids_of_planes_copy = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7.copy()
+            )
+
+            assert traced_grids_of_planes_copy[1] is not traced_grids_of_planes[1]
+            assert (traced_grids_of_planes_copy[1] == traced_grids_of_planes[1]).all()
+
+            tracer.traced_grids_cached_by_content = True
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            traced_grids_of_planes_copy = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7.copy()
+            )
+
+            assert traced_grids_of_planes_copy[1] is traced_grids_of_planes[1]
+
+        def test__clear_cache__grid_is_traced_again(self, sub_grid_7x7, gal_x1_mp):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            tracer.clear_traced_grids_of_planes_cache(grid=sub_grid_7x7)
+
+            traced_grids_of_planes_new = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert traced_grids_of_planes_new[1] is not traced_grids_of_planes[1]
+            assert (traced_grids_of_planes_new[1] == traced_grids_of_planes[1]).all()
+
+            tracer.clear_traced_grids_of_planes_cache()
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert traced_grids_of_planes_new[1] is not traced_grids_of_planes[1]
+
+        def test__mappers_relocate_traced_grids__cached_traced_grids_unchanged(
+            self, sub_grid_7x7
+        ):
+
+            galaxy_pix = al.Galaxy(
+                redshift=1.0,
+                pixelization=al.pix.Rectangular(shape=(3, 3)),
+                regularization=al.reg.Constant(),
+            )
+
+            lens_galaxy = al.Galaxy(
+                redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=2.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[lens_galaxy, galaxy_pix])
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            source_plane_grid = np.array(traced_grids_of_planes[1])
+
+            tracer.mappers_of_planes_from_grid(
+                grid=sub_grid_7x7, inversion_uses_border=True
+            )
+
+            assert (np.array(traced_grids_of_planes[1]) == source_plane_grid).all()
+
     class TestProfileImages:
         def test__x1_plane__single_plane_tracer(self, sub_grid_7x7):
             g0 = al.Galaxy(
@@ -2816,11 +2965,39 @@ class TestAbstractTracerData:
                 grid=sub_grid_7x7, psf=psf_3x3, blurring_grid=blurring_grid_7x7
             )
 
-            assert (blurred_images[0].in_1d == blurred_image_0.in_1d).all()
-            assert (blurred_images[1].in_1d == blurred_image_1.in_1d).all()
+            assert blurred_images[0].in_1d == pytest.approx(
+                blurred_image_0.in_1d, 1.0e-4
+            )
+            assert blurred_images[1].in_1d == pytest.approx(
+                blurred_image_1.in_1d, 1.0e-4
+            )
 
-            assert (blurred_images[0].in_2d == blurred_image_0.in_2d).all()
-            assert (blurred_images[1].in_2d == blurred_image_1.in_2d).all()
+            assert blurred_images[0].in_2d == pytest.approx(
+                blurred_image_0.in_2d, 1.0e-4
+            )
+            assert blurred_images[1].in_2d == pytest.approx(
+                blurred_image_1.in_2d, 1.0e-4
+            )
+
+        def test__blurred_images_of_planes_from_grid_and_psf__single_fft_convolution_matches_direct_convolution(
+            self
+        ):
+
+            psf = al.kernel.manual_2d(
+                array=np.array([[0.0, 1.0, 0.0], [1.0, 2.0, 3.0], [0.0, 1.0, 0.0]]),
+                pixel_scales=1.0,
+            )
+
+            arrays_2d = [np.random.random((7, 7)), np.random.random((7, 7))]
+
+            blurred_arrays_2d = ray_tracing.blurred_arrays_2d_from_arrays_2d_and_psf(
+                arrays_2d=arrays_2d, psf=psf
+            )
+
+            for array_2d, blurred_array_2d in zip(arrays_2d, blurred_arrays_2d):
+                assert blurred_array_2d == pytest.approx(
+                    scipy.signal.convolve2d(array_2d, psf.in_2d, mode="same"), 1.0e-8
+                )
 
         def test__blurred_image_from_grid_and_convolver(
             self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
@@ -2918,6 +3095,61 @@ class TestAbstractTracerData:
             assert (blurred_images[0].in_2d == blurred_image_0.in_2d).all()
             assert (blurred_images[1].in_2d == blurred_image_1.in_2d).all()
 
+        def test__blurred_images_of_planes__plane_without_light_profile_is_zeros_and_not_convolved(
+            self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.5),
+            )
+            g2 = al.Galaxy(
+                redshift=2.0, light_profile=al.lp.EllipticalSersic(intensity=2.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
+
+            assert tracer.plane_indexes_with_light_profile == [0, 2]
+            assert tracer.plane_indexes_with_mass_profile == [0, 1]
+
+            traced_grids = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+            traced_blurring_grids = tracer.traced_grids_of_planes_from_grid(
+                grid=blurring_grid_7x7
+            )
+
+            blurred_image_2 = tracer.planes[
+                2
+            ].blurred_profile_image_from_grid_and_convolver(
+                grid=traced_grids[2],
+                convolver=convolver_7x7,
+                blurring_grid=traced_blurring_grids[2],
+            )
+
+            blurred_images = tracer.blurred_profile_images_of_planes_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            )
+
+            assert len(blurred_images) == 3
+            assert (blurred_images[1].in_1d == np.zeros(9)).all()
+            assert (blurred_images[2].in_1d == blurred_image_2.in_1d).all()
+
+            blurred_image = tracer.blurred_profile_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            )
+
+            assert blurred_image.in_1d == pytest.approx(
+                sum(blurred_images).in_1d, 1.0e-4
+            )
+
         def test__galaxy_blurred_image_dict_from_grid_and_convolver(
             self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
         ):
@@ -3233,6 +3465,65 @@ class TestAbstractTracerData:
             assert (visibilities_dict[g2] == g2_visibilities).all()
             assert (visibilities_dict[g3] == g3_visibilities).all()
 
+        def test__galaxy_visibilities_dict__batched_transforms_same_as_individual_transforms(
+            self, sub_grid_7x7, uv_wavelengths_7x2
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=0.5,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.5),
+            )
+            g2 = al.Galaxy(
+                redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=5.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2], cosmology=cosmo.Planck15
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            for transformer in [
+                al.transformer(
+                    uv_wavelengths=uv_wavelengths_7x2,
+                    grid_radians=sub_grid_7x7.in_radians,
+                    preload_transform=False,
+                ),
+                NUFFTTransformer(
+                    uv_wavelengths=uv_wavelengths_7x2,
+                    grid_radians=sub_grid_7x7.in_radians,
+                ),
+            ]:
+
+                visibilities_dict = tracer.galaxy_profile_visibilities_dict_from_grid_and_transformer(
+                    grid=sub_grid_7x7, transformer=transformer
+                )
+
+                g0_visibilities = g0.profile_visibilities_from_grid_and_transformer(
+                    grid=traced_grids_of_planes[0], transformer=transformer
+                )
+                g2_visibilities = g2.profile_visibilities_from_grid_and_transformer(
+                    grid=traced_grids_of_planes[1], transformer=transformer
+                )
+
+                assert (visibilities_dict[g0] == g0_visibilities).all()
+                assert (visibilities_dict[g1] == np.zeros((7, 2))).all()
+                assert (visibilities_dict[g2] == g2_visibilities).all()
+
+                visibilities_of_planes = tracer.profile_visibilities_of_planes_from_grid_and_transformer(
+                    grid=sub_grid_7x7, transformer=transformer
+                )
+
+                assert (visibilities_of_planes[0] == g0_visibilities).all()
+                assert (visibilities_of_planes[1] == g2_visibilities).all()
+
     class TestGridIrregularsOfPlanes:
         def test__x2_planes__traced_grid_setup_correctly(self, sub_grid_7x7):
             galaxy_pix = al.Galaxy(
@@ -3514,6 +3805,119 @@ class TestAbstractTracerData:
                 masked_imaging_7x7.image, 1.0e-2
             )
 
+        def test__inversion_imaging__mapper_and_blurred_mapping_matrix_reused_if_mass_and_pixelization_fixed(
+            self, sub_grid_7x7, masked_imaging_7x7
+        ):
+
+            mass = al.mp.SphericalIsothermal(einstein_radius=1.0)
+            pixelization_3x3 = al.pix.Rectangular(shape=(3, 3))
+            pixelization_4x4 = al.pix.Rectangular(shape=(4, 4))
+
+            al.util.lens.set_fixed_objects(
+                objects=[mass, pixelization_3x3, pixelization_4x4]
+            )
+
+            def tracer_from_coefficient_and_pixelization(coefficient, pixelization):
+                return al.Tracer.from_galaxies(
+                    galaxies=[
+                        al.Galaxy(redshift=0.5, mass=mass),
+                        al.Galaxy(
+                            redshift=1.0,
+                            pixelization=pixelization,
+                            regularization=al.reg.Constant(coefficient=coefficient),
+                        ),
+                    ]
+                )
+
+            inversions = [
+                tracer.inversion_imaging_from_grid_and_data(
+                    grid=sub_grid_7x7,
+                    image=masked_imaging_7x7.image,
+                    noise_map=masked_imaging_7x7.noise_map,
+                    convolver=masked_imaging_7x7.convolver,
+                )
+                for tracer in [
+                    tracer_from_coefficient_and_pixelization(
+                        coefficient=1.0, pixelization=pixelization_3x3
+                    ),
+                    tracer_from_coefficient_and_pixelization(
+                        coefficient=2.0, pixelization=pixelization_3x3
+                    ),
+                    tracer_from_coefficient_and_pixelization(
+                        coefficient=2.0, pixelization=pixelization_4x4
+                    ),
+                    tracer_from_coefficient_and_pixelization(
+                        coefficient=2.0, pixelization=al.pix.Rectangular(shape=(3, 3))
+                    ),
+                ]
+            ]
+
+            assert inversions[1].mapper is inversions[0].mapper
+            assert (
+                inversions[1].blurred_mapping_matrix
+                is inversions[0].blurred_mapping_matrix
+            )
+            assert inversions[2].mapper is not inversions[1].mapper
+            assert inversions[3].mapper is not inversions[1].mapper
+
+            inversion = al.inversion(
+                masked_dataset=masked_imaging_7x7,
+                mapper=inversions[0].mapper,
+                regularization=al.reg.Constant(coefficient=2.0),
+            )
+
+            assert inversions[1].reconstruction == pytest.approx(
+                inversion.reconstruction, 1.0e-8
+            )
+            assert inversions[3].reconstruction == pytest.approx(
+                inversion.reconstruction, 1.0e-8
+            )
+
+            al.util.lens.set_fixed_objects(objects=[])
+
+        def test__inversion_cache_pixelization_key__only_if_fixed_and_keyed_by_identity(
+            self
+        ):
+
+            mass = al.mp.SphericalIsothermal(einstein_radius=1.0)
+            pixelization = al.pix.Rectangular(shape=(3, 3))
+
+            source_galaxy = al.Galaxy(
+                redshift=1.0,
+                pixelization=pixelization,
+                regularization=al.reg.Constant(),
+                hyper_galaxy_image=np.ones(9),
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5, mass=mass), source_galaxy]
+            )
+
+            assert (
+                tracer.inversion_cache_pixelization_key_of_plane(
+                    plane_index=1, mass_profiles=[mass]
+                )
+                is None
+            )
+
+            al.util.lens.set_fixed_objects(objects=[mass, pixelization])
+
+            pixelization_key = tracer.inversion_cache_pixelization_key_of_plane(
+                plane_index=1, mass_profiles=[mass]
+            )
+
+            assert pixelization_key == tracer.inversion_cache_pixelization_key_of_plane(
+                plane_index=1, mass_profiles=[mass]
+            )
+
+            source_galaxy.hyper_galaxy_image = np.ones(9)
+
+            assert pixelization_key != tracer.inversion_cache_pixelization_key_of_plane(
+                plane_index=1, mass_profiles=[mass]
+            )
+
+            al.util.lens.set_fixed_objects(objects=[])
+
         def test__x1_inversion_interferometer_in_tracer__performs_inversion_correctly(
             self, sub_grid_7x7, masked_interferometer_7
         ):
@@ -3807,6 +4211,38 @@ class TestTracer:
         #         traced_deflections_of_planes[0].mask == sub_grid_7x7_simple.sub.mask
         #     ).all()
 
+    class TestFromGalaxiesWithMassProfiles:
+        def test__planes_at_every_redshift_only_contain_galaxies_with_mass(
+            self, sub_grid_7x7
+        ):
+
+            lens = al.Galaxy(
+                redshift=0.5,
+                light=al.lp.SphericalSersic(intensity=1.0),
+                mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            lens_light = al.Galaxy(
+                redshift=0.5, light=al.lp.SphericalSersic(intensity=2.0)
+            )
+            source = al.Galaxy(redshift=1.0, light=al.lp.SphericalSersic(intensity=3.0))
+
+            tracer = al.Tracer.from_galaxies_with_mass_profiles(
+                galaxies=[lens, lens_light, source]
+            )
+
+            assert tracer.plane_redshifts == [0.5, 1.0]
+            assert tracer.planes[0].galaxies == [lens]
+            assert tracer.planes[1].galaxies == []
+
+            full_tracer = al.Tracer.from_galaxies(galaxies=[lens, lens_light, source])
+
+            assert tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[
+                -1
+            ] == pytest.approx(
+                full_tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[-1],
+                1.0e-8,
+            )
+
 
 class TestTacerFixedSlices:
     class TestCosmology:
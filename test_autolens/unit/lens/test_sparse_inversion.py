@@ -0,0 +1,121 @@
+import autolens as al
+import numpy as np
+import pytest
+from autoarray.operators.inversion import inversions as inv
+from autolens.lens import sparse_inversion
+
+
+class TestSparseMatrices:
+    def test__mapping_matrix_sparse__same_as_dense_mapping_matrix(self, sub_grid_7x7):
+
+        mapper = al.pix.Rectangular(shape=(3, 3)).mapper_from_grid_and_sparse_grid(
+            grid=sub_grid_7x7, sparse_grid=None, inversion_uses_border=False
+        )
+
+        mapping_matrix = sparse_inversion.mapping_matrix_sparse_from_mapper(
+            mapper=mapper
+        )
+
+        assert mapping_matrix.toarray() == pytest.approx(mapper.mapping_matrix, 1.0e-8)
+
+    def test__blurred_mapping_matrix_sparse__same_as_convolver_blurred_mapping_matrix(
+        self, sub_grid_7x7, masked_imaging_7x7
+    ):
+
+        mapper = al.pix.Rectangular(shape=(3, 3)).mapper_from_grid_and_sparse_grid(
+            grid=sub_grid_7x7, sparse_grid=None, inversion_uses_border=False
+        )
+
+        blurred_mapping_matrix = sparse_inversion.blurred_mapping_matrix_sparse_from_mapper_and_convolver(
+            mapper=mapper, convolver=masked_imaging_7x7.convolver
+        )
+
+        assert blurred_mapping_matrix.toarray() == pytest.approx(
+            masked_imaging_7x7.convolver.convolve_mapping_matrix(
+                mapping_matrix=mapper.mapping_matrix
+            ),
+            1.0e-8,
+        )
+
+
+class TestSparseInversionImaging:
+    def test__reconstruction_and_evidence_terms_same_as_dense_inversion(
+        self, sub_grid_7x7, masked_imaging_7x7
+    ):
+
+        mapper = al.pix.Rectangular(shape=(3, 3)).mapper_from_grid_and_sparse_grid(
+            grid=sub_grid_7x7, sparse_grid=None, inversion_uses_border=False
+        )
+
+        image = masked_imaging_7x7.mask.mapping.array_stored_1d_from_array_1d(
+            array_1d=np.arange(1.0, 10.0)
+        )
+
+        inversion = inv.InversionImaging.from_data_mapper_and_regularization(
+            image=image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=mapper,
+            regularization=al.reg.Constant(coefficient=1.0),
+        )
+
+        sparse_inversion_imaging = sparse_inversion.SparseInversionImaging.from_data_mapper_and_regularization(
+            image=image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=mapper,
+            regularization=al.reg.Constant(coefficient=1.0),
+        )
+
+        assert sparse_inversion_imaging.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-6
+        )
+        assert sparse_inversion_imaging.mapped_reconstructed_image == pytest.approx(
+            inversion.mapped_reconstructed_image, 1.0e-6
+        )
+        assert sparse_inversion_imaging.regularization_term == pytest.approx(
+            inversion.regularization_term, 1.0e-6
+        )
+        assert (
+            sparse_inversion_imaging.log_det_curvature_reg_matrix_term
+            == pytest.approx(inversion.log_det_curvature_reg_matrix_term, 1.0e-6)
+        )
+
+    def test__tracer_inversion_with_sparse_matrices_same_as_dense(
+        self, sub_grid_7x7, masked_imaging_7x7
+    ):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(3, 3)),
+                    regularization=al.reg.Constant(coefficient=1.0),
+                ),
+            ]
+        )
+
+        inversion = tracer.inversion_imaging_from_grid_and_data(
+            grid=sub_grid_7x7,
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+        )
+
+        sparse_inversion_imaging = tracer.inversion_imaging_from_grid_and_data(
+            grid=sub_grid_7x7,
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            inversion_uses_sparse_matrices=True,
+        )
+
+        assert isinstance(
+            sparse_inversion_imaging, sparse_inversion.SparseInversionImaging
+        )
+        assert sparse_inversion_imaging.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-6
+        )
@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from astropy import cosmology as cosmo
 
 import autolens as al
 from autolens import exc
@@ -404,3 +405,287 @@ class TestGalaxyOrdering:
         assert galaxies_in_redshift_ordered_planes[4][0].redshift == 1.45
         assert galaxies_in_redshift_ordered_planes[4][1].redshift == 1.55
         assert galaxies_in_redshift_ordered_planes[6][0].redshift == 1.9
+
+
+class TestScalingFactors:
+    def test__3_planes__upper_triangle_matches_cosmology_util__other_entries_zero(self):
+
+        scaling_factors = al.util.lens.scaling_factors_between_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.1, 1.0, 2.0], cosmology=cosmo.Planck15
+        )
+
+        assert scaling_factors.shape == (3, 3)
+        assert scaling_factors[0, 1] == pytest.approx(0.9500, 1e-4)
+        assert scaling_factors[0, 2] == pytest.approx(1.0, 1e-4)
+        assert scaling_factors[1, 2] == pytest.approx(1.0, 1e-4)
+
+        assert scaling_factors[0, 1] == pytest.approx(
+            al.util.cosmology.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                redshift_0=0.1,
+                redshift_1=1.0,
+                redshift_final=2.0,
+                cosmology=cosmo.Planck15,
+            ),
+            1.0e-8,
+        )
+
+        assert (np.tril(scaling_factors) == 0.0).all()
+
+    def test__same_redshifts_and_cosmology__cached_read_only_array_is_shared(self):
+
+        scaling_factors_0 = al.util.lens.scaling_factors_between_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.1, 1.0, 2.0], cosmology=cosmo.Planck15
+        )
+
+        scaling_factors_1 = al.util.lens.scaling_factors_between_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.1, 1.0, 2.0], cosmology=cosmo.Planck15
+        )
+
+        assert scaling_factors_0 is scaling_factors_1
+        assert scaling_factors_0.flags.writeable is False
+
+        scaling_factors_2 = al.util.lens.scaling_factors_between_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.1, 1.0, 2.0], cosmology=cosmo.WMAP9
+        )
+
+        assert scaling_factors_2 is not scaling_factors_0
+        assert scaling_factors_2[0, 1] != scaling_factors_0[0, 1]
+
+
+class TestProfileGridCache:
+    def test__fixed_profiles_and_same_grid__value_is_reused(self):
+
+        profile_grid_cache = al.util.lens.ProfileGridCache(maxsize=2)
+
+        calls = []
+
+        def func():
+            calls.append(1)
+            return np.ones(3)
+
+        profile_0 = al.lp.SphericalSersic(intensity=1.0)
+        profile_1 = al.lp.SphericalSersic(intensity=2.0)
+
+        al.util.lens.set_fixed_objects(objects=[profile_0, profile_1])
+
+        grid = al.grid.uniform(shape_2d=(2, 2), pixel_scales=1.0)
+        grid_key = al.util.lens.grid_key_from_grid(grid=grid)
+
+        value_0 = profile_grid_cache.value_from_profiles_grid_key_and_func(
+            name="profile_image", profiles=[profile_0], grid_key=grid_key, func=func
+        )
+
+        value_1 = profile_grid_cache.value_from_profiles_grid_key_and_func(
+            name="profile_image",
+            profiles=[profile_0],
+            grid_key=al.util.lens.grid_key_from_grid(grid=grid),
+            func=func,
+        )
+
+        assert value_0 is value_1
+        assert len(calls) == 1
+        assert value_0.flags.writeable == False
+
+        profile_grid_cache.value_from_profiles_grid_key_and_func(
+            name="profile_image", profiles=[profile_1], grid_key=grid_key, func=func
+        )
+
+        profile_grid_cache.value_from_profiles_grid_key_and_func(
+            name="profile_image",
+            profiles=[profile_0],
+            grid_key=al.util.lens.grid_key_from_grid(grid=grid.copy()),
+            func=func,
+        )
+
+        assert len(calls) == 3
+        assert len(profile_grid_cache.cache) == 2
+
+        profile_grid_cache.value_from_profiles_grid_key_and_func(
+            name="profile_image", profiles=[], grid_key=grid_key, func=func
+        )
+
+        assert len(calls) == 4
+        assert len(profile_grid_cache.cache) == 2
+
+        al.util.lens.set_fixed_objects(objects=[])
+
+    def test__profiles_which_are_not_fixed__value_is_not_cached(self):
+
+        profile_grid_cache = al.util.lens.ProfileGridCache(maxsize=2)
+
+        calls = []
+
+        def func():
+            calls.append(1)
+            return np.ones(3)
+
+        profile_0 = al.lp.SphericalSersic(intensity=1.0)
+        profile_1 = al.lp.SphericalSersic(intensity=1.0)
+
+        al.util.lens.set_fixed_objects(objects=[profile_0])
+
+        grid = al.grid.uniform(shape_2d=(2, 2), pixel_scales=1.0)
+        grid_key = al.util.lens.grid_key_from_grid(grid=grid)
+
+        for _ in range(2):
+            profile_grid_cache.value_from_profiles_grid_key_and_func(
+                name="profile_image",
+                profiles=[profile_0, profile_1],
+                grid_key=grid_key,
+                func=func,
+            )
+
+        assert len(calls) == 2
+        assert len(profile_grid_cache.cache) == 0
+
+        al.util.lens.set_fixed_objects(objects=[])
+
+        profile_grid_cache.value_from_profiles_grid_key_and_func(
+            name="profile_image", profiles=[profile_0], grid_key=grid_key, func=func
+        )
+
+        assert len(calls) == 3
+        assert len(profile_grid_cache.cache) == 0
+
+    def test__set_fixed_objects__clears_caches_and_returns_previous_fixed_objects(self):
+
+        profile = al.lp.SphericalSersic(intensity=1.0)
+
+        previous_fixed_objects = al.util.lens.set_fixed_objects(objects=[profile])
+
+        assert previous_fixed_objects == []
+
+        grid = al.grid.uniform(shape_2d=(2, 2), pixel_scales=1.0)
+
+        al.util.lens.profile_grid_cache.value_from_profiles_grid_key_and_func(
+            name="profile_image",
+            profiles=[profile],
+            grid_key=al.util.lens.grid_key_from_grid(grid=grid),
+            func=lambda: np.ones(3),
+        )
+
+        assert len(al.util.lens.profile_grid_cache.cache) == 1
+
+        previous_fixed_objects = al.util.lens.set_fixed_objects(objects=[])
+
+        assert previous_fixed_objects[0] is profile
+        assert len(al.util.lens.profile_grid_cache.cache) == 0
+
+    def test__plane_images_and_deflections_of_fixed_profiles_use_cache__match_galaxy_values(
+        self, sub_grid_7x7
+    ):
+
+        light = al.lp.EllipticalSersic(intensity=1.0)
+        mass = al.mp.SphericalIsothermal(einstein_radius=1.0)
+
+        al.util.lens.set_fixed_objects(objects=[light, mass])
+
+        galaxy = al.Galaxy(redshift=0.5, light=light, mass=mass)
+
+        plane = al.Plane(galaxies=[galaxy])
+
+        plane.profile_image_from_grid(grid=sub_grid_7x7)
+        plane.deflections_from_grid(grid=sub_grid_7x7)
+
+        assert len(al.util.lens.profile_grid_cache.cache) == 2
+
+        galaxy = al.Galaxy(redshift=0.5, light=light, mass=mass)
+
+        plane = al.Plane(galaxies=[galaxy])
+
+        assert plane.profile_image_from_grid(grid=sub_grid_7x7) == pytest.approx(
+            galaxy.profile_image_from_grid(grid=sub_grid_7x7), 1.0e-8
+        )
+        assert plane.deflections_from_grid(grid=sub_grid_7x7) == pytest.approx(
+            galaxy.deflections_from_grid(grid=sub_grid_7x7), 1.0e-8
+        )
+        assert len(al.util.lens.profile_grid_cache.cache) == 2
+
+        galaxy = al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=1.0),
+            mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+        )
+
+        plane = al.Plane(galaxies=[galaxy])
+
+        plane.profile_image_from_grid(grid=sub_grid_7x7)
+        plane.deflections_from_grid(grid=sub_grid_7x7)
+
+        assert len(al.util.lens.profile_grid_cache.cache) == 2
+
+        al.util.lens.set_fixed_objects(objects=[])
+
+
+class TestTracedGridsSubtractScaledDeflections:
+    def test__deflections_scaled_and_subtracted_from_planes_behind_plane_only(self):
+
+        traced_grids_of_planes = np.ones(shape=(3, 2, 2))
+
+        deflections = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+        scaling_factors = np.array([[0.0, 0.5, 1.0], [0.0, 0.0, 1.0], [0.0, 0.0, 0.0]])
+
+        traced_grids_of_planes = al.util.lens.traced_grids_of_planes_subtract_scaled_deflections_of_plane(
+            traced_grids_of_planes=traced_grids_of_planes,
+            deflections=deflections,
+            scaling_factors=scaling_factors,
+            plane_index=0,
+        )
+
+        assert (traced_grids_of_planes[0] == np.ones(shape=(2, 2))).all()
+        assert (traced_grids_of_planes[1] == np.array([[0.5, 0.0], [-0.5, -1.0]])).all()
+        assert (
+            traced_grids_of_planes[2] == np.array([[0.0, -1.0], [-2.0, -3.0]])
+        ).all()
+
+        traced_grids_of_planes = al.util.lens.traced_grids_of_planes_subtract_scaled_deflections_of_plane(
+            traced_grids_of_planes=traced_grids_of_planes,
+            deflections=deflections,
+            scaling_factors=scaling_factors,
+            plane_index=1,
+        )
+
+        assert (traced_grids_of_planes[1] == np.array([[0.5, 0.0], [-0.5, -1.0]])).all()
+        assert (
+            traced_grids_of_planes[2] == np.array([[-1.0, -3.0], [-5.0, -7.0]])
+        ).all()
+
+
+class TestMaximumSeparations:
+    def test__maximum_separation_of_every_group_of_coordinates(self):
+
+        grid_1d = np.array(
+            [
+                [0.0, 0.0],
+                [0.0, 1.0],
+                [0.0, 0.5],
+                [-2.0, -4.0],
+                [1.0, 3.0],
+                [0.1, 0.1],
+                [5.0, 5.0],
+            ]
+        )
+
+        maximum_separations = al.util.lens.maximum_separations_from_grid_1d_and_group_sizes(
+            grid_1d=grid_1d, group_sizes=np.array([3, 3, 1])
+        )
+
+        assert maximum_separations == pytest.approx(
+            np.array([1.0, np.sqrt(np.square(3.0) + np.square(7.0)), 0.0]), 1.0e-8
+        )
+
+    def test__matches_max_separation_of_grid_of_positions_fit(self):
+
+        grid_1d = np.random.random((10, 2))
+
+        maximum_separations = al.util.lens.maximum_separations_from_grid_1d_and_group_sizes(
+            grid_1d=grid_1d, group_sizes=np.array([4, 6])
+        )
+
+        assert maximum_separations[0] == pytest.approx(
+            al.fit_positions.max_separation_of_grid(grid=grid_1d[0:4]), 1.0e-8
+        )
+        assert maximum_separations[1] == pytest.approx(
+            al.fit_positions.max_separation_of_grid(grid=grid_1d[4:10]), 1.0e-8
+        )
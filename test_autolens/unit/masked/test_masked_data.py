@@ -1,6 +1,12 @@
 from autoarray.operators import convolver, transformer
 import autolens as al
+from autolens import exc
+from autolens.masked.adaptive_interpolator import AdaptiveInterpolator
+from autolens.masked import fft_convolver
+from autolens.masked.fft_convolver import FFTConvolver
+from autolens.masked.nufft_transformer import NUFFTTransformer
 import numpy as np
+import pytest
 
 
 class TestMaskedImaging:
@@ -73,6 +79,169 @@ class TestMaskedImaging:
             == new_blurring_grid.interpolator.wts
         ).all()
 
+    def test__adaptive_interpolation__grid_and_blurring_grid_share_interp_grid(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = al.masked.imaging(
+            imaging=imaging_7x7,
+            mask=sub_mask_7x7,
+            pixel_scale_interpolation_grid=1.0,
+            psf_shape_2d=(3, 3),
+            interpolation_refinement_levels=2,
+        )
+
+        grid_interpolator = masked_imaging_7x7.grid.interpolator
+        blurring_grid_interpolator = masked_imaging_7x7.blurring_grid.interpolator
+
+        assert isinstance(grid_interpolator, AdaptiveInterpolator)
+        assert grid_interpolator.interp_grid is blurring_grid_interpolator.interp_grid
+        assert grid_interpolator.pixel_scale_interpolation_grid == 1.0
+        assert (grid_interpolator.vtx >= 0).all()
+        assert (blurring_grid_interpolator.vtx >= 0).all()
+
+        uniform_interp_grid = grid_interpolator.interp_grid
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        masked_imaging_7x7 = al.masked.imaging(
+            imaging=imaging_7x7,
+            mask=sub_mask_7x7,
+            pixel_scale_interpolation_grid=1.0,
+            psf_shape_2d=(3, 3),
+            interpolation_refinement_levels=2,
+            preload_interpolation_tracer=tracer,
+        )
+
+        grid_interpolator = masked_imaging_7x7.grid.interpolator
+
+        assert grid_interpolator.interp_grid.shape[0] > uniform_interp_grid.shape[0]
+
+        assert (grid_interpolator.vtx >= 0).all()
+
+    def test__adaptive_interpolation__grid_outside_interp_grid__raises_exception(self):
+
+        interp_grid = np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0]])
+
+        interpolator = AdaptiveInterpolator.list_from_grids_and_interp_grid(
+            grids_=[np.array([[0.25, 0.5], [0.75, 0.5]])],
+            interp_grid=interp_grid,
+            pixel_scale_interpolation_grid=1.0,
+        )[0]
+
+        assert interpolator.interpolated_values_from_values(
+            values=np.array([0.0, 1.0, 2.0, 3.0])
+        ) == pytest.approx(np.array([1.0, 2.0]), 1.0e-4)
+
+        with pytest.raises(exc.SettingsException):
+            AdaptiveInterpolator.list_from_grids_and_interp_grid(
+                grids_=[np.array([[0.5, 0.5], [2.0, 0.5]])],
+                interp_grid=interp_grid,
+                pixel_scale_interpolation_grid=1.0,
+            )
+
+    def test__convolution_backend__fft_convolver_blurs_images_the_same_as_real_space(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_real_space = al.masked.imaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, convolution_backend="real_space"
+        )
+
+        masked_imaging_fft = al.masked.imaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, convolution_backend="fft"
+        )
+
+        assert type(masked_imaging_real_space.convolver) == convolver.Convolver
+        assert type(masked_imaging_fft.convolver) == FFTConvolver
+
+        galaxy = al.Galaxy(
+            redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        blurred_image_real_space = galaxy.blurred_profile_image_from_grid_and_convolver(
+            grid=masked_imaging_real_space.grid,
+            convolver=masked_imaging_real_space.convolver,
+            blurring_grid=masked_imaging_real_space.blurring_grid,
+        )
+
+        blurred_image_fft = galaxy.blurred_profile_image_from_grid_and_convolver(
+            grid=masked_imaging_fft.grid,
+            convolver=masked_imaging_fft.convolver,
+            blurring_grid=masked_imaging_fft.blurring_grid,
+        )
+
+        assert blurred_image_fft.in_1d == pytest.approx(
+            blurred_image_real_space.in_1d, 1.0e-8
+        )
+
+    def test__convolution_backend__batched_images_blur_the_same_as_each_image(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=intensity)
+            )
+            for intensity in [1.0, 2.0, 3.0]
+        ]
+
+        for convolution_backend in ["real_space", "fft"]:
+
+            masked_imaging_7x7 = al.masked.imaging(
+                imaging=imaging_7x7,
+                mask=sub_mask_7x7,
+                convolution_backend=convolution_backend,
+            )
+
+            blurred_images = fft_convolver.convolved_images_from_convolver_images_and_blurring_images(
+                convolver=masked_imaging_7x7.convolver,
+                images=[
+                    galaxy.profile_image_from_grid(grid=masked_imaging_7x7.grid)
+                    for galaxy in galaxies
+                ],
+                blurring_images=[
+                    galaxy.profile_image_from_grid(
+                        grid=masked_imaging_7x7.blurring_grid
+                    )
+                    for galaxy in galaxies
+                ],
+            )
+
+            assert blurred_images.shape == (3, 9)
+
+            for galaxy, blurred_image in zip(galaxies, blurred_images):
+                assert blurred_image == pytest.approx(
+                    galaxy.blurred_profile_image_from_grid_and_convolver(
+                        grid=masked_imaging_7x7.grid,
+                        convolver=masked_imaging_7x7.convolver,
+                        blurring_grid=masked_imaging_7x7.blurring_grid,
+                    ).in_1d_binned,
+                    1.0e-8,
+                )
+
+    def test__convolution_backend__auto_uses_real_space_for_small_psf(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = al.masked.imaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, convolution_backend="auto"
+        )
+
+        assert type(masked_imaging_7x7.convolver) == convolver.Convolver
+
+        with pytest.raises(exc.SettingsException):
+            al.masked.imaging(
+                imaging=imaging_7x7, mask=sub_mask_7x7, convolution_backend="gpu"
+            )
+
     def test__masked_imaging_6x6_with_binned_up_imaging(self, imaging_6x6, mask_6x6):
 
         masked_imaging_6x6 = al.masked.imaging(imaging=imaging_6x6, mask=mask_6x6)
@@ -140,6 +309,9 @@ class TestMaskedImaging:
             positions=[1],
             positions_threshold=2,
             preload_sparse_grids_of_planes=3,
+            interpolation_refinement_levels=1,
+            convolution_backend="fft",
+            inversion_uses_sparse_matrices=True,
         )
 
         masked_imaging_new = masked_imaging_7x7.binned_from_bin_up_factor(
@@ -149,6 +321,9 @@ class TestMaskedImaging:
         assert masked_imaging_new.positions == [1]
         assert masked_imaging_new.positions_threshold == 2
         assert masked_imaging_new.preload_sparse_grids_of_planes == 3
+        assert masked_imaging_new.interpolation_refinement_levels == 1
+        assert masked_imaging_new.convolution_backend == "fft"
+        assert masked_imaging_new.inversion_uses_sparse_matrices == True
 
         masked_imaging_new = masked_imaging_7x7.signal_to_noise_limited_from_signal_to_noise_limit(
             signal_to_noise_limit=0.25
@@ -157,6 +332,9 @@ class TestMaskedImaging:
         assert masked_imaging_new.positions == [1]
         assert masked_imaging_new.positions_threshold == 2
         assert masked_imaging_new.preload_sparse_grids_of_planes == 3
+        assert masked_imaging_new.interpolation_refinement_levels == 1
+        assert masked_imaging_new.convolution_backend == "fft"
+        assert masked_imaging_new.inversion_uses_sparse_matrices == True
 
 
 class TestMaskedInterferometer:
@@ -276,3 +454,169 @@ class TestMaskedInterferometer:
 
         assert (masked_interferometer.positions[0] == np.array([[1.0, 1.0]])).all()
         assert masked_interferometer.positions_threshold == 1.0
+
+    def test__transform_backend__nufft_transformer_visibilities_same_as_dft(
+        self, interferometer_7, sub_mask_7x7, visibilities_mask_7x2
+    ):
+
+        masked_interferometer_dft = al.masked.interferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7x2,
+            real_space_mask=sub_mask_7x7,
+            transform_backend="dft",
+        )
+
+        masked_interferometer_nufft = al.masked.interferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7x2,
+            real_space_mask=sub_mask_7x7,
+            transform_backend="nufft",
+        )
+
+        assert type(masked_interferometer_dft.transformer) == transformer.Transformer
+        assert type(masked_interferometer_nufft.transformer) == NUFFTTransformer
+        assert masked_interferometer_nufft.transform_backend == "nufft"
+
+        galaxy = al.Galaxy(
+            redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        visibilities_dft = galaxy.profile_visibilities_from_grid_and_transformer(
+            grid=masked_interferometer_dft.grid,
+            transformer=masked_interferometer_dft.transformer,
+        )
+
+        visibilities_nufft = galaxy.profile_visibilities_from_grid_and_transformer(
+            grid=masked_interferometer_nufft.grid,
+            transformer=masked_interferometer_nufft.transformer,
+        )
+
+        assert np.asarray(visibilities_nufft) == pytest.approx(
+            np.asarray(visibilities_dft), abs=1.0e-4 * np.max(np.abs(visibilities_dft))
+        )
+
+        mapping_matrix = np.random.RandomState(1).uniform(size=(9, 3))
+
+        transformed_mapping_matrices_dft = masked_interferometer_dft.transformer.transformed_mapping_matrices_from_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )
+        transformed_mapping_matrices_nufft = masked_interferometer_nufft.transformer.transformed_mapping_matrices_from_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )
+
+        for matrix_dft, matrix_nufft in zip(
+            transformed_mapping_matrices_dft, transformed_mapping_matrices_nufft
+        ):
+            assert matrix_nufft == pytest.approx(matrix_dft, abs=1.0e-4)
+
+        with pytest.raises(exc.SettingsException):
+            al.masked.interferometer(
+                interferometer=interferometer_7,
+                visibilities_mask=visibilities_mask_7x2,
+                real_space_mask=sub_mask_7x7,
+                transform_backend="gpu",
+            )
+
+    def test__compressed_from_uv_cell_size__visibilities_averaged_in_uv_cells_and_reversible(
+        self, sub_mask_7x7
+    ):
+
+        interferometer = al.interferometer.manual(
+            visibilities=al.visibilities.manual_1d(
+                visibilities=[[1.0, 2.0], [3.0, 4.0], [5.0, -6.0], [7.0, 8.0]]
+            ),
+            noise_map=al.visibilities.ones(shape_1d=(4,)),
+            uv_wavelengths=np.array(
+                [[100.0, 100.0], [120.0, 130.0], [-110.0, -105.0], [1000.0, 1000.0]]
+            ),
+        )
+
+        masked_interferometer = al.masked.interferometer(
+            interferometer=interferometer,
+            visibilities_mask=np.full(fill_value=False, shape=(4, 2)),
+            real_space_mask=sub_mask_7x7,
+        )
+
+        assert masked_interferometer.visibility_compression is None
+        assert masked_interferometer.uncompressed is masked_interferometer
+
+        compressed_masked_interferometer = masked_interferometer.compressed_from_uv_cell_size(
+            uv_cell_size=200.0
+        )
+
+        assert (
+            compressed_masked_interferometer.visibilities
+            == np.array([[3.0, 4.0], [7.0, 8.0]])
+        ).all()
+        assert compressed_masked_interferometer.noise_map == pytest.approx(
+            np.array([[1.0 / np.sqrt(3.0), 1.0 / np.sqrt(3.0)], [1.0, 1.0]]), 1.0e-4
+        )
+        assert (
+            compressed_masked_interferometer.interferometer.uv_wavelengths
+            == pytest.approx(np.array([[110.0, 335.0 / 3.0], [1000.0, 1000.0]]), 1.0e-4)
+        )
+        assert compressed_masked_interferometer.visibilities_mask.shape == (2, 2)
+        assert (
+            compressed_masked_interferometer.transformer.uv_wavelengths
+            == compressed_masked_interferometer.interferometer.uv_wavelengths
+        ).all()
+
+        visibility_compression = compressed_masked_interferometer.visibility_compression
+
+        assert (
+            visibility_compression.compressed_indexes == np.array([0, 0, 0, 1])
+        ).all()
+        assert visibility_compression.compression_factor == 2.0
+        assert visibility_compression.within_cell_chi_squared == pytest.approx(
+            16.0, 1.0e-4
+        )
+        assert visibility_compression.reduced_within_cell_chi_squared == pytest.approx(
+            4.0, 1.0e-4
+        )
+        assert (
+            visibility_compression.maximum_phase_error_from_grid_radians(
+                grid_radians=compressed_masked_interferometer.grid.in_radians
+            )
+            > 0.0
+        )
+
+        uncompressed_masked_interferometer = (
+            compressed_masked_interferometer.uncompressed
+        )
+
+        assert (
+            uncompressed_masked_interferometer.visibilities
+            == masked_interferometer.visibilities
+        ).all()
+        assert (
+            uncompressed_masked_interferometer.interferometer.uv_wavelengths
+            == masked_interferometer.interferometer.uv_wavelengths
+        ).all()
+        assert uncompressed_masked_interferometer.visibility_compression is None
+
+    def test__compressed_from_uv_cell_size__masked_visibilities_removed(
+        self, interferometer_7, sub_mask_7x7
+    ):
+
+        visibilities_mask = np.full(fill_value=False, shape=(7, 2))
+        visibilities_mask[6, 1] = True
+
+        masked_interferometer = al.masked.interferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask,
+            real_space_mask=sub_mask_7x7,
+        )
+
+        compressed_masked_interferometer = masked_interferometer.compressed_from_uv_cell_size(
+            uv_cell_size=1.0
+        )
+
+        visibility_compression = compressed_masked_interferometer.visibility_compression
+
+        assert visibility_compression.compressed_indexes[6] == -1
+        assert visibility_compression.total_uncompressed_visibilities == 6
+        assert visibility_compression.total_compressed_visibilities == 6
+        assert visibility_compression.reduced_within_cell_chi_squared == 0.0
+
+        with pytest.raises(exc.SettingsException):
+            masked_interferometer.compressed_from_uv_cell_size(uv_cell_size=0.0)
@@ -188,6 +188,45 @@ class TestPhase:
                 tracer=tracer
             )
 
+    def test__fit__positions_which_do_not_trace_within_threshold_are_rejected_before_full_tracer(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=0.0)
+                ),
+                source=al.Galaxy(
+                    redshift=1.0, light=al.lp.SphericalSersic(intensity=1.0)
+                ),
+            ),
+            positions_threshold=0.5,
+            cosmology=cosmo.Planck15,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, positions=[[(1.0, 0.0), (-1.0, 0.0)]]
+        )
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([])
+
+        def tracer_for_instance(instance):
+            raise AssertionError
+
+        analysis.tracer_for_instance = tracer_for_instance
+
+        with pytest.raises(exc.RayTracingException):
+            analysis.fit(instance=instance)
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, positions=[[(1.0, 0.0), (1.0, 0.0)]]
+        )
+
+        analysis.tracer_for_instance = tracer_for_instance
+
+        with pytest.raises(AssertionError):
+            analysis.fit(instance=instance)
+
     def test__make_analysis__inversion_resolution_error_raised_if_above_inversion_pixel_limit(
         self, phase_imaging_7x7, imaging_7x7, mask_7x7
     ):
@@ -697,6 +736,62 @@ class TestResult:
 
         assert result.most_likely_pixelization_grids_of_planes[-1].shape == (6, 2)
 
+    def test__results_pixelization_grids_and_hyper_images__saved_to_arrays_path_and_memory_mapped(
+        self, imaging_7x7, mask_7x7
+    ):
+        clean_images()
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            optimizer_class=mock_pipeline.MockNLO,
+            galaxies=dict(
+                lens=al.Galaxy(
+                    redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.0)
+                ),
+                source=al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.VoronoiBrightnessImage(pixels=6),
+                    regularization=al.reg.Constant(),
+                ),
+            ),
+            inversion_pixel_limit=6,
+            phase_name="test_phase_arrays",
+        )
+
+        phase_imaging_7x7.galaxies.source.hyper_galaxy_image = np.ones(9)
+
+        result = phase_imaging_7x7.run(dataset=imaging_7x7, mask=mask_7x7)
+
+        pixelization_grids_of_planes = result.most_likely_pixelization_grids_of_planes
+
+        assert result.arrays_path.endswith(result.instance_key)
+        assert path.isfile(
+            path.join(result.arrays_path, "pixelization_grids_of_planes.npy")
+        )
+        assert (
+            result.most_likely_pixelization_grids_of_planes
+            is pixelization_grids_of_planes
+        )
+        assert pixelization_grids_of_planes[0] is None
+        assert isinstance(pixelization_grids_of_planes[-1].base, np.memmap)
+        assert pixelization_grids_of_planes[-1] == pytest.approx(
+            result.most_likely_tracer.sparse_image_plane_grids_of_planes_from_grid(
+                grid=result.most_likely_fit.grid
+            )[-1],
+            1.0e-4,
+        )
+
+        hyper_model_image = result.hyper_model_image
+
+        assert path.isfile(path.join(result.arrays_path, "hyper_model_image.npy"))
+        assert result.hyper_model_image is hyper_model_image
+        assert hyper_model_image.in_1d == pytest.approx(
+            sum(
+                hyper_galaxy_image.in_1d
+                for hyper_galaxy_image in result.hyper_galaxy_image_path_dict.values()
+            ),
+            1.0e-4,
+        )
+
 
 class TestPhasePickle:
 
@@ -1,3 +1,5 @@
+import copy
+
 import autofit.optimize.non_linear.paths
 import autolens as al
 import numpy as np
@@ -5,7 +7,11 @@ import pytest
 from astropy import cosmology as cosmo
 
 import autofit as af
+from autolens import exc
 from autolens.fit.fit import ImagingFit
+from autolens.pipeline.phase.abstract import result as abstract_result
+from autolens.pipeline.phase.extensions import hyper_galaxy_phase
+from autolens.pipeline.phase.extensions import hyper_phase_scheduler
 from test_autolens.mock import mock_pipeline
 
 
@@ -69,6 +75,14 @@ class MockAnalysis:
     pass
 
 
+class MockLikelihoodAnalysis:
+    def __init__(self, likelihood):
+        self.likelihood = likelihood
+
+    def fit(self, instance):
+        return self.likelihood
+
+
 # noinspection PyAbstractClass
 class MockOptimizer(af.NonLinearOptimizer):
     @af.convert_paths
@@ -182,11 +196,81 @@ class TestImagePassing:
         assert isinstance(image_dict[("galaxies", "source")], np.ndarray)
 
         result.instance.galaxies.lens = al.Galaxy(redshift=0.5)
+        result.update_instance_key()
 
         image_dict = result.image_galaxy_dict
         assert (image_dict[("galaxies", "lens")].in_2d == np.zeros((7, 7))).all()
         assert isinstance(image_dict[("galaxies", "source")], np.ndarray)
 
+    def test__most_likely_fit__cached_until_instance_key_changes(self, result):
+        most_likely_fit = result.most_likely_fit
+
+        assert result.most_likely_fit is most_likely_fit
+        assert copy.deepcopy(result)._cached_values == {}
+
+        result.instance.galaxies.lens = al.Galaxy(redshift=0.5)
+
+        assert result.most_likely_fit is most_likely_fit
+
+        result.update_instance_key()
+
+        assert result.most_likely_fit is not most_likely_fit
+        assert result.most_likely_fit.tracer.galaxies[0].redshift == 0.5
+
+    def test__instance_key__same_for_same_parameters_and_differs_otherwise(
+        self, result, instance
+    ):
+        instance_key = result.instance_key
+
+        assert instance_key == abstract_result.instance_key_from_instance(
+            instance=copy.deepcopy(instance)
+        )
+
+        result.instance.galaxies.lens.light.intensity = 2.0
+
+        assert result.instance_key == instance_key
+
+        result.update_instance_key()
+
+        assert result.instance_key != instance_key
+
+        result.instance.galaxies.lens.light.intensity = 0.1
+        result.update_instance_key()
+
+        assert result.instance_key == instance_key
+
+    def test__instance_key__differs_if_hyper_images_change(self, result):
+        instance_key = result.instance_key
+
+        result.analysis.hyper_model_image = np.ones(9)
+        result.analysis.hyper_galaxy_image_path_dict = {
+            ("galaxies", "lens"): np.ones(9)
+        }
+        result.update_instance_key()
+
+        hyper_instance_key = result.instance_key
+
+        assert hyper_instance_key != instance_key
+
+        result.analysis.hyper_galaxy_image_path_dict = {
+            ("galaxies", "lens"): 2.0 * np.ones(9)
+        }
+        result.update_instance_key()
+
+        assert result.instance_key != hyper_instance_key
+
+        result.analysis.hyper_galaxy_image_path_dict = {
+            ("galaxies", "lens"): np.ones(9)
+        }
+        result.update_instance_key()
+
+        assert result.instance_key == hyper_instance_key
+
+        result.instance.galaxies.lens.hyper_galaxy_image = np.ones(9)
+        result.update_instance_key()
+
+        assert result.instance_key != hyper_instance_key
+
     def test__results_are_passed_to_new_analysis__sets_up_hyper_images(
         self, results_collection_7x7, imaging_7x7, mask_7x7
     ):
@@ -329,6 +413,86 @@ class TestHyperAPI:
         assert hasattr(result, "hyper_combined")
         assert isinstance(result.hyper_combined, MockResult)
 
+    def test_combined_result__hyper_phases_run_in_separate_processes(
+        self, hyper_combined
+    ):
+        hyper_combined.number_of_cores = 2
+
+        result = hyper_combined.run(dataset=None, mask=None)
+
+        assert isinstance(result.hyper_galaxy, MockResult)
+        assert isinstance(result.inversion, MockResult)
+        assert isinstance(result.hyper_combined, MockResult)
+
+    def test_combined_result__serial_and_parallel_runs_return_same_result(self):
+
+        # noinspection PyUnusedLocal
+        def run_hyper_inversion(dataset, results, **kwargs):
+            return MockResult()
+
+        # noinspection PyUnusedLocal
+        def run_hyper_galaxy(dataset, results, **kwargs):
+            return copy.deepcopy(results.last)
+
+        # noinspection PyTypeChecker
+        hyper_combined = al.CombinedHyperPhase(
+            MockPhase(), hyper_phase_classes=(al.InversionPhase, al.HyperGalaxyPhase)
+        )
+
+        hyper_combined.hyper_phases[0].run_hyper = run_hyper_inversion
+        hyper_combined.hyper_phases[1].run_hyper = run_hyper_galaxy
+
+        hyper_combined.number_of_cores = 1
+
+        serial_result = hyper_combined.run(dataset=None, mask=None)
+
+        hyper_combined.number_of_cores = 2
+
+        parallel_result = hyper_combined.run(dataset=None, mask=None)
+
+        for result in (serial_result, parallel_result):
+            assert isinstance(result.inversion, MockResult)
+            assert isinstance(result.hyper_galaxy, MockResult)
+            assert result.hyper_galaxy.inversion is result.inversion
+            assert not hasattr(result.inversion, "hyper_galaxy")
+
+        assert sorted(vars(serial_result)) == sorted(vars(parallel_result))
+        assert sorted(vars(serial_result.hyper_galaxy)) == sorted(
+            vars(parallel_result.hyper_galaxy)
+        )
+        assert sorted(vars(serial_result.inversion)) == sorted(
+            vars(parallel_result.inversion)
+        )
+
+    def test_hyper_phase_levels(self, hyper_combined):
+        hyper_phase_levels = hyper_phase_scheduler.hyper_phase_levels_from_hyper_phases_and_dependencies(
+            hyper_phases=hyper_combined.hyper_phases
+        )
+
+        assert [
+            [phase.hyper_name for phase in hyper_phases]
+            for hyper_phases in hyper_phase_levels
+        ] == [["hyper_galaxy", "inversion"]]
+
+        hyper_phase_levels = hyper_phase_scheduler.hyper_phase_levels_from_hyper_phases_and_dependencies(
+            hyper_phases=hyper_combined.hyper_phases,
+            hyper_phase_dependencies={"hyper_galaxy": ("inversion",)},
+        )
+
+        assert [
+            [phase.hyper_name for phase in hyper_phases]
+            for hyper_phases in hyper_phase_levels
+        ] == [["inversion"], ["hyper_galaxy"]]
+
+        with pytest.raises(exc.PhaseException):
+            hyper_phase_scheduler.hyper_phase_levels_from_hyper_phases_and_dependencies(
+                hyper_phases=hyper_combined.hyper_phases,
+                hyper_phase_dependencies={
+                    "hyper_galaxy": ("inversion",),
+                    "inversion": ("hyper_galaxy",),
+                },
+            )
+
     def test_combine_models(self, hyper_combined):
         result = MockResult()
         hyper_galaxy_result = MockResult()
@@ -457,3 +621,40 @@ class TestHyperGalaxyPhase:
         likelihood = analysis.fit(instance=instance)
 
         assert likelihood == fit.likelihood
+
+    def test__hyper_galaxy_fits_in_parallel__results_same_order_as_serial_fits(self):
+
+        paths = autofit.optimize.non_linear.paths.Paths(
+            phase_name="phase_name",
+            phase_path="phase_path",
+            phase_folders=("",),
+            phase_tag="",
+        )
+
+        hyper_galaxy_fits = [
+            (
+                MockOptimizer(paths=paths),
+                af.ModelMapper(),
+                MockLikelihoodAnalysis(likelihood=float(index)),
+            )
+            for index in range(5)
+        ]
+
+        serial_results = hyper_galaxy_phase.results_from_hyper_galaxy_fits_and_number_of_cores(
+            hyper_galaxy_fits=hyper_galaxy_fits, number_of_cores=1
+        )
+
+        parallel_results = hyper_galaxy_phase.results_from_hyper_galaxy_fits_and_number_of_cores(
+            hyper_galaxy_fits=hyper_galaxy_fits, number_of_cores=2
+        )
+
+        assert [result.likelihood for result in serial_results] == [
+            0.0,
+            1.0,
+            2.0,
+            3.0,
+            4.0,
+        ]
+        assert [result.likelihood for result in parallel_results] == [
+            result.likelihood for result in serial_results
+        ]
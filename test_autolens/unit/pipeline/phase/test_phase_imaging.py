@@ -1,4 +1,6 @@
+import multiprocessing
 import os
+import pickle
 from os import path
 
 import numpy as np
@@ -7,7 +9,9 @@ from astropy import cosmology as cosmo
 
 import autofit as af
 import autolens as al
+from autolens import exc
 from autolens.fit.fit import ImagingFit
+from autolens.util import parallel_util
 from test_autolens.mock import mock_pipeline
 
 pytestmark = pytest.mark.filterwarnings(
@@ -275,6 +279,9 @@ class TestPhase:
         )
         assert type(phase_extended.hyper_phases[0]) == al.HyperGalaxyPhase
         assert type(phase_extended.hyper_phases[1]) == al.InversionPhase
+        assert phase_extended.hyper_phase_dependencies == {
+            "inversion": ("hyper_galaxy",)
+        }
 
     def test__fit_figure_of_merit__matches_correct_fit_given_galaxy_profiles(
         self, imaging_7x7, mask_7x7
@@ -339,3 +346,201 @@ class TestPhase:
         )
 
         assert fit.likelihood == fit_figure_of_merit
+
+    def test__fit_batch__figures_of_merit_match_fit_of_each_instance(
+        self, imaging_7x7, mask_7x7
+    ):
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.SphericalSersic)
+            ),
+            cosmology=cosmo.FLRW,
+            sub_size=1,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [value] * phase_imaging_7x7.model.prior_count
+            )
+            for value in [0.2, 0.5, 0.8]
+        ]
+
+        figures_of_merit = analysis.fit_batch(instances=instances)
+
+        assert figures_of_merit.shape == (3,)
+
+        for instance, figure_of_merit in zip(instances, figures_of_merit):
+            assert figure_of_merit == pytest.approx(
+                analysis.fit(instance=instance), 1.0e-8
+            )
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.SphericalSersic)
+            ),
+            hyper_background_noise=hyper_background_noise,
+            cosmology=cosmo.FLRW,
+            sub_size=1,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [value] * phase_imaging_7x7.model.prior_count
+            )
+            for value in [0.2, 0.5]
+        ]
+
+        figures_of_merit = analysis.fit_batch(instances=instances)
+
+        for instance, figure_of_merit in zip(instances, figures_of_merit):
+            assert figure_of_merit == pytest.approx(
+                analysis.fit(instance=instance), 1.0e-8
+            )
+
+    def test__fit_batch__fft_convolver_and_hyper_image_sky_match_fit_of_each_instance(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.SphericalSersic)
+            ),
+            hyper_image_sky=al.hyper_data.HyperImageSky,
+            cosmology=cosmo.FLRW,
+            sub_size=1,
+            convolution_backend="fft",
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [value] * phase_imaging_7x7.model.prior_count
+            )
+            for value in [0.2, 0.5, 0.8]
+        ]
+
+        figures_of_merit = analysis.fit_batch(instances=instances)
+
+        for instance, figure_of_merit in zip(instances, figures_of_merit):
+            assert figure_of_merit == pytest.approx(
+                analysis.fit(instance=instance), 1.0e-8
+            )
+
+    def test__fit_batch__instances_which_raise_fit_exception_are_minus_inf(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.SphericalSersic)
+            ),
+            cosmology=cosmo.FLRW,
+            sub_size=1,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        def tracer_and_hyper_data_for_instance(instance):
+            if instance is None:
+                raise exc.RayTracingException
+            return tracer_and_hyper_data_for(instance=instance)
+
+        tracer_and_hyper_data_for = analysis.tracer_and_hyper_data_for_instance
+        analysis.tracer_and_hyper_data_for_instance = tracer_and_hyper_data_for_instance
+
+        figures_of_merit = analysis.fit_batch(instances=[instance, None])
+
+        assert figures_of_merit[0] == pytest.approx(
+            analysis.fit(instance=instance), 1.0e-8
+        )
+        assert figures_of_merit[1] == -np.inf
+
+    def test__fit_batch__parallel_figures_of_merit_match_serial(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.SphericalSersic)
+            ),
+            cosmology=cosmo.FLRW,
+            sub_size=1,
+            number_of_cores=2,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert analysis.number_of_cores == 2
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [value] * phase_imaging_7x7.model.prior_count
+            )
+            for value in [0.2, 0.4, 0.6]
+        ]
+
+        with analysis.worker_pool() as pool:
+
+            assert analysis.pool is pool
+
+            figures_of_merit = analysis.fit_batch(instances=instances)
+
+            assert analysis.fit_batch(instances=instances) == pytest.approx(
+                figures_of_merit, 1.0e-8
+            )
+
+        assert analysis.pool is None
+        assert multiprocessing.active_children() == []
+        assert figures_of_merit == pytest.approx(
+            analysis.figures_of_merit_from_instances(instances=instances), 1.0e-8
+        )
+
+    def test__worker_pool__analysis_is_pickled_with_memory_mapped_arrays(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.SphericalSersic)
+            ),
+            cosmology=cosmo.FLRW,
+            sub_size=1,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        with parallel_util.memory_mapped_pickle_from_obj(
+            obj=analysis, minimum_bytes=0
+        ) as analysis_pickle:
+
+            worker_analysis = pickle.loads(analysis_pickle)
+
+            image = worker_analysis.masked_imaging.image
+
+            assert type(image) is type(analysis.masked_imaging.image)
+            assert isinstance(image.base, np.memmap)
+            assert not image.flags.writeable
+            assert (image == analysis.masked_imaging.image).all()
+            assert isinstance(worker_analysis.masked_imaging.grid.base, np.memmap)
+            assert worker_analysis.masked_imaging.grid.mask.sub_size == 1
+
+            instance = phase_imaging_7x7.model.instance_from_unit_vector(
+                [0.5] * phase_imaging_7x7.model.prior_count
+            )
+
+            assert worker_analysis.fit(instance=instance) == pytest.approx(
+                analysis.fit(instance=instance), 1.0e-8
+            )
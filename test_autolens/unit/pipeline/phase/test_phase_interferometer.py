@@ -44,6 +44,51 @@ class TestPhase:
             analysis.masked_interferometer.noise_map == interferometer_7.noise_map
         ).all()
 
+    def test__make_analysis__uv_cell_size_compresses_visibilities(
+        self, interferometer_7, mask_7x7, visibilities_mask_7x2
+    ):
+        phase_interferometer_7 = al.PhaseInterferometer(
+            real_space_mask=mask_7x7,
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.EllipticalSersic)
+            ),
+            uv_cell_size=1.0,
+            cosmology=cosmo.FLRW,
+            sub_size=2,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7, mask=visibilities_mask_7x2
+        )
+
+        masked_interferometer = al.masked.interferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7x2,
+            real_space_mask=phase_interferometer_7.meta_interferometer_fit.mask_with_phase_sub_size_from_mask(
+                mask=mask_7x7
+            ),
+        ).compressed_from_uv_cell_size(uv_cell_size=1.0)
+
+        visibility_compression = analysis.masked_interferometer.visibility_compression
+
+        assert visibility_compression.uv_cell_size == 1.0
+        assert (
+            visibility_compression.uncompressed_interferometer.visibilities
+            == interferometer_7.visibilities
+        ).all()
+        assert (
+            analysis.masked_interferometer.visibilities
+            == masked_interferometer.visibilities
+        ).all()
+        assert (
+            analysis.masked_interferometer.noise_map == masked_interferometer.noise_map
+        ).all()
+        assert (
+            analysis.masked_interferometer.visibilities_mask
+            == masked_interferometer.visibilities_mask
+        ).all()
+
     def test__make_analysis__phase_info_is_made(
         self, phase_interferometer_7, interferometer_7, visibilities_mask_7x2
     ):
@@ -26,6 +26,22 @@ class TestPhaseTag:
 
         assert phase_tag == "phase_tag__sub_1__bin_3__psf_2x2__interp_0.200"
 
+        phase_tag = al.phase_tagging.phase_tag_from_phase_settings(
+            sub_size=1,
+            pixel_scale_interpolation_grid=0.2,
+            interpolation_refinement_levels=2,
+        )
+
+        assert phase_tag == "phase_tag__sub_1__interp_0.200__ref_2"
+
+        phase_tag = al.phase_tagging.phase_tag_from_phase_settings(
+            sub_size=1,
+            pixel_scale_interpolation_grid=None,
+            interpolation_refinement_levels=2,
+        )
+
+        assert phase_tag == "phase_tag__sub_1"
+
         phase_tag = al.phase_tagging.phase_tag_from_phase_settings(
             sub_size=1,
             real_space_shape_2d=(3, 3),
@@ -91,6 +107,15 @@ class TestPhaseTaggers:
         tag = al.phase_tagging.bin_up_factor_tag_from_bin_up_factor(bin_up_factor=3)
         assert tag == "__bin_3"
 
+    def test__uv_cell_size_tagger(self):
+
+        tag = al.phase_tagging.uv_cell_size_tag_from_uv_cell_size(uv_cell_size=None)
+        assert tag == ""
+        tag = al.phase_tagging.uv_cell_size_tag_from_uv_cell_size(uv_cell_size=1000.0)
+        assert tag == "__uv_1000"
+        tag = al.phase_tagging.uv_cell_size_tag_from_uv_cell_size(uv_cell_size=2500.0)
+        assert tag == "__uv_2500"
+
     def test__psf_shape_2d_tagger(self):
 
         tag = al.phase_tagging.psf_shape_tag_from_psf_shape_2d(psf_shape_2d=None)
@@ -119,6 +144,21 @@ class TestPhaseTaggers:
         )
         assert tag == "__interp_0.234"
 
+    def test__interpolation_refinement_levels_tagger(self):
+
+        tag = al.phase_tagging.interpolation_refinement_levels_tag_from_interpolation_refinement_levels(
+            interpolation_refinement_levels=None
+        )
+        assert tag == ""
+        tag = al.phase_tagging.interpolation_refinement_levels_tag_from_interpolation_refinement_levels(
+            interpolation_refinement_levels=0
+        )
+        assert tag == "__ref_0"
+        tag = al.phase_tagging.interpolation_refinement_levels_tag_from_interpolation_refinement_levels(
+            interpolation_refinement_levels=3
+        )
+        assert tag == "__ref_3"
+
     def test__primary_beam_shape_2d_tagger(self):
         tag = al.phase_tagging.primary_beam_shape_tag_from_primary_beam_shape_2d(
             primary_beam_shape_2d=None